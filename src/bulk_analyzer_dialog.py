@@ -10,7 +10,9 @@ import threading
 import asyncio
 import json
 import os
+import platform
 import re
+import subprocess
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -1392,9 +1394,6 @@ Files by Type:
         """Open the output folder in file manager."""
         output_dir = Path(self.output_dir_var.get())
         if output_dir.exists():
-            import subprocess
-            import platform
-            
             try:
                 if platform.system() == "Windows":
                     os.startfile(str(output_dir))
@@ -57,6 +57,7 @@ class AppSettings:
     openrouter_enhance_bios: bool = True
     openrouter_max_tokens: int = 1000
     openrouter_temperature: float = 0.7
+    openrouter_response_cache: bool = False
     github_username: str = ""
     github_token: str = ""  # This should be encrypted in production
     
@@ -10,6 +10,8 @@ from tkinter import ttk, messagebox, filedialog, scrolledtext
 import threading
 import json
 import os
+import platform
+import subprocess
 import webbrowser
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -1116,9 +1118,6 @@ Target Role: {self.current_cv_data.target_role or 'Not specified'}"""
         output_dir = Path.home() / "cv_exports"
         output_dir.mkdir(exist_ok=True)
         
-        import subprocess
-        import platform
-        
         try:
             if platform.system() == "Windows":
                 os.startfile(str(output_dir))
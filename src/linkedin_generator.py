@@ -6,13 +6,20 @@ Analyzes GitHub profile data and generates optimized LinkedIn profile content
 including headlines, summaries, experience descriptions, and skill recommendations.
 """
 
+import copy
 import json
 import os
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, fields
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Any, TextIO, Tuple
 from collections import defaultdict, Counter
+from itertools import islice, takewhile
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     from .profile_builder import GitHubProfile
@@ -22,6 +29,59 @@ except ImportError:
     from utils.logger import get_logger
 
 
+# Section headers used by the plain-text export
+_H_TITLE = "LINKEDIN PROFILE OPTIMIZATION GUIDE"
+_H_RULE = "=" * 50
+_H_HEADLINE = "HEADLINE:"
+_H_SUMMARY = "SUMMARY:"
+_H_SUMMARY_SHORT = "SHORT SUMMARY (2 sentences):"
+_H_SKILLS = "TOP SKILLS TO ADD:"
+_H_EXPERIENCE = "EXPERIENCE DESCRIPTIONS:"
+_H_ACCOMPLISHMENTS = "Key Accomplishments:"
+_H_PROJECTS = "PROJECT DESCRIPTIONS:"
+_H_POSTS = "LINKEDIN POST IDEAS:"
+_H_ARTICLES = "LINKEDIN ARTICLE TOPICS:"
+_H_TIPS = "PROFILE IMPROVEMENT TIPS:"
+_H_KEYWORDS = "KEYWORD OPTIMIZATION:"
+_H_TARGETS = "CONNECTION TARGETS:"
+_BLANK = ""
+
+# Config fields read (directly or through helpers) by each generated section.
+# Sections are cached per profile and only re-rendered when these change.
+_SUMMARY_FIELDS = ('use_first_person', 'target_industry', 'include_call_to_action',
+                   'mention_open_to_opportunities', 'include_personal_touches')
+_SECTION_CONFIG_FIELDS = {
+    'headline': ('target_role', 'target_industry', 'mention_open_to_opportunities'),
+    'current_position': ('target_role',),
+    'summary': ('length',) + _SUMMARY_FIELDS,
+    'summary_short': (),
+    'summary_long': _SUMMARY_FIELDS,
+    'experience_descriptions': (),
+    'project_descriptions': (),
+    'top_skills': ('target_role', 'target_industry'),
+    'skill_categories': (),
+    'post_ideas': (),
+    'article_topics': ('target_industry',),
+    'connection_targets': ('target_role', 'target_industry', 'company_preferences', 'location_preferences'),
+    'industry_keywords': ('target_role', 'target_industry', 'personal_brand_keywords'),
+    'improvement_tips': (),
+    'keyword_optimization': (),
+}
+
+
+# Weak phrasing -> stronger action verb, used by _rewrite_with_action_verbs
+_ACTION_VERBS = {
+    'worked on': 'developed',
+    'helped': 'collaborated to',
+    'made': 'built',
+    'did': 'executed',
+    'was responsible for': 'led',
+    'handled': 'managed',
+    'used': 'leveraged',
+    'wrote': 'authored'
+}
+
+
 @dataclass
 class LinkedInConfig:
     """Configuration for LinkedIn profile generation."""
@@ -52,6 +112,14 @@ class LinkedInConfig:
     personal_brand_keywords: List[str] = field(default_factory=list)
     company_preferences: List[str] = field(default_factory=list)
     location_preferences: List[str] = field(default_factory=list)
+    
+    def _as_key(self, names: Tuple[str, ...] = None) -> Tuple:
+        """Return a hashable snapshot of the given (or all) config fields."""
+        names = names if names is not None else tuple(f.name for f in fields(self))
+        return tuple(
+            tuple(value) if isinstance(value, list) else value
+            for value in (getattr(self, name) for name in names)
+        )
 
 
 @dataclass
@@ -126,10 +194,45 @@ class LinkedInGenerator:
             'product manager': ['product strategy', 'roadmap planning', 'stakeholder management', 'user research', 'agile development'],
             'tech lead': ['technical leadership', 'team management', 'code review', 'mentoring', 'technical decision making']
         }
+        
+        # Rendered sections for the most recent profile, see _render_section
+        self._cached_profile: Optional[GitHubProfile] = None
+        self._section_cache: Dict[Tuple, Any] = {}
+        
+        # (profile, languages sorted by share), shared by the skills sections
+        self._language_ranking: Optional[Tuple[GitHubProfile, List[Tuple[str, float]]]] = None
+        
+        # (profile, inputs key, result) of the last complete generation
+        self._last_result: Optional[Tuple[GitHubProfile, Tuple, LinkedInProfile]] = None
     
     def generate_linkedin_profile(self, github_profile: GitHubProfile, 
-                                 additional_info: Dict[str, Any] = None) -> LinkedInProfile:
-        """Generate complete LinkedIn profile from GitHub data."""
+                                 additional_info: Dict[str, Any] = None,
+                                 on_progress: Optional[Callable[[int, int], None]] = None) -> LinkedInProfile:
+        """Generate complete LinkedIn profile from GitHub data.
+        
+        ``on_progress(done, total)`` is called after each section is rendered.
+        Repeating a call with the same profile object, config and additional
+        info returns a copy of the previous result without re-rendering.
+        """
+        inputs = (self.config._as_key(), repr(additional_info))
+        last = self._last_result
+        if last is not None and last[0] is github_profile and last[1] == inputs:
+            self.logger.info(f"Reusing LinkedIn profile for {github_profile.username}")
+            linkedin_profile = copy.deepcopy(last[2])
+            linkedin_profile.generated_date = datetime.now().isoformat()
+            linkedin_profile.config_used = self.config
+            if on_progress:
+                total = len(_SECTION_CONFIG_FIELDS)
+                on_progress(total, total)
+            return linkedin_profile
+        
+        linkedin_profile = self._build_linkedin_profile(github_profile, additional_info, on_progress)
+        self._last_result = (github_profile, inputs, copy.deepcopy(linkedin_profile))
+        return linkedin_profile
+    
+    def _build_linkedin_profile(self, github_profile: GitHubProfile, additional_info: Optional[Dict[str, Any]],
+                                on_progress: Optional[Callable[[int, int], None]]) -> LinkedInProfile:
+        """Render every section of a LinkedIn profile."""
         self.logger.info(f"Generating LinkedIn profile for {github_profile.username}")
         
         linkedin_profile = LinkedInProfile()
@@ -138,37 +241,90 @@ class LinkedInGenerator:
         
         additional_info = additional_info or {}
         
+        total = len(_SECTION_CONFIG_FIELDS)
+        done = 0
+        
+        def render(section, builder, profile, info=None):
+            nonlocal done
+            value = self._render_section(section, builder, profile, info)
+            done += 1
+            if on_progress:
+                on_progress(done, total)
+            return value
+        
         # Generate each section
-        linkedin_profile.headline = self._generate_headline(github_profile, additional_info)
-        linkedin_profile.current_position = self._generate_current_position(github_profile)
+        linkedin_profile.headline = render('headline', self._generate_headline, github_profile, additional_info)
+        linkedin_profile.current_position = render('current_position', self._generate_current_position, github_profile)
         linkedin_profile.location = github_profile.location or additional_info.get('location', '')
         
         # Generate summaries of different lengths
-        linkedin_profile.summary = self._generate_summary(github_profile, additional_info)
-        linkedin_profile.summary_short = self._generate_summary_short(github_profile)
-        linkedin_profile.summary_long = self._generate_summary_long(github_profile, additional_info)
+        linkedin_profile.summary = render('summary', self._generate_summary, github_profile, additional_info)
+        linkedin_profile.summary_short = render('summary_short', self._generate_summary_short, github_profile)
+        linkedin_profile.summary_long = render('summary_long', self._generate_summary_long, github_profile, additional_info)
         
         # Generate experience and project descriptions
-        linkedin_profile.experience_descriptions = self._generate_experience_descriptions(github_profile, additional_info)
-        linkedin_profile.project_descriptions = self._generate_project_descriptions(github_profile)
+        linkedin_profile.experience_descriptions = render('experience_descriptions', self._generate_experience_descriptions,
+                                                          github_profile, additional_info)
+        linkedin_profile.project_descriptions = render('project_descriptions', self._generate_project_descriptions, github_profile)
         
         # Skills and categories
-        linkedin_profile.top_skills = self._generate_top_skills(github_profile)
-        linkedin_profile.skill_categories = self._generate_skill_categories(github_profile)
+        linkedin_profile.top_skills = render('top_skills', self._generate_top_skills, github_profile)
+        linkedin_profile.skill_categories = render('skill_categories', self._generate_skill_categories, github_profile)
         
         # Content suggestions
-        linkedin_profile.post_ideas = self._generate_post_ideas(github_profile)
-        linkedin_profile.article_topics = self._generate_article_topics(github_profile)
+        linkedin_profile.post_ideas = render('post_ideas', self._generate_post_ideas, github_profile)
+        linkedin_profile.article_topics = render('article_topics', self._generate_article_topics, github_profile)
         
         # Networking and optimization
-        linkedin_profile.connection_targets = self._generate_connection_targets(github_profile)
-        linkedin_profile.industry_keywords = self._generate_industry_keywords(github_profile)
-        linkedin_profile.profile_improvement_tips = self._generate_improvement_tips(github_profile)
-        linkedin_profile.keyword_optimization = self._generate_keyword_optimization(github_profile)
+        linkedin_profile.connection_targets = render('connection_targets', self._generate_connection_targets, github_profile)
+        linkedin_profile.industry_keywords = render('industry_keywords', self._generate_industry_keywords, github_profile)
+        linkedin_profile.profile_improvement_tips = render('improvement_tips', self._generate_improvement_tips, github_profile)
+        linkedin_profile.keyword_optimization = render('keyword_optimization', self._generate_keyword_optimization, github_profile)
         
         self.logger.info("LinkedIn profile generated successfully")
         return linkedin_profile
     
+    def _render_section(self, section: str, builder, profile: GitHubProfile,
+                        additional_info: Optional[Dict[str, Any]] = None) -> Any:
+        """Render a section, reusing the previous result if none of its inputs changed."""
+        if profile is not self._cached_profile:
+            self._cached_profile = profile
+            self._section_cache.clear()
+        
+        key = (section, self.config._as_key(_SECTION_CONFIG_FIELDS[section]),
+               repr(additional_info) if additional_info is not None else None)
+        
+        if key not in self._section_cache:
+            if additional_info is not None:
+                self._section_cache[key] = builder(profile, additional_info)
+            else:
+                self._section_cache[key] = builder(profile)
+        
+        value = self._section_cache[key]
+        # Hand out copies so callers editing the profile cannot corrupt the cache
+        return value if isinstance(value, str) else copy.deepcopy(value)
+    
+    def clear_cache(self):
+        """Drop all cached sections."""
+        self._cached_profile = None
+        self._section_cache.clear()
+        self._language_ranking = None
+        self._last_result = None
+    
+    def _languages_above(self, profile: GitHubProfile, min_pct: float, limit: int) -> List[str]:
+        """Return up to ``limit`` languages above ``min_pct``, largest share first.
+        
+        The languages are sorted once per profile; each caller then only walks
+        the prefix it needs.
+        """
+        ranking = self._language_ranking
+        if ranking is None or ranking[0] is not profile:
+            ranked = sorted(profile.languages_percentage.items(), key=lambda item: item[1], reverse=True)
+            ranking = self._language_ranking = (profile, ranked)
+        
+        above = takewhile(lambda item: item[1] > min_pct, ranking[1])
+        return [lang for lang, _ in islice(above, limit)]
+    
     def _generate_headline(self, profile: GitHubProfile, additional_info: Dict[str, Any]) -> str:
         """Generate LinkedIn headline (220 character limit)."""
         target_role = self.config.target_role or profile.developer_type
@@ -720,20 +876,11 @@ class LinkedInGenerator:
         if not description:
             return ""
         
-        # Simple enhancement - this could be made more sophisticated
-        action_verb_map = {
-            'worked on': 'developed',
-            'helped': 'collaborated to',
-            'made': 'built',
-            'did': 'executed',
-            'was responsible for': 'led',
-            'handled': 'managed',
-            'used': 'leveraged',
-            'wrote': 'authored'
-        }
-        
+        # Simple enhancement - this could be made more sophisticated.
+        # Applied one phrase at a time, in order: on overlapping input such
+        # as "usedid" the result differs from a single-pass regex
         enhanced = description
-        for weak_verb, strong_verb in action_verb_map.items():
+        for weak_verb, strong_verb in _ACTION_VERBS.items():
             enhanced = enhanced.replace(weak_verb, strong_verb)
         
         return enhanced
@@ -855,7 +1002,7 @@ class LinkedInGenerator:
         skills = []
         
         # Programming languages (top performers)
-        top_languages = [lang for lang, pct in profile.languages_percentage.items() if pct > 5][:8]
+        top_languages = self._languages_above(profile, 5, 8)
         skills.extend(top_languages)
         
         # Core development skills
@@ -911,9 +1058,9 @@ class LinkedInGenerator:
         categories = {}
         
         # Programming Languages
-        languages = [lang for lang, pct in profile.languages_percentage.items() if pct > 2]
+        languages = self._languages_above(profile, 2, 12)
         if languages:
-            categories['Programming Languages'] = languages[:12]
+            categories['Programming Languages'] = languages
         
         # Frameworks & Technologies
         frameworks = []
@@ -1206,8 +1353,12 @@ class LinkedInExporter:
         try:
             profile_dict = asdict(self.linkedin_profile)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(profile_dict, f, indent=2, ensure_ascii=False, default=str)
+            if orjson is not None:
+                Path(file_path).write_bytes(orjson.dumps(
+                    profile_dict, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(profile_dict, f, indent=2, ensure_ascii=False, default=str)
             
             self.logger.info(f"LinkedIn profile exported to JSON: {file_path}")
             
@@ -1218,10 +1369,9 @@ class LinkedInExporter:
     def export_to_text(self, file_path: str):
         """Export LinkedIn profile to readable text format."""
         try:
-            content = self._generate_text_export()
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Text mode with newline=None writes the platform's line endings, as before
+            with open(file_path, 'w', encoding='utf-8', newline=None, buffering=1 << 20) as f:
+                self.export_to_text_stream(f)
             
             self.logger.info(f"LinkedIn profile exported to text: {file_path}")
             
@@ -1229,98 +1379,103 @@ class LinkedInExporter:
             self.logger.error(f"Failed to export LinkedIn profile to text: {e}")
             raise
     
+    def export_to_text_stream(self, fp: TextIO):
+        """Write the text export to a text file object one line at a time."""
+        lines = self._iter_text_export()
+        fp.write(next(lines))
+        for line in lines:
+            fp.write('\n' + line)
+    
     def _generate_text_export(self) -> str:
         """Generate human-readable text export."""
-        sections = []
-        
+        return "\n".join(self._iter_text_export())
+    
+    def _iter_text_export(self) -> Iterator[str]:
+        """Yield the lines of the human-readable text export."""
         # Header
-        sections.append("LINKEDIN PROFILE OPTIMIZATION GUIDE")
-        sections.append("=" * 50)
-        sections.append(f"Generated: {self.linkedin_profile.generated_date}")
-        sections.append("")
+        yield _H_TITLE
+        yield _H_RULE
+        yield f"Generated: {self.linkedin_profile.generated_date}"
+        yield _BLANK
         
         # Headline
         if self.linkedin_profile.headline:
-            sections.append("HEADLINE:")
-            sections.append(self.linkedin_profile.headline)
-            sections.append("")
+            yield _H_HEADLINE
+            yield self.linkedin_profile.headline
+            yield _BLANK
         
         # Summary
         if self.linkedin_profile.summary:
-            sections.append("SUMMARY:")
-            sections.append(self.linkedin_profile.summary)
-            sections.append("")
+            yield _H_SUMMARY
+            yield self.linkedin_profile.summary
+            yield _BLANK
         
         # Alternative summaries
         if self.linkedin_profile.summary_short:
-            sections.append("SHORT SUMMARY (2 sentences):")
-            sections.append(self.linkedin_profile.summary_short)
-            sections.append("")
+            yield _H_SUMMARY_SHORT
+            yield self.linkedin_profile.summary_short
+            yield _BLANK
         
         # Top Skills
         if self.linkedin_profile.top_skills:
-            sections.append("TOP SKILLS TO ADD:")
+            yield _H_SKILLS
             for i, skill in enumerate(self.linkedin_profile.top_skills[:15], 1):
-                sections.append(f"{i:2d}. {skill}")
-            sections.append("")
+                yield f"{i:2d}. {skill}"
+            yield _BLANK
         
         # Experience Descriptions
         if self.linkedin_profile.experience_descriptions:
-            sections.append("EXPERIENCE DESCRIPTIONS:")
+            yield _H_EXPERIENCE
             for i, exp in enumerate(self.linkedin_profile.experience_descriptions, 1):
-                sections.append(f"\n{i}. {exp.get('title', 'Position')} at {exp.get('company', 'Company')}")
+                yield f"\n{i}. {exp.get('title', 'Position')} at {exp.get('company', 'Company')}"
                 if exp.get('linkedin_description'):
-                    sections.append(exp['linkedin_description'])
-                if exp.get('accomplishments'):
-                    sections.append("Key Accomplishments:")
-                    for acc in exp['accomplishments']:
-                        sections.append(f"  • {acc}")
-            sections.append("")
+                    yield exp['linkedin_description']
+                accomplishments = exp.get('accomplishments')
+                if accomplishments:
+                    yield _H_ACCOMPLISHMENTS
+                    yield from (f"  • {acc}" for acc in accomplishments)
+            yield _BLANK
         
         # Project Descriptions
         if self.linkedin_profile.project_descriptions:
-            sections.append("PROJECT DESCRIPTIONS:")
+            yield _H_PROJECTS
             for i, project in enumerate(self.linkedin_profile.project_descriptions[:5], 1):
-                sections.append(f"\n{i}. {project['name']}")
-                sections.append(project['description'])
-                if project.get('achievements'):
-                    for achievement in project['achievements']:
-                        sections.append(f"  • {achievement}")
-            sections.append("")
+                yield f"\n{i}. {project['name']}"
+                yield project['description']
+                yield from (f"  • {achievement}" for achievement in project.get('achievements') or ())
+            yield _BLANK
         
         # Content Ideas
         if self.linkedin_profile.post_ideas:
-            sections.append("LINKEDIN POST IDEAS:")
+            yield _H_POSTS
             for i, idea in enumerate(self.linkedin_profile.post_ideas[:10], 1):
-                sections.append(f"{i:2d}. {idea}")
-            sections.append("")
+                yield f"{i:2d}. {idea}"
+            yield _BLANK
         
         # Article Topics
         if self.linkedin_profile.article_topics:
-            sections.append("LINKEDIN ARTICLE TOPICS:")
+            yield _H_ARTICLES
             for i, topic in enumerate(self.linkedin_profile.article_topics[:8], 1):
-                sections.append(f"{i:2d}. {topic}")
-            sections.append("")
+                yield f"{i:2d}. {topic}"
+            yield _BLANK
         
         # Optimization Tips
         if self.linkedin_profile.profile_improvement_tips:
-            sections.append("PROFILE IMPROVEMENT TIPS:")
+            yield _H_TIPS
             for i, tip in enumerate(self.linkedin_profile.profile_improvement_tips, 1):
-                sections.append(f"{i:2d}. {tip}")
-            sections.append("")
+                yield f"{i:2d}. {tip}"
+            yield _BLANK
         
         # Keyword Optimization
         if self.linkedin_profile.keyword_optimization:
-            sections.append("KEYWORD OPTIMIZATION:")
+            yield _H_KEYWORDS
             for i, opt in enumerate(self.linkedin_profile.keyword_optimization, 1):
-                sections.append(f"{i:2d}. {opt}")
-            sections.append("")
+                yield f"{i:2d}. {opt}"
+            yield _BLANK
         
         # Connection Targets
         if self.linkedin_profile.connection_targets:
-            sections.append("CONNECTION TARGETS:")
+            yield _H_TARGETS
             for i, target in enumerate(self.linkedin_profile.connection_targets, 1):
-                sections.append(f"{i:2d}. {target}")
-            sections.append("")
-        
-        return "\n".join(sections)
\ No newline at end of file
+                yield f"{i:2d}. {target}"
+            yield _BLANK
\ No newline at end of file
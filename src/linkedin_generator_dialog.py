@@ -8,22 +8,379 @@ GUI interface for generating optimized LinkedIn profile content from GitHub prof
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import threading
+import asyncio
+import functools
 import json
 import os
+import re
+import subprocess
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from dataclasses import asdict, fields, replace
 from pathlib import Path
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import Optional, Dict, Any, Tuple
 
 try:
-    from .linkedin_generator import LinkedInGenerator, LinkedInConfig, LinkedInExporter
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from .linkedin_generator import LinkedInGenerator, LinkedInConfig, LinkedInExporter, LinkedInProfile
     from .profile_builder import GitHubProfile, GitHubProfileBuilder, ProfileBuilderConfig
     from .config.github_auth import GitHubAuthManager
     from .utils.logger import get_logger
+    from .utils.content_cache import ContentCache
 except ImportError:
-    from linkedin_generator import LinkedInGenerator, LinkedInConfig, LinkedInExporter
+    from linkedin_generator import LinkedInGenerator, LinkedInConfig, LinkedInExporter, LinkedInProfile
     from profile_builder import GitHubProfile, GitHubProfileBuilder, ProfileBuilderConfig
     from config.github_auth import GitHubAuthManager
     from utils.logger import get_logger
+    from utils.content_cache import ContentCache
+
+
+def _loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode an object as indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# Quick-start presets for the Targeting tab, see apply_template
+_TEMPLATES = {
+    "senior_dev": {
+        "role": sys.intern("Senior Software Developer"),
+        "industry": sys.intern("Technology"),
+        "strategy": "Seeking senior technical leadership roles where I can mentor teams, architect scalable solutions, and drive technical innovation. Passionate about building high-performance applications and leading engineering best practices."
+    },
+    "startup": {
+        "role": sys.intern("Software Engineer"),
+        "industry": sys.intern("Startup"),
+        "strategy": "Looking to join fast-growing startups where I can wear multiple hats, move quickly, and make significant impact. Excited about building products from 0 to 1 and working in dynamic, collaborative environments."
+    },
+    "enterprise": {
+        "role": sys.intern("Software Developer"),
+        "industry": sys.intern("Enterprise Software"),
+        "strategy": "Focused on building robust, enterprise-grade software solutions that scale to millions of users. Interested in large-scale system architecture, security, and working with cross-functional teams."
+    },
+    "academic": {
+        "role": sys.intern("Research Software Engineer"),
+        "industry": sys.intern("Research"),
+        "strategy": "Passionate about applying software engineering to solve complex research problems. Interested in publishing, open-source contributions, and bridging the gap between academic research and practical applications."
+    }
+}
+
+
+# Usage notes shown at the bottom of the Export tab
+_GUIDE_TEXT = """🎯 Implementation Guide:
+
+1. Headline: Copy your chosen headline to your LinkedIn profile. Test different versions to see which performs best.
+
+2. Summary: Use the medium-length summary as your About section. The short version works well for InMail templates.
+
+3. Skills: Add the recommended skills to your LinkedIn Skills section. Ask colleagues for endorsements.
+
+4. Projects: Add projects to your Experience or Featured sections with the optimized descriptions.
+
+5. Content Strategy: Use the post ideas and article topics for regular LinkedIn content creation.
+
+6. Networking: Follow the connection targeting strategy to build a relevant professional network.
+
+7. Optimization: Implement the profile improvement tips to increase visibility and engagement."""
+
+
+# Folder opener for this platform, picked once at import. Popen returns
+# immediately so the file manager never blocks the Tk thread.
+if sys.platform == 'win32':
+    _open_folder = os.startfile
+elif sys.platform == 'darwin':
+    def _open_folder(path: str):
+        subprocess.Popen(['open', path])
+else:
+    def _open_folder(path: str):
+        subprocess.Popen(['xdg-open', path], start_new_session=True)
+
+
+# Shared prefix of the result panes' copy buttons and the list bullet used
+# by _format_results
+_COPY = sys.intern("📋 Copy ")
+_BULLET = sys.intern("  • ")
+
+
+# Per-user locations, resolved once per process
+_HOME = Path.home()
+_SETTINGS_DIR = _HOME / '.reporeadme'
+_SETTINGS_FILE = _SETTINGS_DIR / 'linkedin_generator_settings.json'
+_OUTPUT_DIR = _HOME / 'linkedin_content'
+
+
+# Characters handed to clipboard_append per call in copy_text
+_CLIPBOARD_CHUNK = 64 * 1024
+
+
+@functools.lru_cache(maxsize=1)
+def _auth() -> GitHubAuthManager:
+    """Auth manager shared by every dialog opened in this process."""
+    return GitHubAuthManager()
+
+
+# Separator for comma-separated entries, swallowing the whitespace around it
+_CSV_SPLIT = re.compile(r'\s*,\s*')
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_csv(raw: str) -> Tuple[str, ...]:
+    """Split a comma-separated entry into trimmed, non-empty items."""
+    return tuple(item for item in _CSV_SPLIT.split(raw.strip()) if item)
+
+
+def _static_text(parent, text: str, height: Optional[int] = None, font=None) -> tk.Text:
+    """Borderless read-only Text for long wrapped copy.
+    
+    Text caches line layout and re-wraps only what changed on resize, where
+    a wraplength Label re-measures the whole string every time. Without a
+    fixed ``height`` the widget follows the number of wrapped lines shown.
+    """
+    widget = tk.Text(parent, height=height or text.count('\n') + 1, wrap='word',
+                     relief='flat', borderwidth=0, highlightthickness=0,
+                     font=font, cursor='arrow', takefocus=0)
+    background = ttk.Style(parent).lookup('TLabelframe', 'background')
+    if background:
+        widget.configure(background=background)
+    widget.insert('1.0', text)
+    widget.configure(state='disabled')
+    
+    if height is None:
+        def fit_to_display_lines(event=None):
+            # Wrapped lines depend on the width, known once the widget is laid out
+            lines = widget.count('1.0', 'end', 'displaylines')
+            if isinstance(lines, tuple):
+                lines = lines[0]
+            if lines and lines != int(widget.cget('height')):
+                widget.configure(height=lines)
+        
+        widget.bind('<Configure>', fit_to_display_lines, add='+')
+    return widget
+
+
+def _make_readonly_text(parent, height: int, font=('Arial', 10)) -> scrolledtext.ScrolledText:
+    """ScrolledText for output-only panes: no undo bookkeeping, disabled until written."""
+    return scrolledtext.ScrolledText(parent, height=height, wrap=tk.WORD, font=font,
+                                     undo=False, autoseparators=False, maxundo=0, state='disabled')
+
+
+def _set_text(widget: tk.Text, content: str):
+    """Replace the whole contents of a read-only Text widget in one edit."""
+    if isinstance(widget, _ReadOnlyText):
+        widget.set_content(content)
+        return
+    widget.configure(state='normal')
+    widget.replace('1.0', tk.END, content)
+    widget.edit_reset()
+    widget.configure(state='disabled')
+
+
+class _ReadOnlyText(tk.Text):
+    """Read-only result pane that materializes long content as it scrolls.
+    
+    Content is held as logical lines and only the first ``CHUNK_LINES`` are
+    inserted up front; further batches are appended, at most once per idle
+    cycle, when the view nears the bottom. Undo and X selection export are
+    disabled since the pane is never edited. Like ScrolledText, the widget
+    sits in a frame with its scrollbar and geometry calls are forwarded to
+    that frame.
+    """
+    
+    CHUNK_LINES = 200
+    
+    def __init__(self, master=None, **kwargs):
+        self._lines = []
+        self._next_line = 0
+        self._load_job = None
+        self.frame = ttk.Frame(master)
+        self.vbar = ttk.Scrollbar(self.frame, orient='vertical')
+        self.vbar.pack(side='right', fill='y')
+        
+        kwargs.update(undo=False, autoseparators=False, maxundo=0, exportselection=0,
+                      state='disabled', yscrollcommand=self._on_yscroll)
+        super().__init__(self.frame, **kwargs)
+        self.pack(side='left', fill='both', expand=True)
+        self.vbar.configure(command=self.yview)
+        
+        # Forward pack/grid/place to the frame, as scrolledtext does
+        text_meths = vars(tk.Text).keys()
+        methods = vars(tk.Pack).keys() | vars(tk.Grid).keys() | vars(tk.Place).keys()
+        for m in methods.difference(text_meths):
+            if m[0] != '_' and m not in ('config', 'configure'):
+                setattr(self, m, getattr(self.frame, m))
+    
+    def set_content(self, content: str):
+        """Show new content, rendering only the first batch of lines immediately."""
+        if self._load_job is not None:
+            self.after_cancel(self._load_job)
+            self._load_job = None
+        self._lines = content.splitlines(keepends=True)
+        self._next_line = min(self.CHUNK_LINES, len(self._lines))
+        self.configure(state='normal')
+        self.replace('1.0', tk.END, ''.join(self._lines[:self._next_line]))
+        self.configure(state='disabled')
+    
+    def contents(self) -> str:
+        """Full content, including lines not rendered yet."""
+        return self.get('1.0', 'end-1c') + ''.join(self._lines[self._next_line:])
+    
+    def _on_yscroll(self, first, last):
+        self.vbar.set(first, last)
+        if self._next_line < len(self._lines) and float(last) > 0.9 and self._load_job is None:
+            self._load_job = self.after_idle(self._load_more)
+    
+    def _load_more(self):
+        """Append the next batch of pending lines."""
+        self._load_job = None
+        start, self._next_line = self._next_line, min(self._next_line + self.CHUNK_LINES, len(self._lines))
+        self.configure(state='normal')
+        self.insert('end-1c', ''.join(self._lines[start:self._next_line]))
+        self.configure(state='disabled')
+
+
+def _read_profile_fields(path: Path, wanted) -> Dict[str, Any]:
+    """Read the top-level fields named in ``wanted`` from a profile export.
+    
+    With ijson installed the file is streamed one top-level value at a time,
+    so large sections the generator ignores are dropped as they are parsed
+    instead of being held alongside the whole document.
+    """
+    if ijson is None:
+        data = _loads(path.read_bytes())
+        return {k: v for k, v in data.items() if k in wanted}
+    
+    with path.open('rb') as f:
+        return {k: v for k, v in ijson.kvitems(f, '', use_float=True) if k in wanted}
+
+
+def _linkedin_profile_from_dict(data: Dict[str, Any]) -> LinkedInProfile:
+    """Rebuild a LinkedInProfile from its ``asdict`` form."""
+    known_fields = {f.name for f in fields(LinkedInProfile)}
+    profile = LinkedInProfile(**{k: v for k, v in data.items() if k in known_fields})
+    if isinstance(profile.config_used, dict):
+        config_fields = {f.name for f in fields(LinkedInConfig)}
+        profile.config_used = LinkedInConfig(**{k: v for k, v in profile.config_used.items()
+                                                if k in config_fields})
+    return profile
+
+
+def _numbered(header: str, items) -> str:
+    """Format a header followed by a numbered, blank-line separated list."""
+    return ''.join([f"{header}\n\n", *(f"{i:2d}. {item}\n\n" for i, item in enumerate(items, 1))])
+
+
+# Widget attributes filled by _format_results, grouped by result sub-tab
+_RESULT_PANES = (
+    ('headline_text', 'summary_short_text', 'summary_medium_text', 'summary_long_text'),
+    ('skills_text', 'projects_text'),
+    ('post_ideas_text', 'article_topics_text'),
+    ('connection_targets_text', 'industry_keywords_text'),
+    ('improvement_tips_text', 'keyword_optimization_text'),
+)
+
+
+def _format_results(data: LinkedInProfile) -> Dict[str, str]:
+    """Render each result pane's text, keyed by the dialog attribute of its widget.
+    
+    Pure string work with no Tk calls, so it can run off the Tk thread.
+    """
+    # Skills
+    skills_parts = ["TOP LINKEDIN SKILLS TO ADD:\n\n"]
+    skills_parts.extend(f"{i:2d}. {skill}\n" for i, skill in enumerate(data.top_skills[:20], 1))
+    if data.skill_categories:
+        skills_parts.append("\n\nSKILLS BY CATEGORY:\n\n")
+        skills_parts.extend(chain.from_iterable(
+            (f"{category}:\n", *(f"{_BULLET}{skill}\n" for skill in skills), "\n")
+            for category, skills in data.skill_categories.items()
+        ))
+    
+    # Projects
+    projects_parts = ["OPTIMIZED PROJECT DESCRIPTIONS:\n\n"]
+    for i, project in enumerate(data.project_descriptions, 1):
+        projects_parts.append(f"{i}. {project['name']}\n{project['description']}\n")
+        projects_parts.extend(f"{_BULLET}{achievement}\n" for achievement in project.get('achievements') or ())
+        projects_parts.append(f"Technologies: {', '.join(project.get('technologies', ()))}\n\n")
+    
+    return {
+        # Headline & summaries
+        'headline_text': data.headline,
+        'summary_short_text': data.summary_short,
+        'summary_medium_text': data.summary,
+        'summary_long_text': data.summary_long,
+        
+        'skills_text': ''.join(skills_parts),
+        'projects_text': ''.join(projects_parts),
+        
+        # Content ideas
+        'post_ideas_text': _numbered("LINKEDIN POST IDEAS:", data.post_ideas),
+        'article_topics_text': _numbered("LINKEDIN ARTICLE TOPICS:", data.article_topics),
+        
+        # Networking
+        'connection_targets_text': _numbered("CONNECTION TARGETS:", data.connection_targets),
+        'industry_keywords_text': "INDUSTRY KEYWORDS TO USE:\n\n" + ", ".join(data.industry_keywords),
+        
+        # Optimization tips
+        'improvement_tips_text': _numbered("PROFILE IMPROVEMENT TIPS:", data.profile_improvement_tips),
+        'keyword_optimization_text': _numbered("KEYWORD OPTIMIZATION:", data.keyword_optimization),
+    }
+
+
+class VarDict:
+    """Tk variables for LinkedInConfig fields.
+    
+    A single write trace handles every variable; when a ``target`` is
+    given, each write is set on it as an attribute.
+    """
+    
+    _KINDS = {bool: tk.BooleanVar, str: tk.StringVar}
+    
+    def __init__(self, target: Any = None):
+        self._vars: Dict[str, tk.Variable] = {}
+        self._names: Dict[str, str] = {}
+        self._optional = set()
+        self._target = target
+    
+    def bind(self, name: str, kind: type, default: Any, optional: bool = False) -> tk.Variable:
+        """Create the variable backing config field ``name`` and return it.
+        
+        With ``optional=True`` an empty value is set on the target as ``None``.
+        """
+        var = self._KINDS[kind](value=default if default is not None else kind())
+        self._vars[name] = var
+        self._names[str(var)] = name
+        if optional:
+            self._optional.add(name)
+        var.trace_add('write', self._on_write)
+        return var
+    
+    def __getitem__(self, name: str) -> tk.Variable:
+        return self._vars[name]
+    
+    def _on_write(self, var_name, index, mode):
+        name = self._names[var_name]
+        value = self._vars[name].get()
+        if self._target is not None:
+            setattr(self._target, name, (value or None) if name in self._optional else value)
 
 
 class LinkedInGeneratorDialog:
@@ -33,65 +390,157 @@ class LinkedInGeneratorDialog:
         """Initialize the LinkedIn generator dialog."""
         self.parent = parent
         self.logger = get_logger()
-        self.auth_manager = GitHubAuthManager()
+        self.auth_manager = _auth()
         
         # Create main dialog
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("💼 LinkedIn Profile Generator")
-        self.dialog.geometry("1100x900")
+        
+        # Size and offset from the parent in a single geometry call
+        x = parent.winfo_rootx() + 30
+        y = parent.winfo_rooty() + 30
+        self.dialog.geometry(f"1100x900+{x}+{y}")
         self.dialog.resizable(True, True)
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
-        # Center dialog
-        self.dialog.geometry("+%d+%d" % (
-            parent.winfo_rootx() + 30,
-            parent.winfo_rooty() + 30
-        ))
-        
         # State variables
         self.current_profile = None
         self.current_linkedin_data = None
         self.is_generating = False
+        self._progress_pct = None
+        self.is_loading_profile = False
+        self.profile_file_path = None
+        
+        # Background work (GitHub I/O, content generation) runs off the Tk thread
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="linkedin-dialog")
+        self._cancel = threading.Event()
+        
+        # Worker -> Tk calls waiting for the next _drain_dispatch
+        self._pending_calls = []
+        self._pending_lock = threading.Lock()
+        self._drain_scheduled = False
+        self._drain_job = None
+        self._closed = False
+        
+        # Pending after() ids for debounced entry callbacks
+        self._debounce_jobs: Dict[str, str] = {}
+        
+        # after() id of the _flush_log scheduled for the generation log
+        self._log_job = None
+        
+        # Latest _format_results output and the result sub-tabs built so far
+        self._result_content: Dict[str, str] = {}
+        self._results_built = set()
+        
+        # hash() of the text each result pane currently shows
+        self._section_hashes: Dict[str, int] = {}
         
         # Configuration
         self.linkedin_config = LinkedInConfig()
         
+        # Reused across regenerations so unchanged sections come from its cache
+        self._linkedin_generator: Optional[LinkedInGenerator] = None
+        
+        # Last generated content per (username, config), kept between sessions
+        self._content_cache = ContentCache()
+        
+        self._create_variables()
         self.setup_ui()
         self.load_settings()
     
+    def _create_variables(self):
+        """Create the Tk variables shared by the tabs.
+
+        Tabs are built on first visit, so the variables live on the dialog
+        itself and settings or generation never depend on a tab's widgets.
+        """
+        # Profile source
+        self.source_var = tk.StringVar(value="github_build")
+        self.github_username_var = tk.StringVar()
+        self.github_token_var = tk.StringVar()
+        self.profile_file_var = tk.StringVar()
+        self.profile_status_var = tk.StringVar(value="No profile loaded")
+        
+        # Content style; config fields are written through to linkedin_config
+        config = self.linkedin_config
+        self.cfg = VarDict(config)
+        self.tone_var = self.cfg.bind('tone', str, config.tone)
+        self.length_var = self.cfg.bind('length', str, config.length)
+        self.include_emojis_var = self.cfg.bind('include_emojis', bool, config.include_emojis)
+        self.first_person_var = self.cfg.bind('use_first_person', bool, config.use_first_person)
+        self.focus_results_var = self.cfg.bind('focus_on_results', bool, config.focus_on_results)
+        self.highlight_leadership_var = self.cfg.bind('highlight_leadership', bool, config.highlight_leadership)
+        self.emphasize_innovation_var = self.cfg.bind('emphasize_innovation', bool, config.emphasize_innovation)
+        self.personal_touches_var = self.cfg.bind('include_personal_touches', bool, config.include_personal_touches)
+        self.optimize_keywords_var = self.cfg.bind('optimize_for_keywords', bool, config.optimize_for_keywords)
+        self.include_cta_var = self.cfg.bind('include_call_to_action', bool, config.include_call_to_action)
+        self.open_opportunities_var = self.cfg.bind('mention_open_to_opportunities', bool,
+                                                    config.mention_open_to_opportunities)
+        self.brand_keywords_var = tk.StringVar()
+        self.company_preferences_var = tk.StringVar()
+        self.location_preferences_var = tk.StringVar()
+        
+        # Targeting
+        self.target_role_var = self.cfg.bind('target_role', str, config.target_role, optional=True)
+        self.career_level_var = tk.StringVar(value=config.career_level or "")
+        self.target_industry_var = self.cfg.bind('target_industry', str, config.target_industry, optional=True)
+        
+        # Status lines
+        self.generation_status_var = tk.StringVar(value="Ready to generate LinkedIn content")
+        self.export_status_var = tk.StringVar(value="No content generated yet")
+        
+        # Keep list fields in sync with the entries, once typing pauses
+        for var, attr in ((self.brand_keywords_var, 'personal_brand_keywords'),
+                          (self.company_preferences_var, 'company_preferences'),
+                          (self.location_preferences_var, 'location_preferences')):
+            var.trace_add('write', lambda *_, v=var, a=attr:
+                          self._debounce(a, 250, lambda: self._sync_csv_field(a, v)))
+    
     def setup_ui(self):
         """Setup the user interface."""
         # Create notebook for tabs
         self.notebook = ttk.Notebook(self.dialog)
         self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
         
-        # Tab 1: Profile Source
-        self.create_source_tab()
-        
-        # Tab 2: Content Configuration
-        self.create_config_tab()
-        
-        # Tab 3: Target & Positioning
-        self.create_targeting_tab()
-        
-        # Tab 4: Generate Content
-        self.create_generate_tab()
-        
-        # Tab 5: Content Results
-        self.create_results_tab()
+        # Tabs are added empty and filled in the first time they are shown
+        self._tab_builders = (
+            ("👤 Profile Source", self.create_source_tab),
+            ("⚙️ Content Style", self.create_config_tab),
+            ("🎯 Targeting", self.create_targeting_tab),
+            ("🔨 Generate", self.create_generate_tab),
+            ("📊 Results", self.create_results_tab),
+            ("💾 Export", self.create_export_tab),
+        )
+        self._tab_frames = []
+        self._built = set()
+        for name, _ in self._tab_builders:
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=name)
+            self._tab_frames.append(frame)
         
-        # Tab 6: Export & Tips
-        self.create_export_tab()
+        self._ensure_tab(0)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Bottom buttons
         self.create_bottom_buttons()
+        
+        # Transient confirmation shown over the bottom of the dialog
+        self._toast = ttk.Label(self.dialog, text='', background='#222', foreground='white', padding=6)
+        self._toast_job = None
+    
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab on its first visit."""
+        self._ensure_tab(self.notebook.index(self.notebook.select()))
     
-    def create_source_tab(self):
+    def _ensure_tab(self, index: int):
+        """Build tab ``index`` if it has not been built yet."""
+        if index not in self._built:
+            self._built.add(index)
+            self._tab_builders[index][1](self._tab_frames[index])
+    
+    def create_source_tab(self, source_frame):
         """Create the profile source tab."""
-        source_frame = ttk.Frame(self.notebook)
-        self.notebook.add(source_frame, text="👤 Profile Source")
-        
         # Instructions
         instructions_frame = ttk.LabelFrame(source_frame, text="📋 About LinkedIn Profile Generator", padding=15)
         instructions_frame.pack(fill='x', padx=10, pady=10)
@@ -114,16 +563,12 @@ class LinkedInGeneratorDialog:
 4. Provides multiple variations and customization options
 5. Offers strategic advice for networking and content creation"""
         
-        instructions_label = tk.Label(instructions_frame, text=instructions_text, 
-                                    justify='left', wraplength=1000, font=('Arial', 10))
-        instructions_label.pack()
+        _static_text(instructions_frame, instructions_text, font=('Arial', 10)).pack(fill='x')
         
         # Profile Source Options
         source_options_frame = ttk.LabelFrame(source_frame, text="📊 GitHub Profile Source", padding=15)
         source_options_frame.pack(fill='x', padx=10, pady=10)
         
-        self.source_var = tk.StringVar(value="github_build")
-        
         # Option 1: Build from GitHub
         github_frame = ttk.Frame(source_options_frame)
         github_frame.pack(fill='x', pady=5)
@@ -135,12 +580,10 @@ class LinkedInGeneratorDialog:
         github_details_frame.pack(fill='x', padx=20, pady=5)
         
         ttk.Label(github_details_frame, text="GitHub Username:").pack(side='left')
-        self.github_username_var = tk.StringVar()
         username_entry = ttk.Entry(github_details_frame, textvariable=self.github_username_var, width=25)
         username_entry.pack(side='left', padx=10)
         
         ttk.Label(github_details_frame, text="GitHub Token (optional):").pack(side='left', padx=(20, 0))
-        self.github_token_var = tk.StringVar()
         token_entry = ttk.Entry(github_details_frame, textvariable=self.github_token_var, 
                                width=30, show='*')
         token_entry.pack(side='left', padx=10)
@@ -157,7 +600,6 @@ class LinkedInGeneratorDialog:
         
         ttk.Button(existing_details_frame, text="📂 Browse Profile JSON", 
                   command=self.browse_profile_file).pack(side='left')
-        self.profile_file_var = tk.StringVar()
         ttk.Label(existing_details_frame, textvariable=self.profile_file_var, 
                  foreground='blue').pack(side='left', padx=10)
         
@@ -165,7 +607,6 @@ class LinkedInGeneratorDialog:
         status_frame = ttk.LabelFrame(source_frame, text="📊 Current Profile Status", padding=15)
         status_frame.pack(fill='x', padx=10, pady=10)
         
-        self.profile_status_var = tk.StringVar(value="No profile loaded")
         ttk.Label(status_frame, textvariable=self.profile_status_var, 
                  font=('Arial', 11, 'bold')).pack()
         
@@ -177,15 +618,16 @@ class LinkedInGeneratorDialog:
                                           command=self.load_profile, style='Action.TButton')
         self.load_profile_btn.pack(side='left', padx=10)
         
+        self.cancel_load_btn = ttk.Button(action_frame, text="⏹️ Cancel", 
+                                         command=self.cancel_profile_load, state='disabled')
+        self.cancel_load_btn.pack(side='left', padx=10)
+        
         self.profile_info_btn = ttk.Button(action_frame, text="ℹ️ View Profile Info", 
                                           command=self.show_profile_info, state='disabled')
         self.profile_info_btn.pack(side='left', padx=10)
     
-    def create_config_tab(self):
+    def create_config_tab(self, config_frame):
         """Create the content configuration tab."""
-        config_frame = ttk.Frame(self.notebook)
-        self.notebook.add(config_frame, text="⚙️ Content Style")
-        
         # Scrollable frame
         canvas = tk.Canvas(config_frame)
         scrollbar = ttk.Scrollbar(config_frame, orient="vertical", command=canvas.yview)
@@ -207,14 +649,12 @@ class LinkedInGeneratorDialog:
         style_row1.pack(fill='x', pady=5)
         
         ttk.Label(style_row1, text="Tone:").pack(side='left')
-        self.tone_var = tk.StringVar(value=self.linkedin_config.tone)
         tone_combo = ttk.Combobox(style_row1, textvariable=self.tone_var,
                                  values=['professional', 'approachable', 'authoritative', 'creative'],
                                  state='readonly', width=15)
         tone_combo.pack(side='left', padx=10)
         
         ttk.Label(style_row1, text="Length:").pack(side='left', padx=(20, 0))
-        self.length_var = tk.StringVar(value=self.linkedin_config.length)
         length_combo = ttk.Combobox(style_row1, textvariable=self.length_var,
                                    values=['short', 'medium', 'long'], state='readonly', width=10)
         length_combo.pack(side='left', padx=10)
@@ -222,9 +662,6 @@ class LinkedInGeneratorDialog:
         style_options_frame = ttk.Frame(style_frame)
         style_options_frame.pack(fill='x', pady=10)
         
-        self.include_emojis_var = tk.BooleanVar(value=self.linkedin_config.include_emojis)
-        self.first_person_var = tk.BooleanVar(value=self.linkedin_config.use_first_person)
-        
         ttk.Checkbutton(style_options_frame, text="😊 Include Emojis", 
                        variable=self.include_emojis_var).pack(anchor='w')
         ttk.Checkbutton(style_options_frame, text="👤 Use First Person (I/my vs They/their)", 
@@ -237,11 +674,6 @@ class LinkedInGeneratorDialog:
         focus_grid = ttk.Frame(focus_frame)
         focus_grid.pack(fill='x')
         
-        self.focus_results_var = tk.BooleanVar(value=self.linkedin_config.focus_on_results)
-        self.highlight_leadership_var = tk.BooleanVar(value=self.linkedin_config.highlight_leadership)
-        self.emphasize_innovation_var = tk.BooleanVar(value=self.linkedin_config.emphasize_innovation)
-        self.personal_touches_var = tk.BooleanVar(value=self.linkedin_config.include_personal_touches)
-        
         ttk.Checkbutton(focus_grid, text="📊 Focus on Results & Metrics", 
                        variable=self.focus_results_var).grid(row=0, column=0, sticky='w', padx=5, pady=2)
         ttk.Checkbutton(focus_grid, text="👑 Highlight Leadership Experience", 
@@ -258,10 +690,6 @@ class LinkedInGeneratorDialog:
         opt_options = ttk.Frame(optimization_frame)
         opt_options.pack(fill='x', pady=5)
         
-        self.optimize_keywords_var = tk.BooleanVar(value=self.linkedin_config.optimize_for_keywords)
-        self.include_cta_var = tk.BooleanVar(value=self.linkedin_config.include_call_to_action)
-        self.open_opportunities_var = tk.BooleanVar(value=self.linkedin_config.mention_open_to_opportunities)
-        
         ttk.Checkbutton(opt_options, text="🔑 Optimize for Keywords & Search", 
                        variable=self.optimize_keywords_var).pack(anchor='w')
         ttk.Checkbutton(opt_options, text="📢 Include Call-to-Action", 
@@ -278,7 +706,6 @@ class LinkedInGeneratorDialog:
         keywords_frame.pack(fill='x', pady=5)
         
         ttk.Label(keywords_frame, text="Brand Keywords (comma-separated):").pack(anchor='w')
-        self.brand_keywords_var = tk.StringVar()
         brand_keywords_entry = ttk.Entry(keywords_frame, textvariable=self.brand_keywords_var, width=60)
         brand_keywords_entry.pack(fill='x', pady=2)
         
@@ -287,7 +714,6 @@ class LinkedInGeneratorDialog:
         companies_frame.pack(fill='x', pady=5)
         
         ttk.Label(companies_frame, text="Preferred Companies (comma-separated):").pack(anchor='w')
-        self.company_preferences_var = tk.StringVar()
         companies_entry = ttk.Entry(companies_frame, textvariable=self.company_preferences_var, width=60)
         companies_entry.pack(fill='x', pady=2)
         
@@ -296,7 +722,6 @@ class LinkedInGeneratorDialog:
         locations_frame.pack(fill='x', pady=5)
         
         ttk.Label(locations_frame, text="Location Preferences (comma-separated):").pack(anchor='w')
-        self.location_preferences_var = tk.StringVar()
         locations_entry = ttk.Entry(locations_frame, textvariable=self.location_preferences_var, width=60)
         locations_entry.pack(fill='x', pady=2)
         
@@ -304,11 +729,8 @@ class LinkedInGeneratorDialog:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
     
-    def create_targeting_tab(self):
+    def create_targeting_tab(self, targeting_frame):
         """Create the targeting and positioning tab."""
-        targeting_frame = ttk.Frame(self.notebook)
-        self.notebook.add(targeting_frame, text="🎯 Targeting")
-        
         # Target Role
         role_frame = ttk.LabelFrame(targeting_frame, text="💼 Target Role", padding=15)
         role_frame.pack(fill='x', padx=10, pady=10)
@@ -317,12 +739,10 @@ class LinkedInGeneratorDialog:
         role_details_frame.pack(fill='x', pady=5)
         
         ttk.Label(role_details_frame, text="Target Role:").pack(side='left')
-        self.target_role_var = tk.StringVar(value=self.linkedin_config.target_role or "")
         role_entry = ttk.Entry(role_details_frame, textvariable=self.target_role_var, width=30)
         role_entry.pack(side='left', padx=10)
         
         ttk.Label(role_details_frame, text="Career Level:").pack(side='left', padx=(20, 0))
-        self.career_level_var = tk.StringVar(value=self.linkedin_config.career_level or "")
         level_combo = ttk.Combobox(role_details_frame, textvariable=self.career_level_var,
                                   values=['entry', 'mid', 'senior', 'executive'], 
                                   state='readonly', width=15)
@@ -336,8 +756,7 @@ class LinkedInGeneratorDialog:
         examples_text = ("Software Developer, Senior Frontend Developer, Full Stack Engineer, DevOps Engineer, "
                         "Data Scientist, Product Manager, Engineering Manager, Solutions Architect, "
                         "Technical Lead, CTO")
-        ttk.Label(examples_frame, text=examples_text, wraplength=900, 
-                 font=('Arial', 9)).pack(anchor='w', pady=2)
+        _static_text(examples_frame, examples_text, height=2, font=('Arial', 9)).pack(fill='x', pady=2)
         
         # Target Industry
         industry_frame = ttk.LabelFrame(targeting_frame, text="🏢 Target Industry", padding=15)
@@ -347,7 +766,6 @@ class LinkedInGeneratorDialog:
         industry_details_frame.pack(fill='x', pady=5)
         
         ttk.Label(industry_details_frame, text="Target Industry:").pack(side='left')
-        self.target_industry_var = tk.StringVar(value=self.linkedin_config.target_industry or "")
         industry_entry = ttk.Entry(industry_details_frame, textvariable=self.target_industry_var, width=30)
         industry_entry.pack(side='left', padx=10)
         
@@ -359,8 +777,8 @@ class LinkedInGeneratorDialog:
         industry_examples_text = ("FinTech, HealthTech, EdTech, E-commerce, SaaS, Gaming, IoT, AI/ML, "
                                  "Cybersecurity, Cloud Computing, Enterprise Software, Consumer Apps, "
                                  "Developer Tools")
-        ttk.Label(industry_examples_frame, text=industry_examples_text, wraplength=900, 
-                 font=('Arial', 9)).pack(anchor='w', pady=2)
+        _static_text(industry_examples_frame, industry_examples_text, height=2,
+                     font=('Arial', 9)).pack(fill='x', pady=2)
         
         # Content Strategy
         strategy_frame = ttk.LabelFrame(targeting_frame, text="📝 Content Strategy", padding=15)
@@ -404,16 +822,12 @@ class LinkedInGeneratorDialog:
         ttk.Button(template_buttons_frame, text="🔬 Research/Academic", 
                   command=lambda: self.apply_template("academic")).pack(side='left', padx=5)
     
-    def create_generate_tab(self):
+    def create_generate_tab(self, generate_frame):
         """Create the content generation tab."""
-        generate_frame = ttk.Frame(self.notebook)
-        self.notebook.add(generate_frame, text="🔨 Generate")
-        
         # Generation Status
         status_frame = ttk.LabelFrame(generate_frame, text="📊 Generation Status", padding=15)
         status_frame.pack(fill='x', padx=10, pady=10)
         
-        self.generation_status_var = tk.StringVar(value="Ready to generate LinkedIn content")
         ttk.Label(status_frame, textvariable=self.generation_status_var, 
                  font=('Arial', 11, 'bold')).pack()
         
@@ -434,57 +848,67 @@ class LinkedInGeneratorDialog:
         progress_frame.pack(fill='x', padx=10, pady=10)
         
         ttk.Label(progress_frame, text="Progress:").pack(anchor='w')
-        self.generation_progress = ttk.Progressbar(progress_frame, mode='indeterminate')
+        self.generation_progress = ttk.Progressbar(progress_frame, mode='determinate', maximum=100)
         self.generation_progress.pack(fill='x', pady=5)
         
         # Generation Log
         log_frame = ttk.LabelFrame(generate_frame, text="📝 Generation Log")
         log_frame.pack(fill='both', expand=True, padx=10, pady=10)
         
-        self.generation_log = scrolledtext.ScrolledText(log_frame, height=12, wrap=tk.WORD)
+        self.generation_log = _make_readonly_text(log_frame, height=12, font=None)
         self.generation_log.pack(fill='both', expand=True, padx=5, pady=5)
     
-    def create_results_tab(self):
+    def create_results_tab(self, results_frame):
         """Create the results tab."""
-        results_frame = ttk.Frame(self.notebook)
-        self.notebook.add(results_frame, text="📊 Results")
-        
         # Results notebook for different content types
         self.results_notebook = ttk.Notebook(results_frame)
         self.results_notebook.pack(fill='both', expand=True, padx=5, pady=5)
         
-        # Headline & Summary Tab
-        self.create_headline_summary_tab()
-        
-        # Skills & Experience Tab
-        self.create_skills_experience_tab()
-        
-        # Content Ideas Tab
-        self.create_content_ideas_tab()
-        
-        # Networking Tab
-        self.create_networking_tab()
-        
-        # Optimization Tab
-        self.create_optimization_tab()
+        # Result sub-tabs are built on first view, like the main tabs
+        self._result_builders = (
+            ("📝 Headline & Summary", self.create_headline_summary_tab),
+            ("🔧 Skills & Projects", self.create_skills_experience_tab),
+            ("💡 Content Ideas", self.create_content_ideas_tab),
+            ("🤝 Networking", self.create_networking_tab),
+            ("🚀 Optimization", self.create_optimization_tab),
+        )
+        self._result_frames = []
+        for name, _ in self._result_builders:
+            frame = ttk.Frame(self.results_notebook)
+            self.results_notebook.add(frame, text=name)
+            self._result_frames.append(frame)
+        
+        self._ensure_result_tab(0)
+        self.results_notebook.bind('<<NotebookTabChanged>>', self._on_result_tab_changed)
     
-    def create_headline_summary_tab(self):
+    def _on_result_tab_changed(self, event=None):
+        """Build the selected result sub-tab on its first visit."""
+        self._ensure_result_tab(self.results_notebook.index(self.results_notebook.select()))
+    
+    def _ensure_result_tab(self, index: int):
+        """Build result sub-tab ``index`` and fill it with any content already generated."""
+        if index in self._results_built:
+            return
+        self._results_built.add(index)
+        self._result_builders[index][1](self._result_frames[index])
+        for widget_name in _RESULT_PANES[index]:
+            if widget_name in self._result_content:
+                self._set_section(widget_name, self._result_content[widget_name])
+    
+    def create_headline_summary_tab(self, headline_frame):
         """Create headline and summary results tab."""
-        headline_frame = ttk.Frame(self.results_notebook)
-        self.results_notebook.add(headline_frame, text="📝 Headline & Summary")
-        
         # Headline Section
         headline_section = ttk.LabelFrame(headline_frame, text="📢 LinkedIn Headline", padding=10)
         headline_section.pack(fill='x', padx=5, pady=5)
         
-        self.headline_text = scrolledtext.ScrolledText(headline_section, height=3, wrap=tk.WORD,
-                                                      font=('Arial', 11, 'bold'), background='#f0f8ff')
+        self.headline_text = _ReadOnlyText(headline_section, height=3, wrap=tk.WORD,
+                                          font=('Arial', 11, 'bold'), background='#f0f8ff')
         self.headline_text.pack(fill='x', pady=5)
         
         headline_actions = ttk.Frame(headline_section)
         headline_actions.pack(fill='x', pady=5)
-        ttk.Button(headline_actions, text="📋 Copy Headline", 
-                  command=lambda: self.copy_text(self.headline_text)).pack(side='left', padx=5)
+        ttk.Button(headline_actions, text=_COPY + "Headline", 
+                  command=functools.partial(self.copy_text, self.headline_text)).pack(side='left', padx=5)
         
         # Summary Section
         summary_section = ttk.LabelFrame(headline_frame, text="📄 Professional Summary", padding=10)
@@ -497,163 +921,147 @@ class LinkedInGeneratorDialog:
         # Short summary
         short_frame = ttk.Frame(summary_tabs)
         summary_tabs.add(short_frame, text="Short (2 sentences)")
-        self.summary_short_text = scrolledtext.ScrolledText(short_frame, height=4, wrap=tk.WORD,
-                                                           font=('Arial', 10))
+        self.summary_short_text = _ReadOnlyText(short_frame, height=4, wrap=tk.WORD,
+                                               font=('Arial', 10))
         self.summary_short_text.pack(fill='both', expand=True, padx=5, pady=5)
         
         short_actions = ttk.Frame(short_frame)
         short_actions.pack(fill='x', padx=5, pady=5)
-        ttk.Button(short_actions, text="📋 Copy Short Summary", 
-                  command=lambda: self.copy_text(self.summary_short_text)).pack(side='left')
+        ttk.Button(short_actions, text=_COPY + "Short Summary", 
+                  command=functools.partial(self.copy_text, self.summary_short_text)).pack(side='left')
         
         # Medium summary
         medium_frame = ttk.Frame(summary_tabs)
         summary_tabs.add(medium_frame, text="Medium (3-4 paragraphs)")
-        self.summary_medium_text = scrolledtext.ScrolledText(medium_frame, height=12, wrap=tk.WORD,
-                                                            font=('Arial', 10))
+        self.summary_medium_text = _ReadOnlyText(medium_frame, height=12, wrap=tk.WORD,
+                                                font=('Arial', 10))
         self.summary_medium_text.pack(fill='both', expand=True, padx=5, pady=5)
         
         medium_actions = ttk.Frame(medium_frame)
         medium_actions.pack(fill='x', padx=5, pady=5)
-        ttk.Button(medium_actions, text="📋 Copy Medium Summary", 
-                  command=lambda: self.copy_text(self.summary_medium_text)).pack(side='left')
+        ttk.Button(medium_actions, text=_COPY + "Medium Summary", 
+                  command=functools.partial(self.copy_text, self.summary_medium_text)).pack(side='left')
         
         # Long summary
         long_frame = ttk.Frame(summary_tabs)
         summary_tabs.add(long_frame, text="Long (5+ paragraphs)")
-        self.summary_long_text = scrolledtext.ScrolledText(long_frame, height=15, wrap=tk.WORD,
-                                                          font=('Arial', 10))
+        self.summary_long_text = _ReadOnlyText(long_frame, height=15, wrap=tk.WORD,
+                                              font=('Arial', 10))
         self.summary_long_text.pack(fill='both', expand=True, padx=5, pady=5)
         
         long_actions = ttk.Frame(long_frame)
         long_actions.pack(fill='x', padx=5, pady=5)
-        ttk.Button(long_actions, text="📋 Copy Long Summary", 
-                  command=lambda: self.copy_text(self.summary_long_text)).pack(side='left')
+        ttk.Button(long_actions, text=_COPY + "Long Summary", 
+                  command=functools.partial(self.copy_text, self.summary_long_text)).pack(side='left')
     
-    def create_skills_experience_tab(self):
+    def create_skills_experience_tab(self, skills_frame):
         """Create skills and experience tab."""
-        skills_frame = ttk.Frame(self.results_notebook)
-        self.results_notebook.add(skills_frame, text="🔧 Skills & Projects")
-        
         # Top Skills Section
         skills_section = ttk.LabelFrame(skills_frame, text="🎯 Top Skills for LinkedIn", padding=10)
         skills_section.pack(fill='x', padx=5, pady=5)
         
-        self.skills_text = scrolledtext.ScrolledText(skills_section, height=8, wrap=tk.WORD,
-                                                    font=('Arial', 10))
+        self.skills_text = _ReadOnlyText(skills_section, height=8, wrap=tk.WORD,
+                                        font=('Arial', 10))
         self.skills_text.pack(fill='both', expand=True, pady=5)
         
         skills_actions = ttk.Frame(skills_section)
         skills_actions.pack(fill='x', pady=5)
-        ttk.Button(skills_actions, text="📋 Copy Skills List", 
-                  command=lambda: self.copy_text(self.skills_text)).pack(side='left', padx=5)
+        ttk.Button(skills_actions, text=_COPY + "Skills List", 
+                  command=functools.partial(self.copy_text, self.skills_text)).pack(side='left', padx=5)
         
         # Project Descriptions Section
         projects_section = ttk.LabelFrame(skills_frame, text="🚀 Project Descriptions", padding=10)
         projects_section.pack(fill='both', expand=True, padx=5, pady=5)
         
-        self.projects_text = scrolledtext.ScrolledText(projects_section, height=12, wrap=tk.WORD,
-                                                      font=('Arial', 10))
+        self.projects_text = _ReadOnlyText(projects_section, height=12, wrap=tk.WORD,
+                                          font=('Arial', 10))
         self.projects_text.pack(fill='both', expand=True, pady=5)
         
         projects_actions = ttk.Frame(projects_section)
         projects_actions.pack(fill='x', pady=5)
-        ttk.Button(projects_actions, text="📋 Copy Project Descriptions", 
-                  command=lambda: self.copy_text(self.projects_text)).pack(side='left', padx=5)
+        ttk.Button(projects_actions, text=_COPY + "Project Descriptions", 
+                  command=functools.partial(self.copy_text, self.projects_text)).pack(side='left', padx=5)
     
-    def create_content_ideas_tab(self):
+    def create_content_ideas_tab(self, content_frame):
         """Create content ideas tab."""
-        content_frame = ttk.Frame(self.results_notebook)
-        self.results_notebook.add(content_frame, text="💡 Content Ideas")
-        
         # Post Ideas Section
         posts_section = ttk.LabelFrame(content_frame, text="📝 LinkedIn Post Ideas", padding=10)
         posts_section.pack(fill='both', expand=True, padx=5, pady=5)
         
-        self.post_ideas_text = scrolledtext.ScrolledText(posts_section, height=10, wrap=tk.WORD,
-                                                        font=('Arial', 10))
+        self.post_ideas_text = _ReadOnlyText(posts_section, height=10, wrap=tk.WORD,
+                                            font=('Arial', 10))
         self.post_ideas_text.pack(fill='both', expand=True, pady=5)
         
         posts_actions = ttk.Frame(posts_section)
         posts_actions.pack(fill='x', pady=5)
-        ttk.Button(posts_actions, text="📋 Copy Post Ideas", 
-                  command=lambda: self.copy_text(self.post_ideas_text)).pack(side='left', padx=5)
+        ttk.Button(posts_actions, text=_COPY + "Post Ideas", 
+                  command=functools.partial(self.copy_text, self.post_ideas_text)).pack(side='left', padx=5)
         
         # Article Topics Section
         articles_section = ttk.LabelFrame(content_frame, text="📰 Article Topics", padding=10)
         articles_section.pack(fill='both', expand=True, padx=5, pady=5)
         
-        self.article_topics_text = scrolledtext.ScrolledText(articles_section, height=8, wrap=tk.WORD,
-                                                            font=('Arial', 10))
+        self.article_topics_text = _ReadOnlyText(articles_section, height=8, wrap=tk.WORD,
+                                                font=('Arial', 10))
         self.article_topics_text.pack(fill='both', expand=True, pady=5)
         
         articles_actions = ttk.Frame(articles_section)
         articles_actions.pack(fill='x', pady=5)
-        ttk.Button(articles_actions, text="📋 Copy Article Topics", 
-                  command=lambda: self.copy_text(self.article_topics_text)).pack(side='left', padx=5)
+        ttk.Button(articles_actions, text=_COPY + "Article Topics", 
+                  command=functools.partial(self.copy_text, self.article_topics_text)).pack(side='left', padx=5)
     
-    def create_networking_tab(self):
+    def create_networking_tab(self, networking_frame):
         """Create networking suggestions tab."""
-        networking_frame = ttk.Frame(self.results_notebook)
-        self.results_notebook.add(networking_frame, text="🤝 Networking")
-        
         # Connection Targets Section
         targets_section = ttk.LabelFrame(networking_frame, text="🎯 Connection Targets", padding=10)
         targets_section.pack(fill='both', expand=True, padx=5, pady=5)
         
-        self.connection_targets_text = scrolledtext.ScrolledText(targets_section, height=8, wrap=tk.WORD,
-                                                                font=('Arial', 10))
+        self.connection_targets_text = _ReadOnlyText(targets_section, height=8, wrap=tk.WORD,
+                                                    font=('Arial', 10))
         self.connection_targets_text.pack(fill='both', expand=True, pady=5)
         
         targets_actions = ttk.Frame(targets_section)
         targets_actions.pack(fill='x', pady=5)
-        ttk.Button(targets_actions, text="📋 Copy Connection Strategy", 
-                  command=lambda: self.copy_text(self.connection_targets_text)).pack(side='left', padx=5)
+        ttk.Button(targets_actions, text=_COPY + "Connection Strategy", 
+                  command=functools.partial(self.copy_text, self.connection_targets_text)).pack(side='left', padx=5)
         
         # Industry Keywords Section
         keywords_section = ttk.LabelFrame(networking_frame, text="🔑 Industry Keywords", padding=10)
         keywords_section.pack(fill='both', expand=True, padx=5, pady=5)
         
-        self.industry_keywords_text = scrolledtext.ScrolledText(keywords_section, height=6, wrap=tk.WORD,
-                                                               font=('Arial', 10))
+        self.industry_keywords_text = _ReadOnlyText(keywords_section, height=6, wrap=tk.WORD,
+                                                   font=('Arial', 10))
         self.industry_keywords_text.pack(fill='both', expand=True, pady=5)
         
         keywords_actions = ttk.Frame(keywords_section)
         keywords_actions.pack(fill='x', pady=5)
-        ttk.Button(keywords_actions, text="📋 Copy Keywords", 
-                  command=lambda: self.copy_text(self.industry_keywords_text)).pack(side='left', padx=5)
+        ttk.Button(keywords_actions, text=_COPY + "Keywords", 
+                  command=functools.partial(self.copy_text, self.industry_keywords_text)).pack(side='left', padx=5)
     
-    def create_optimization_tab(self):
+    def create_optimization_tab(self, optimization_frame):
         """Create optimization tips tab."""
-        optimization_frame = ttk.Frame(self.results_notebook)
-        self.results_notebook.add(optimization_frame, text="🚀 Optimization")
-        
         # Profile Tips Section
         tips_section = ttk.LabelFrame(optimization_frame, text="💡 Profile Improvement Tips", padding=10)
         tips_section.pack(fill='both', expand=True, padx=5, pady=5)
         
-        self.improvement_tips_text = scrolledtext.ScrolledText(tips_section, height=10, wrap=tk.WORD,
-                                                              font=('Arial', 10))
+        self.improvement_tips_text = _ReadOnlyText(tips_section, height=10, wrap=tk.WORD,
+                                                  font=('Arial', 10))
         self.improvement_tips_text.pack(fill='both', expand=True, pady=5)
         
         # Keyword Optimization Section
         keyword_opt_section = ttk.LabelFrame(optimization_frame, text="🔍 Keyword Optimization", padding=10)
         keyword_opt_section.pack(fill='both', expand=True, padx=5, pady=5)
         
-        self.keyword_optimization_text = scrolledtext.ScrolledText(keyword_opt_section, height=8, wrap=tk.WORD,
-                                                                  font=('Arial', 10))
+        self.keyword_optimization_text = _ReadOnlyText(keyword_opt_section, height=8, wrap=tk.WORD,
+                                                      font=('Arial', 10))
         self.keyword_optimization_text.pack(fill='both', expand=True, pady=5)
     
-    def create_export_tab(self):
+    def create_export_tab(self, export_frame):
         """Create the export tab."""
-        export_frame = ttk.Frame(self.notebook)
-        self.notebook.add(export_frame, text="💾 Export")
-        
         # Export Status
         status_frame = ttk.LabelFrame(export_frame, text="📊 Export Status", padding=15)
         status_frame.pack(fill='x', padx=10, pady=10)
         
-        self.export_status_var = tk.StringVar(value="No content generated yet")
         ttk.Label(status_frame, textvariable=self.export_status_var, 
                  font=('Arial', 11, 'bold')).pack()
         
@@ -686,31 +1094,13 @@ class LinkedInGeneratorDialog:
         guide_frame = ttk.LabelFrame(export_frame, text="📚 How to Use Your LinkedIn Content", padding=15)
         guide_frame.pack(fill='x', padx=10, pady=10)
         
-        guide_text = """🎯 Implementation Guide:
-
-1. Headline: Copy your chosen headline to your LinkedIn profile. Test different versions to see which performs best.
-
-2. Summary: Use the medium-length summary as your About section. The short version works well for InMail templates.
-
-3. Skills: Add the recommended skills to your LinkedIn Skills section. Ask colleagues for endorsements.
-
-4. Projects: Add projects to your Experience or Featured sections with the optimized descriptions.
-
-5. Content Strategy: Use the post ideas and article topics for regular LinkedIn content creation.
-
-6. Networking: Follow the connection targeting strategy to build a relevant professional network.
-
-7. Optimization: Implement the profile improvement tips to increase visibility and engagement."""
-        
-        ttk.Label(guide_frame, text=guide_text, justify='left', 
-                 wraplength=950, font=('Arial', 10)).pack()
+        _static_text(guide_frame, _GUIDE_TEXT, font=('Arial', 10)).pack(fill='x')
         
         # Live Preview
         preview_frame = ttk.LabelFrame(export_frame, text="👁️ Live Preview")
         preview_frame.pack(fill='both', expand=True, padx=10, pady=10)
         
-        self.preview_text = scrolledtext.ScrolledText(preview_frame, height=15, wrap=tk.WORD,
-                                                     font=('Consolas', 9))
+        self.preview_text = _make_readonly_text(preview_frame, height=15, font=('Consolas', 9))
         self.preview_text.pack(fill='both', expand=True, padx=5, pady=5)
     
     def create_bottom_buttons(self):
@@ -730,10 +1120,11 @@ class LinkedInGeneratorDialog:
         file_path = filedialog.askopenfilename(
             title="Select GitHub Profile JSON",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
-            initialdir=str(Path.home() / "github_profiles")
+            initialdir=str(_HOME / "github_profiles")
         )
         
         if file_path:
+            self.profile_file_path = file_path
             self.profile_file_var.set(os.path.basename(file_path))
     
     def load_profile(self):
@@ -744,236 +1135,319 @@ class LinkedInGeneratorDialog:
             self._load_existing_profile()
     
     def _build_github_profile(self):
-        """Build GitHub profile from username."""
+        """Build GitHub profile from username in a background worker."""
         username = self.github_username_var.get().strip()
         if not username:
             messagebox.showwarning("Missing Username", "Please enter a GitHub username.")
             return
         
-        # Mock implementation for demo
-        from profile_builder import GitHubProfile
+        if self.is_loading_profile:
+            return
+        
+        token = self.github_token_var.get().strip() or self.auth_manager.get_token() or None
+        
+        self.is_loading_profile = True
+        self._cancel.clear()
+        self.profile_status_var.set(f"Building profile for {username}...")
+        self.load_profile_btn.config(state='disabled')
+        self.cancel_load_btn.config(state='normal')
+        
+        future = self._executor.submit(self._build_profile_blocking, username, token)
+        future.add_done_callback(lambda f: self._dispatch(self._on_profile_loaded, f))
+    
+    def _build_profile_blocking(self, username: str, token: Optional[str]) -> GitHubProfile:
+        """Worker: run the profile builder without touching Tk widgets."""
+        builder = GitHubProfileBuilder(ProfileBuilderConfig())
+        
+        def progress_callback(message, progress):
+            self._dispatch(self.profile_status_var.set, f"{message} ({progress}%)")
         
-        profile = GitHubProfile()
-        profile.username = username
-        profile.name = username.replace('_', ' ').replace('-', ' ').title()
-        profile.developer_type = "Full-stack Developer"
-        profile.experience_level = "Mid-level"
-        # ... populate other fields
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(builder.build_profile(username, token, progress_callback, self._cancel))
+        finally:
+            loop.close()
+    
+    def _on_profile_loaded(self, future):
+        """Handle profile build completion on the Tk thread."""
+        self.is_loading_profile = False
+        self.load_profile_btn.config(state='normal')
+        self.cancel_load_btn.config(state='disabled')
+        
+        if self._cancel.is_set():
+            self.profile_status_var.set("⏹️ Profile build cancelled")
+            return
+        
+        try:
+            profile = future.result()
+        except Exception as e:
+            self.logger.error(f"Profile build failed: {e}")
+            self.profile_status_var.set("❌ Profile build failed")
+            messagebox.showerror("Profile Build Error", f"Failed to build GitHub profile:\n{str(e)}")
+            return
         
         self.current_profile = profile
-        self.profile_status_var.set(f"✅ Profile loaded: {username}")
+        self.profile_status_var.set(f"✅ Profile loaded: {profile.username} ({profile.developer_type})")
         self.profile_info_btn.config(state='normal')
+        self._show_cached_content()
+    
+    def _load_existing_profile(self):
+        """Load a previously exported GitHub profile JSON file."""
+        if not self.profile_file_path:
+            messagebox.showwarning("No File Selected", "Please select a profile JSON file.")
+            return
+        
+        try:
+            known_fields = {f.name for f in fields(GitHubProfile)}
+            profile = GitHubProfile(**_read_profile_fields(Path(self.profile_file_path), known_fields))
+            for counter_field in ('frameworks_used', 'databases_used', 'tools_used', 'project_types'):
+                setattr(profile, counter_field, Counter(getattr(profile, counter_field) or {}))
+            
+            self.current_profile = profile
+            self.profile_status_var.set(f"✅ Profile loaded from file: {profile.username or 'unknown user'}")
+            self.profile_info_btn.config(state='normal')
+            self._show_cached_content()
+            
+        except Exception as e:
+            messagebox.showerror("Load Error", f"Failed to load profile file:\n{str(e)}")
+    
+    def _dispatch(self, callback, *args):
+        """Schedule a callback on the Tk thread from a worker thread.
+        
+        Calls are queued and drained together by a single ``after`` event, so
+        a burst of worker updates costs one Tcl round-trip instead of one each.
+        """
+        with self._pending_lock:
+            if self._closed:
+                return
+            self._pending_calls.append((callback, args))
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        
+        try:
+            self._drain_job = self.dialog.after(0, self._drain_dispatch)
+        except (tk.TclError, RuntimeError):
+            # Dialog was closed while the worker was still running
+            pass
+    
+    def _drain_dispatch(self):
+        """Run every queued worker callback on the Tk thread."""
+        with self._pending_lock:
+            calls, self._pending_calls = self._pending_calls, []
+            self._drain_scheduled = False
+            if self._closed:
+                return
+        
+        for callback, args in calls:
+            # Each call used to be its own after() event; keep one failure
+            # from dropping the rest of the batch
+            try:
+                callback(*args)
+            except Exception:
+                self.dialog.report_callback_exception(*sys.exc_info())
+    
+    def cancel_profile_load(self):
+        """Cancel an in-progress profile build."""
+        if self.is_loading_profile:
+            self._cancel.set()
+            self.profile_status_var.set("⏹️ Cancelling profile build...")
     
     def apply_template(self, template_type: str):
         """Apply quick template settings."""
-        templates = {
-            "senior_dev": {
-                "role": "Senior Software Developer",
-                "industry": "Technology",
-                "strategy": "Seeking senior technical leadership roles where I can mentor teams, architect scalable solutions, and drive technical innovation. Passionate about building high-performance applications and leading engineering best practices."
-            },
-            "startup": {
-                "role": "Software Engineer",
-                "industry": "Startup",
-                "strategy": "Looking to join fast-growing startups where I can wear multiple hats, move quickly, and make significant impact. Excited about building products from 0 to 1 and working in dynamic, collaborative environments."
-            },
-            "enterprise": {
-                "role": "Software Developer",
-                "industry": "Enterprise Software",
-                "strategy": "Focused on building robust, enterprise-grade software solutions that scale to millions of users. Interested in large-scale system architecture, security, and working with cross-functional teams."
-            },
-            "academic": {
-                "role": "Research Software Engineer",
-                "industry": "Research",
-                "strategy": "Passionate about applying software engineering to solve complex research problems. Interested in publishing, open-source contributions, and bridging the gap between academic research and practical applications."
-            }
-        }
-        
-        template = templates.get(template_type, {})
+        template = _TEMPLATES.get(template_type)
         if template:
-            self.target_role_var.set(template.get("role", ""))
-            self.target_industry_var.set(template.get("industry", ""))
-            
-            self.content_strategy_text.delete('1.0', tk.END)
-            self.content_strategy_text.insert('1.0', template.get("strategy", ""))
+            self.target_role_var.set(template["role"])
+            self.target_industry_var.set(template["industry"])
+            self.content_strategy_text.replace('1.0', tk.END, template["strategy"])
     
     def generate_linkedin_content(self):
-        """Generate LinkedIn content from profile data."""
+        """Generate LinkedIn content from profile data in a background worker."""
         if not self.current_profile:
             messagebox.showwarning("No Profile", "Please load a GitHub profile first.")
             return
         
+        if self.is_generating:
+            return
+        
+        self.is_generating = True
         self.generation_status_var.set("Generating LinkedIn content...")
         self.generate_btn.config(state='disabled')
-        self.generation_progress.start()
+        self.regenerate_btn.config(state='disabled')
+        self._set_generation_progress(0)
+        
+        # Read the UI on the Tk thread; the worker gets its own config copy
+        cache_key = self._content_cache_key()
+        if self._linkedin_generator is None:
+            self._linkedin_generator = LinkedInGenerator(self.linkedin_config)
+        self._linkedin_generator.config = replace(self.linkedin_config)
+        
+        future = self._executor.submit(self._generate_blocking, self.current_profile)
+        future.add_done_callback(lambda f: self._dispatch(self._on_generation_done, f, cache_key))
+    
+    def _generate_blocking(self, profile: GitHubProfile):
+        """Worker: generate and format the content without touching Tk widgets."""
+        data = self._linkedin_generator.generate_linkedin_profile(
+            profile, on_progress=lambda done, total: self._dispatch(self._on_generation_progress, done, total))
+        return data, _format_results(data)
+    
+    def _on_generation_done(self, future, cache_key: str):
+        """Handle generation completion on the Tk thread."""
+        self.is_generating = False
+        self.generate_btn.config(state='normal')
         
         try:
-            # Update configuration from UI
-            self._update_config_from_ui()
-            
-            # Generate LinkedIn content
-            linkedin_generator = LinkedInGenerator(self.linkedin_config)
-            self.current_linkedin_data = linkedin_generator.generate_linkedin_profile(self.current_profile)
-            
-            # Update UI with results
-            self._update_results_display()
-            
-            # Log completion
-            self._log_generation("✅ LinkedIn content generated successfully!")
-            self.generation_status_var.set("✅ LinkedIn content generated!")
-            self.export_status_var.set("✅ Content ready for export")
-            self.regenerate_btn.config(state='normal')
-            
-            # Switch to results tab
-            self.notebook.select(4)
-            
+            self.current_linkedin_data, formatted = future.result()
         except Exception as e:
             self._log_generation(f"❌ Generation failed: {str(e)}")
             self.generation_status_var.set("❌ Generation failed")
             messagebox.showerror("Generation Error", f"Failed to generate LinkedIn content:\n{str(e)}")
-        
-        finally:
-            self.generate_btn.config(state='normal')
-            self.generation_progress.stop()
-    
-    def _update_config_from_ui(self):
-        """Update LinkedIn configuration from UI values."""
-        self.linkedin_config.tone = self.tone_var.get()
-        self.linkedin_config.length = self.length_var.get()
-        self.linkedin_config.include_emojis = self.include_emojis_var.get()
-        self.linkedin_config.use_first_person = self.first_person_var.get()
-        self.linkedin_config.focus_on_results = self.focus_results_var.get()
-        self.linkedin_config.highlight_leadership = self.highlight_leadership_var.get()
-        self.linkedin_config.emphasize_innovation = self.emphasize_innovation_var.get()
-        self.linkedin_config.include_personal_touches = self.personal_touches_var.get()
-        self.linkedin_config.optimize_for_keywords = self.optimize_keywords_var.get()
-        self.linkedin_config.include_call_to_action = self.include_cta_var.get()
-        self.linkedin_config.mention_open_to_opportunities = self.open_opportunities_var.get()
-        self.linkedin_config.target_role = self.target_role_var.get() or None
-        self.linkedin_config.target_industry = self.target_industry_var.get() or None
-        
-        # Parse comma-separated values
-        self.linkedin_config.personal_brand_keywords = [
-            kw.strip() for kw in self.brand_keywords_var.get().split(',') if kw.strip()
-        ]
-        self.linkedin_config.company_preferences = [
-            comp.strip() for comp in self.company_preferences_var.get().split(',') if comp.strip()
-        ]
-        self.linkedin_config.location_preferences = [
-            loc.strip() for loc in self.location_preferences_var.get().split(',') if loc.strip()
-        ]
-    
-    def _update_results_display(self):
-        """Update the results display with generated content."""
-        if not self.current_linkedin_data:
             return
         
-        data = self.current_linkedin_data
-        
-        # Update headline
-        self.headline_text.delete('1.0', tk.END)
-        self.headline_text.insert('1.0', data.headline)
+        # Update UI with results
+        self._update_results_display(formatted)
+        self._content_cache.put(cache_key, asdict(self.current_linkedin_data))
         
-        # Update summaries
-        self.summary_short_text.delete('1.0', tk.END)
-        self.summary_short_text.insert('1.0', data.summary_short)
+        # Log completion
+        self._log_generation("✅ LinkedIn content generated successfully!")
+        self.generation_status_var.set("✅ LinkedIn content generated!")
+        self.export_status_var.set("✅ Content ready for export")
+        self.regenerate_btn.config(state='normal')
         
-        self.summary_medium_text.delete('1.0', tk.END)
-        self.summary_medium_text.insert('1.0', data.summary)
-        
-        self.summary_long_text.delete('1.0', tk.END)
-        self.summary_long_text.insert('1.0', data.summary_long)
-        
-        # Update skills
-        skills_content = "TOP LINKEDIN SKILLS TO ADD:\n\n"
-        for i, skill in enumerate(data.top_skills[:20], 1):
-            skills_content += f"{i:2d}. {skill}\n"
-        
-        if data.skill_categories:
-            skills_content += "\n\nSKILLS BY CATEGORY:\n\n"
-            for category, skills in data.skill_categories.items():
-                skills_content += f"{category}:\n"
-                for skill in skills:
-                    skills_content += f"  • {skill}\n"
-                skills_content += "\n"
-        
-        self.skills_text.delete('1.0', tk.END)
-        self.skills_text.insert('1.0', skills_content)
-        
-        # Update projects
-        projects_content = "OPTIMIZED PROJECT DESCRIPTIONS:\n\n"
-        for i, project in enumerate(data.project_descriptions, 1):
-            projects_content += f"{i}. {project['name']}\n"
-            projects_content += f"{project['description']}\n"
-            if project.get('achievements'):
-                for achievement in project['achievements']:
-                    projects_content += f"  • {achievement}\n"
-            projects_content += f"Technologies: {', '.join(project.get('technologies', []))}\n\n"
-        
-        self.projects_text.delete('1.0', tk.END)
-        self.projects_text.insert('1.0', projects_content)
-        
-        # Update content ideas
-        post_content = "LINKEDIN POST IDEAS:\n\n"
-        for i, idea in enumerate(data.post_ideas, 1):
-            post_content += f"{i:2d}. {idea}\n\n"
-        
-        self.post_ideas_text.delete('1.0', tk.END)
-        self.post_ideas_text.insert('1.0', post_content)
-        
-        article_content = "LINKEDIN ARTICLE TOPICS:\n\n"
-        for i, topic in enumerate(data.article_topics, 1):
-            article_content += f"{i:2d}. {topic}\n\n"
-        
-        self.article_topics_text.delete('1.0', tk.END)
-        self.article_topics_text.insert('1.0', article_content)
-        
-        # Update networking
-        targets_content = "CONNECTION TARGETS:\n\n"
-        for i, target in enumerate(data.connection_targets, 1):
-            targets_content += f"{i:2d}. {target}\n\n"
-        
-        self.connection_targets_text.delete('1.0', tk.END)
-        self.connection_targets_text.insert('1.0', targets_content)
-        
-        keywords_content = "INDUSTRY KEYWORDS TO USE:\n\n"
-        keywords_content += ", ".join(data.industry_keywords)
-        
-        self.industry_keywords_text.delete('1.0', tk.END)
-        self.industry_keywords_text.insert('1.0', keywords_content)
-        
-        # Update optimization tips
-        tips_content = "PROFILE IMPROVEMENT TIPS:\n\n"
-        for i, tip in enumerate(data.profile_improvement_tips, 1):
-            tips_content += f"{i:2d}. {tip}\n\n"
+        # Switch to results tab
+        self.notebook.select(4)
+    
+    def _content_cache_key(self) -> str:
+        """Cache key for the loaded profile under the current settings."""
+        self._update_config_from_ui()
+        return ContentCache.make_key(self.current_profile.username, self.linkedin_config._as_key())
+    
+    def _show_cached_content(self):
+        """Show content generated in an earlier session for this profile and settings."""
+        payload = self._content_cache.get(self._content_cache_key())
+        if not payload:
+            return
         
-        self.improvement_tips_text.delete('1.0', tk.END)
-        self.improvement_tips_text.insert('1.0', tips_content)
+        try:
+            self.current_linkedin_data = _linkedin_profile_from_dict(payload)
+        except TypeError as e:
+            self.logger.warning(f"Ignoring cached LinkedIn content: {e}")
+            return
         
-        keyword_opt_content = "KEYWORD OPTIMIZATION:\n\n"
-        for i, opt in enumerate(data.keyword_optimization, 1):
-            keyword_opt_content += f"{i:2d}. {opt}\n\n"
+        self._update_results_display()
+        self.generation_status_var.set("📦 Showing content from your last session - generate to refresh")
+        self.export_status_var.set("✅ Content ready for export")
+    
+    def _on_generation_progress(self, done: int, total: int):
+        """Advance the progress bar, redrawing only when the percentage changes."""
+        self._set_generation_progress(100 * done // total)
+    
+    def _set_generation_progress(self, pct: int):
+        if pct == self._progress_pct:
+            return
+        self._progress_pct = pct
+        self.generation_progress.configure(value=pct)
+    
+    def _update_config_from_ui(self):
+        """Bring the list fields of the LinkedIn configuration up to date.
+        
+        Scalar fields are already written by the VarDict trace; the
+        comma-separated entries are synced here too in case a debounced
+        update is still pending.
+        """
+        self._sync_csv_field('personal_brand_keywords', self.brand_keywords_var)
+        self._sync_csv_field('company_preferences', self.company_preferences_var)
+        self._sync_csv_field('location_preferences', self.location_preferences_var)
+    
+    def _sync_csv_field(self, attr: str, var: tk.StringVar):
+        """Copy a comma-separated entry into the matching config list."""
+        setattr(self.linkedin_config, attr, list(_parse_csv(var.get())))
+    
+    def _debounce(self, key: str, delay_ms: int, callback):
+        """Run callback after delay_ms, restarting the timer on each call."""
+        job = self._debounce_jobs.pop(key, None)
+        if job:
+            self.dialog.after_cancel(job)
+        self._debounce_jobs[key] = self.dialog.after(delay_ms, self._run_debounced, key, callback)
+    
+    def _run_debounced(self, key: str, callback):
+        self._debounce_jobs.pop(key, None)
+        callback()
+    
+    def _update_results_display(self, formatted: Optional[Dict[str, str]] = None):
+        """Update the results display with generated content.
+
+        Each result widget is filled with a single ``replace`` so Tk lays it
+        out once, and is left read-only afterwards. ``formatted`` is the
+        output of ``_format_results`` when the worker already rendered it.
+        """
+        if not self.current_linkedin_data:
+            return
         
-        self.keyword_optimization_text.delete('1.0', tk.END)
-        self.keyword_optimization_text.insert('1.0', keyword_opt_content)
+        self._ensure_tab(4)
+        if formatted is None:
+            formatted = _format_results(self.current_linkedin_data)
+        # Unbuilt sub-tabs pick their text up from _result_content when first shown
+        self._result_content = formatted
+        for index in self._results_built:
+            for widget_name in _RESULT_PANES[index]:
+                self._set_section(widget_name, formatted[widget_name])
+    
+    def _set_section(self, widget_name: str, content: str):
+        """Fill a result pane unless it already shows ``content``."""
+        digest = hash(content)
+        if self._section_hashes.get(widget_name) == digest:
+            return
+        self._section_hashes[widget_name] = digest
+        _set_text(getattr(self, widget_name), content)
     
     def copy_text(self, text_widget):
         """Copy text from widget to clipboard."""
         try:
-            content = text_widget.get('1.0', tk.END).strip()
+            if isinstance(text_widget, _ReadOnlyText):
+                content = text_widget.contents().strip()
+            else:
+                content = text_widget.get('1.0', 'end-1c').strip()
             self.dialog.clipboard_clear()
-            self.dialog.clipboard_append(content)
-            self.dialog.update()
-            messagebox.showinfo("Copied", "Content copied to clipboard!")
+            # Large single appends are slow on some clipboards; feed it in chunks
+            for start in range(0, len(content), _CLIPBOARD_CHUNK):
+                self.dialog.clipboard_append(content[start:start + _CLIPBOARD_CHUNK])
+            self._toast_show("Copied!")
         except Exception as e:
             messagebox.showerror("Copy Error", f"Failed to copy content:\n{str(e)}")
     
-    def _log_generation(self, message: str):
-        """Log generation message."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.generation_log.insert(tk.END, f"[{timestamp}] {message}\n")
+    def _toast_show(self, message: str):
+        """Show a short-lived message without opening a modal dialog."""
+        self._toast.config(text=message)
+        self._toast.place(relx=0.5, rely=0.95, anchor='s')
+        if self._toast_job is not None:
+            self.dialog.after_cancel(self._toast_job)
+        self._toast_job = self.dialog.after(1200, self._toast_hide)
+    
+    def _toast_hide(self):
+        self._toast_job = None
+        self._toast.place_forget()
+    
+    def _log_generation(self, *messages: str):
+        """Log one or more generation messages with a single insert."""
+        now = time.localtime()
+        timestamp = f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
+        self._append_log(''.join(f"[{timestamp}] {message}\n" for message in messages))
+    
+    def _append_log(self, text: str):
+        """Append pre-formatted text to the generation log."""
+        self._ensure_tab(3)
+        self.generation_log.configure(state='normal')
+        self.generation_log.insert(tk.END, text)
+        self.generation_log.configure(state='disabled')
+        if self._log_job is None:
+            self._log_job = self.dialog.after(50, self._flush_log)
+    
+    def _flush_log(self):
+        """Scroll the generation log once for a burst of appended lines."""
+        self._log_job = None
         self.generation_log.see(tk.END)
-        self.dialog.update()
+        self.dialog.update_idletasks()
     
     def regenerate_content(self):
         """Regenerate content with current settings."""
@@ -1001,15 +1475,11 @@ class LinkedInGeneratorDialog:
         )
         
         if file_path:
-            try:
-                exporter = LinkedInExporter(self.current_linkedin_data)
-                exporter.export_to_text(file_path)
-                
-                messagebox.showinfo("Export Success", f"LinkedIn guide exported to:\n{file_path}")
-                self._log_generation(f"✅ Text guide exported to {file_path}")
-                
-            except Exception as e:
-                messagebox.showerror("Export Error", f"Failed to export guide:\n{str(e)}")
+            exporter = LinkedInExporter(self.current_linkedin_data)
+            future = self._executor.submit(exporter.export_to_text, file_path)
+            future.add_done_callback(lambda f: self._dispatch(
+                self._on_export_done, f, f"LinkedIn guide exported to:\n{file_path}",
+                f"✅ Text guide exported to {file_path}", "Failed to export guide"))
     
     def export_json_data(self):
         """Export JSON data."""
@@ -1025,15 +1495,22 @@ class LinkedInGeneratorDialog:
         )
         
         if file_path:
-            try:
-                exporter = LinkedInExporter(self.current_linkedin_data)
-                exporter.export_to_json(file_path)
-                
-                messagebox.showinfo("Export Success", f"LinkedIn data exported to:\n{file_path}")
-                self._log_generation(f"✅ JSON data exported to {file_path}")
-                
-            except Exception as e:
-                messagebox.showerror("Export Error", f"Failed to export data:\n{str(e)}")
+            exporter = LinkedInExporter(self.current_linkedin_data)
+            future = self._executor.submit(exporter.export_to_json, file_path)
+            future.add_done_callback(lambda f: self._dispatch(
+                self._on_export_done, f, f"LinkedIn data exported to:\n{file_path}",
+                f"✅ JSON data exported to {file_path}", "Failed to export data"))
+    
+    def _on_export_done(self, future, success_message: str, log_message: str, error_message: str):
+        """Report a background export on the Tk thread."""
+        try:
+            future.result()
+        except Exception as e:
+            messagebox.showerror("Export Error", f"{error_message}:\n{str(e)}")
+            return
+        
+        messagebox.showinfo("Export Success", success_message)
+        self._log_generation(log_message)
     
     def export_action_plan(self):
         """Export action plan for LinkedIn optimization."""
@@ -1046,27 +1523,17 @@ class LinkedInGeneratorDialog:
     
     def open_output_folder(self):
         """Open output folder."""
-        output_dir = Path.home() / "linkedin_content"
-        output_dir.mkdir(exist_ok=True)
-        
-        import subprocess
-        import platform
+        _OUTPUT_DIR.mkdir(exist_ok=True)
         
         try:
-            if platform.system() == "Windows":
-                os.startfile(str(output_dir))
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.call(["open", str(output_dir)])
-            else:  # Linux
-                subprocess.call(["xdg-open", str(output_dir)])
+            _open_folder(str(_OUTPUT_DIR))
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open folder:\n{str(e)}")
     
     def save_settings(self):
         """Save current settings."""
         try:
-            settings_dir = Path.home() / '.reporeadme'
-            settings_dir.mkdir(exist_ok=True)
+            _SETTINGS_DIR.mkdir(exist_ok=True)
             
             settings = {
                 'github_username': self.github_username_var.get(),
@@ -1080,9 +1547,7 @@ class LinkedInGeneratorDialog:
                 'location_preferences': self.location_preferences_var.get()
             }
             
-            settings_file = settings_dir / 'linkedin_generator_settings.json'
-            with settings_file.open('w') as f:
-                json.dump(settings, f, indent=2)
+            _SETTINGS_FILE.write_bytes(_dumps(settings))
             
             messagebox.showinfo("Settings Saved", "Settings have been saved successfully!")
             
@@ -1092,10 +1557,8 @@ class LinkedInGeneratorDialog:
     def load_settings(self):
         """Load saved settings."""
         try:
-            settings_file = Path.home() / '.reporeadme' / 'linkedin_generator_settings.json'
-            if settings_file.exists():
-                with settings_file.open('r') as f:
-                    settings = json.load(f)
+            if _SETTINGS_FILE.exists():
+                settings = _loads(_SETTINGS_FILE.read_bytes())
                 
                 self.github_username_var.set(settings.get('github_username', ''))
                 self.github_token_var.set(settings.get('github_token', ''))
@@ -1112,6 +1575,17 @@ class LinkedInGeneratorDialog:
     
     def close_dialog(self):
         """Close the dialog."""
+        self._cancel.set()
+        self._executor.shutdown(wait=False)
+        with self._pending_lock:
+            # Late worker callbacks are dropped instead of touching destroyed widgets
+            self._closed = True
+            self._pending_calls = []
+        for job in (self._drain_job, self._toast_job, self._log_job, *self._debounce_jobs.values()):
+            if job is not None:
+                self.dialog.after_cancel(job)
+        self._debounce_jobs.clear()
+        self._content_cache.close()
         self.dialog.destroy()
 
 
@@ -7,25 +7,235 @@ in the RepoReadme application. Provides sophisticated bio enhancement,
 content optimization, and natural language generation.
 """
 
+import asyncio
+import functools
+import heapq
 import json
+import aiohttp
 import requests
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from collections import Counter
+from typing import Callable, Dict, FrozenSet, List, Optional, Any, Tuple
+from dataclasses import dataclass, asdict, field, replace
 import time
+import random
+import re
 import ssl
+import threading
 import urllib3
-from urllib3.util.retry import Retry
+from email.utils import parsedate_to_datetime
 from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     from .utils.logger import get_logger
+    from .utils.bio_cache import BioResponseCache
+    from .utils.keyword_matcher import KeywordMatcher
     from .config.settings import SettingsManager
 except ImportError:
     from utils.logger import get_logger
+    from utils.bio_cache import BioResponseCache
+    from utils.keyword_matcher import KeywordMatcher
     from config.settings import SettingsManager
 
 
-@dataclass
+# Headers sent with every OpenRouter API request besides Authorization
+_STATIC_HEADERS = {
+    "Content-Type": "application/json",
+    "HTTP-Referer": "https://github.com/dev-alt/RepoReadme",
+    "X-Title": "RepoReadme AI Bio Generator"
+}
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json_loads(data) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Price of cached prompt tokens relative to the normal input price, as
+# (read, write) per provider; others are billed at the full input rate
+_CACHE_PRICE_MULTIPLIERS = {
+    "anthropic/": (0.1, 1.25),
+    "openai/": (0.5, 1.0),
+}
+_NO_CACHE_DISCOUNT = (1.0, 1.0)
+
+
+@functools.lru_cache(maxsize=16)
+def _token_encoding(model_id: str):
+    """tiktoken encoding for an OpenRouter model id, cl100k_base when tiktoken does not know it.
+    
+    None when tiktoken is missing or cannot load the encoding; tiktoken
+    downloads encoding files on first use, which fails offline.
+    """
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model_id.split('/', 1)[-1])
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+# What each model is recommended for in get_model_recommendations
+_MODEL_USE_CASES = {
+    "anthropic/claude-sonnet-4.5": "Premium content with exceptional reasoning",
+    "anthropic/claude-3-opus": "Highest quality creative writing",
+    "openai/gpt-4-turbo": "Professional content with reliability",
+    "anthropic/claude-3-sonnet": "Balanced quality and cost",
+    "deepseek/deepseek-v3.2-exp": "Technical content, excellent value",
+    "google/gemini-2.5-flash": "Fast, cost-effective generation",
+    "anthropic/claude-3-haiku": "Budget-friendly, reliable quality",
+    "openai/gpt-3.5-turbo": "Standard professional content",
+    "meta-llama/llama-3-8b-instruct": "Very cost-effective, good quality"
+}
+
+# Models tried in order by suggest_optimal_model for each budget preference
+_COST_EFFECTIVE_MODELS = (
+    "meta-llama/llama-3-8b-instruct",
+    "google/gemini-2.5-flash",
+    "anthropic/claude-3-haiku",
+    "deepseek/deepseek-v3.2-exp"
+)
+_PREMIUM_MODELS = (
+    "anthropic/claude-sonnet-4.5",
+    "openai/gpt-4-turbo",
+    "anthropic/claude-3-opus",
+    "openai/gpt-4"
+)
+_BALANCED_MODELS_BY_STYLE = {
+    "creative": ("anthropic/claude-3-sonnet", "openai/gpt-3.5-turbo", "google/gemini-2.5-flash"),
+    "technical": ("deepseek/deepseek-v3.2-exp", "anthropic/claude-3-sonnet", "meta-llama/llama-3-8b-instruct")
+}
+_BALANCED_DEFAULT_MODELS = ("anthropic/claude-3-haiku", "google/gemini-2.5-flash", "meta-llama/llama-3-8b-instruct")
+
+# Base quality scores for each model (subjective, based on general performance)
+_MODEL_BASE_SCORES = {
+    "anthropic/claude-sonnet-4.5": 95,
+    "anthropic/claude-3-opus": 92,
+    "openai/gpt-4-turbo": 90,
+    "openai/gpt-4": 88,
+    "anthropic/claude-3-sonnet": 85,
+    "deepseek/deepseek-v3.2-exp": 82,
+    "google/gemini-2.5-flash": 80,
+    "anthropic/claude-3-haiku": 78,
+    "openai/gpt-3.5-turbo": 75,
+    "meta-llama/llama-3-70b-instruct": 73,
+    "meta-llama/llama-3-8b-instruct": 70
+}
+
+# Per-style quality adjustments on top of the base scores
+_STYLE_MODEL_ADJUSTMENTS = {
+    "creative": {
+        "anthropic/claude-3-opus": 8,
+        "anthropic/claude-sonnet-4.5": 6,
+        "openai/gpt-4-turbo": 5,
+        "anthropic/claude-3-sonnet": 4
+    },
+    "technical": {
+        "deepseek/deepseek-v3.2-exp": 8,
+        "anthropic/claude-sonnet-4.5": 6,
+        "openai/gpt-4-turbo": 5,
+        "meta-llama/llama-3-8b-instruct": 3
+    },
+    "professional": {
+        "anthropic/claude-3-sonnet": 5,
+        "openai/gpt-3.5-turbo": 4,
+        "anthropic/claude-3-haiku": 3
+    }
+}
+
+
+def _model_quality_score(model_id: str, adjustments: Dict[str, int]) -> float:
+    """Base quality of ``model_id`` plus its entry in one style's ``adjustments``, capped at 100."""
+    return min(100, _MODEL_BASE_SCORES.get(model_id, 70) + adjustments.get(model_id, 0))
+
+
+@functools.lru_cache(maxsize=8)
+def _model_value_rows(style: str) -> Tuple[Tuple[str, float, float, float], ...]:
+    """``(model_id, bio cost, quality score, value score)`` for every priced model.
+    
+    The pricing tables are fixed at import, so the rows for a style are
+    worked out once and shared by the recommendation, budget and
+    cost-vs-quality views. The value score is quality per cent of cost.
+    """
+    adjustments = _STYLE_MODEL_ADJUSTMENTS.get(style, {})
+    rows = []
+    for model_id, estimated_cost in _BIO_COSTS.items():
+        quality_score = _model_quality_score(model_id, adjustments)
+        rows.append((model_id, estimated_cost, quality_score, quality_score / (estimated_cost * 1000)))
+    return tuple(rows)
+
+
+# Tones cycled through by generate_bio_alternatives
+_STYLE_VARIATIONS = ("professional", "creative", "technical", "conversational", "executive")
+
+# Status codes retried with jittered backoff, and the backoff bounds in seconds
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+_MAX_RETRIES = 3
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 30.0
+
+# Refused or failed connections retried by the session's adapter
+_CONNECT_RETRIES = 2
+
+
+def _retry_after_seconds(headers) -> Optional[float]:
+    """Seconds requested by a Retry-After header (delay or HTTP date), or None."""
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _backoff_delay(retry: int, headers) -> float:
+    """Jittered exponential wait before retry number ``retry``, at least Retry-After, capped."""
+    delay = random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** retry))
+    retry_after = _retry_after_seconds(headers)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return min(delay, _RETRY_MAX_DELAY)
+
+
+def _jaccard_similarity(a: set, b: set) -> float:
+    """Jaccard index of two word sets, 0 when both are empty; sizes the union without building it."""
+    overlap = len(a & b)
+    total = len(a) + len(b) - overlap
+    return overlap / total if total > 0 else 0
+
+
+# Providers whose models accept the OpenAI /files + /batches JSONL protocol
+# used by _abatch_api_requests
+_BATCH_API_PROVIDERS = ("openai/",)
+_BATCH_POLL_MAX_DELAY = 60.0
+
+
+@dataclass(frozen=True, slots=True)
 class ModelPricing:
     """Pricing information for OpenRouter models."""
     
@@ -38,17 +248,166 @@ class ModelPricing:
     provider: str
     latency: float = 0.0  # Average latency in seconds
     
+    # Per-token prices derived from the per-1K prices
+    input_price_per_token: float = field(init=False, repr=False, compare=False)
+    output_price_per_token: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "input_price_per_token", self.input_price_per_1k * 0.001)
+        object.__setattr__(self, "output_price_per_token", self.output_price_per_1k * 0.001)
+    
     def estimate_cost(self, input_tokens: int, output_tokens: int) -> float:
         """Estimate cost for given token usage."""
-        input_cost = (input_tokens / 1000) * self.input_price_per_1k
-        output_cost = (output_tokens / 1000) * self.output_price_per_1k
-        return input_cost + output_cost
+        return input_tokens * self.input_price_per_token + output_tokens * self.output_price_per_token
     
     def estimate_bio_cost(self) -> float:
         """Estimate cost for typical bio enhancement (500 input, 300 output tokens)."""
         return self.estimate_cost(500, 300)
 
 
+# Pricing for the models offered in the GUI, shared by every service instance
+_MODEL_PRICING: Dict[str, ModelPricing] = {
+    # OpenAI Models
+    "openai/gpt-3.5-turbo": ModelPricing(
+        model_name="GPT-3.5 Turbo",
+        input_price_per_1k=0.0015,
+        output_price_per_1k=0.002,
+        context_length=16385,
+        max_output=4096,
+        description="Fast, cost-effective, great for most use cases",
+        provider="OpenAI",
+        latency=1.2
+    ),
+    "openai/gpt-4": ModelPricing(
+        model_name="GPT-4",
+        input_price_per_1k=0.03,
+        output_price_per_1k=0.06,
+        context_length=8192,
+        max_output=4096,
+        description="High quality, better reasoning, more expensive",
+        provider="OpenAI",
+        latency=2.8
+    ),
+    "openai/gpt-4-turbo": ModelPricing(
+        model_name="GPT-4 Turbo",
+        input_price_per_1k=0.01,
+        output_price_per_1k=0.03,
+        context_length=128000,
+        max_output=4096,
+        description="Latest GPT-4 with improved performance and larger context",
+        provider="OpenAI",
+        latency=2.1
+    ),
+
+    # Anthropic Claude Models
+    "anthropic/claude-3-haiku": ModelPricing(
+        model_name="Claude 3 Haiku",
+        input_price_per_1k=0.00025,
+        output_price_per_1k=0.00125,
+        context_length=200000,
+        max_output=4096,
+        description="Fast Claude model, excellent value",
+        provider="Anthropic",
+        latency=0.8
+    ),
+    "anthropic/claude-3-sonnet": ModelPricing(
+        model_name="Claude 3 Sonnet",
+        input_price_per_1k=0.003,
+        output_price_per_1k=0.015,
+        context_length=200000,
+        max_output=4096,
+        description="High-quality Claude, excellent writing",
+        provider="Anthropic",
+        latency=1.5
+    ),
+    "anthropic/claude-3-opus": ModelPricing(
+        model_name="Claude 3 Opus",
+        input_price_per_1k=0.015,
+        output_price_per_1k=0.075,
+        context_length=200000,
+        max_output=4096,
+        description="Most capable Claude model",
+        provider="Anthropic",
+        latency=2.3
+    ),
+    "anthropic/claude-sonnet-4.5": ModelPricing(
+        model_name="Claude Sonnet 4.5",
+        input_price_per_1k=0.003,  # ≤200K tokens
+        output_price_per_1k=0.015,  # ≤200K tokens
+        context_length=1000000,
+        max_output=64000,
+        description="Latest Claude with 1M context, exceptional reasoning",
+        provider="Anthropic",
+        latency=2.5
+    ),
+
+    # Meta Llama Models
+    "meta-llama/llama-3-8b-instruct": ModelPricing(
+        model_name="Llama 3 8B Instruct",
+        input_price_per_1k=0.0001,
+        output_price_per_1k=0.0001,
+        context_length=8192,
+        max_output=2048,
+        description="Open source, fast, very cost-effective",
+        provider="Meta",
+        latency=0.6
+    ),
+    "meta-llama/llama-3-70b-instruct": ModelPricing(
+        model_name="Llama 3 70B Instruct",
+        input_price_per_1k=0.0009,
+        output_price_per_1k=0.0009,
+        context_length=8192,
+        max_output=2048,
+        description="Larger Llama model, better quality",
+        provider="Meta",
+        latency=1.8
+    ),
+
+    # DeepSeek Models
+    "deepseek/deepseek-v3.2-exp": ModelPricing(
+        model_name="DeepSeek V3.2 Exp",
+        input_price_per_1k=0.00027,
+        output_price_per_1k=0.00041,
+        context_length=163800,
+        max_output=65500,
+        description="Advanced reasoning model, excellent value",
+        provider="DeepSeek",
+        latency=0.9
+    ),
+
+    # Google Gemini Models
+    "google/gemini-2.5-flash": ModelPricing(
+        model_name="Gemini 2.5 Flash",
+        input_price_per_1k=0.0003,
+        output_price_per_1k=0.0025,
+        context_length=1050000,
+        max_output=65500,
+        description="Ultra-fast Google model with massive context",
+        provider="Google",
+        latency=0.4
+    ),
+}
+
+# Typical bio cost per model, read by the model ranking and budget scans
+_BIO_COSTS: Dict[str, float] = {
+    model_id: pricing.estimate_bio_cost()
+    for model_id, pricing in _MODEL_PRICING.items()
+}
+
+# Display rows for get_all_models_with_pricing, cheapest first
+_MODELS_SORTED_BY_COST = tuple(
+    (
+        model_id,
+        _MODEL_PRICING[model_id].model_name,
+        _MODEL_PRICING[model_id].description,
+        f"${_BIO_COSTS[model_id]:.4f}",
+        _MODEL_PRICING[model_id].provider,
+        f"{_MODEL_PRICING[model_id].latency:.1f}s"
+    )
+    for model_id in sorted(_BIO_COSTS, key=_BIO_COSTS.get)
+)
+
+
 @dataclass
 class OpenRouterConfig:
     """Configuration for OpenRouter API."""
@@ -64,6 +423,16 @@ class OpenRouterConfig:
     improve_readability: bool = True
     optimize_keywords: bool = True
     add_personality: bool = True
+    
+    # Reuse the stored result when the same bio is sent again with the same settings
+    use_response_cache: bool = False
+    
+    # Give up on a batch job and fall back to direct requests after this long
+    batch_timeout: float = 900.0
+    
+    # Caps for concurrent async requests; 0 requests_per_minute means no rate cap
+    max_concurrency: int = 8
+    requests_per_minute: int = 0
 
 
 @dataclass
@@ -90,6 +459,13 @@ class EnhancementRequest:
             self.project_highlights = []
         if self.technical_achievements is None:
             self.technical_achievements = []
+    
+    @property
+    def context_key(self) -> Tuple:
+        """The fields the prompt's context section is built from, as a hashable key."""
+        return (self.github_username, tuple(self.primary_languages[:5]),
+                tuple(self.project_highlights), tuple(self.technical_achievements[:3]),
+                self.target_role, self.target_industry)
 
 
 @dataclass
@@ -128,20 +504,468 @@ class EnhancementResult:
             self.cost_breakdown = {}
 
 
+# Tone guidance for each bio style, see _get_style_specific_instructions
+_STYLE_GUIDES = {
+    "professional": """
+• Tone: Confident, accomplished, approachable
+• Language: Clear, direct, industry-appropriate
+• Structure: Achievement-focused with quantifiable results
+• Voice: Third-person perspective, authoritative but humble
+• Keywords: Leadership, expertise, results, innovation
+• Avoid: Overly casual language, buzzword overload""",
+    
+    "creative": """
+• Tone: Innovative, passionate, authentic
+• Language: Vivid, engaging, story-driven
+• Structure: Journey narrative with creative metaphors
+• Voice: First-person, personal yet professional
+• Keywords: Innovation, creativity, vision, impact
+• Avoid: Corporate jargon, overly formal language""",
+    
+    "technical": """
+• Tone: Precise, knowledgeable, solution-oriented
+• Language: Technical accuracy with accessibility
+• Structure: Problem-solution focused with metrics
+• Voice: Expert practitioner, thought leader
+• Keywords: Architecture, scalability, optimization, systems
+• Avoid: Non-technical fluff, generic statements""",
+    
+    "executive": """
+• Tone: Strategic, visionary, results-driven
+• Language: Business-focused, outcome-oriented
+• Structure: Vision → execution → impact → future
+• Voice: Thought leader, change agent
+• Keywords: Strategy, transformation, growth, leadership
+• Avoid: Operational details, technical jargon""",
+    
+    "startup": """
+• Tone: Energetic, agile, growth-minded
+• Language: Fast-paced, opportunity-focused
+• Structure: Problem → solution → traction → vision
+• Voice: Builder, innovator, risk-taker
+• Keywords: Scale, disruption, innovation, growth
+• Avoid: Corporate bureaucracy language, slow/safe terminology"""
+}
+
+# What each enhancement_type asks the model to do
+_ENHANCEMENT_APPROACHES = {
+    "improve": "Transform this bio into a compelling narrative that showcases expertise while maintaining authenticity. Enhance clarity, impact, and professional appeal.",
+    "rewrite": "Completely reimagine this bio with fresh perspective, better flow, and stronger positioning. Create a new narrative structure while preserving core achievements.",
+    "optimize": "Engineer this bio for maximum LinkedIn visibility and engagement. Focus on keyword optimization, algorithm-friendly structure, and recruiter appeal.",
+    "personalize": "Inject authentic personality and unique voice while maintaining professional standards. Make it memorable and distinctly human."
+}
+
+# Who reads bios in each industry
+_TARGET_AUDIENCES = {
+    "technology": "CTOs, Engineering Managers, Tech Recruiters, Startup Founders",
+    "fintech": "Finance Leaders, Risk Managers, Fintech Recruiters, Investment Partners",
+    "healthcare": "Healthcare CIOs, Medical Directors, Health Tech Recruiters",
+    "ecommerce": "E-commerce Leaders, Product Managers, Digital Marketing Directors",
+    "gaming": "Game Studio Leaders, Creative Directors, Gaming Industry Recruiters",
+    "ai_ml": "AI Research Leaders, Data Science Managers, ML Engineering Directors"
+}
+
+# Models that excel at iterative and creative tasks, by target style
+_ITERATIVE_MODELS = {
+    "creative": "anthropic/claude-3-opus",  # Best for creative iteration
+    "technical": "anthropic/claude-sonnet-4.5",  # Best for technical precision
+    "professional": "openai/gpt-4-turbo",  # Good balance for professional content
+    "executive": "anthropic/claude-3-sonnet",  # Strategic thinking
+    "startup": "google/gemini-2.5-flash"  # Fast and energetic
+}
+
+# Keywords worth working into a bio for each industry
+_INDUSTRY_KEYWORDS = {
+    "technology": "software engineering, scalability, architecture, DevOps, cloud",
+    "fintech": "financial technology, compliance, risk management, payments, blockchain",
+    "healthcare": "healthcare technology, patient care, medical software, HIPAA, clinical",
+    "ecommerce": "e-commerce, conversion optimization, customer experience, analytics",
+    "gaming": "game development, user engagement, monetization, player experience",
+    "ai_ml": "artificial intelligence, machine learning, data science, automation"
+}
+
+# Offline fallback bios by style, filled in by _template_based_enhancement
+_FALLBACK_TEMPLATES = {
+    "professional": """
+Experienced {target_role} with expertise in {languages}. Proven track record of delivering high-quality solutions and driving technical excellence in {target_industry}.
+
+Key accomplishments include {achievements} through projects like {projects}. Skilled in building scalable applications and leading technical initiatives that deliver measurable business value.
+
+Passionate about innovation and continuous learning, with a focus on leveraging cutting-edge technologies to solve complex challenges. Always seeking opportunities to collaborate with talented teams and contribute to impactful projects.
+
+Let's connect to discuss {target_industry} opportunities and technical collaboration.""",
+
+    "creative": """
+I'm a {target_role} who loves turning ideas into reality through code! 🚀
+
+My toolkit includes {languages}, and I've had the pleasure of building {projects}. What drives me is the opportunity to create solutions that make a real difference.
+
+Some highlights from my journey: {achievements}. Each project has taught me something new and pushed me to grow as both a developer and a problem-solver.
+
+When I'm not coding, you'll find me exploring new technologies and contributing to the {target_industry} community. I believe the best software comes from passionate people working together.
+
+Always excited to connect with fellow creators and innovators! Let's build something amazing together. ✨""",
+
+    "technical": """
+Senior {target_role} specializing in {languages} with focus on scalable architecture and system optimization.
+
+Technical expertise includes {achievements} across projects involving {projects}. Experience spans full-stack development, performance optimization, and building robust systems that handle scale.
+
+Core competencies:
+• Architecture design and implementation
+• Performance optimization and scalability
+• Code quality and engineering best practices
+• Technical leadership and mentorship
+
+Committed to engineering excellence and continuous improvement. Open to discussing technical challenges, architecture decisions, and engineering opportunities in {target_industry}."""
+}
+
+
+# Keywords scored by the _evaluate_*_style methods, matched as substrings of the lowercased bio
+_PROFESSIONAL_INDUSTRY_KW = frozenset(('experience', 'expertise', 'professional', 'results', 'successful', 'proven'))
+_PROFESSIONAL_ENGAGEMENT_KW = frozenset(('passionate', 'driven', 'committed', 'focused', 'dedicated'))
+_CREATIVE_INDICATOR_KW = frozenset(('innovative', 'creative', 'passionate', 'vision', 'imagination', 'artistic'))
+_CREATIVE_METAPHOR_KW = frozenset(('journey', 'craft', 'build', 'create', 'design', 'architect'))
+_CREATIVE_AUTHENTICITY_KW = frozenset(('love', 'enjoy', 'excited', 'believe', 'dream', 'inspire'))
+_CREATIVE_EMOJIS = frozenset('✨🚀💡')  # Single code points, so a set of characters
+_TECHNICAL_KW = frozenset(('architecture', 'scalability', 'optimization', 'performance', 'systems', 'algorithms'))
+_TECHNICAL_PROBLEM_SOLVING_KW = frozenset(('solved', 'optimized', 'improved', 'designed', 'architected', 'built', 'implemented'))
+_TECHNICAL_STANDARDS_KW = frozenset(('best practices', 'standards', 'methodologies', 'frameworks', 'protocols'))
+_EXECUTIVE_VISION_KW = frozenset(('strategy', 'vision', 'transformation', 'growth', 'innovation', 'leadership'))
+_EXECUTIVE_LEADERSHIP_KW = frozenset(('led', 'managed', 'directed', 'guided', 'mentored', 'built teams'))
+_EXECUTIVE_BUSINESS_KW = frozenset(('revenue', 'growth', 'roi', 'efficiency', 'scale', 'market'))
+_STARTUP_INNOVATION_KW = frozenset(('innovative', 'disruption', 'startup', 'entrepreneur', 'agile', 'rapid'))
+_STARTUP_GROWTH_KW = frozenset(('scale', 'growth', 'launch', 'built', 'shipped', '0 to'))
+_STARTUP_MULTI_ROLE_KW = frozenset(('full-stack', 'end-to-end', 'product', 'business'))
+
+# Project type indicators checked by _infer_project_types, in reporting order
+_PROJECT_TYPE_KEYWORDS = (
+    ("Web Applications", frozenset(("web", "app", "site", "dashboard", "portal", "frontend", "react", "vue"))),
+    ("APIs & Backend", frozenset(("api", "backend", "server", "service", "rest", "graphql", "microservice"))),
+    ("Data & Analytics", frozenset(("data", "analytics", "dashboard", "visualization", "ml", "ai", "analysis"))),
+    ("Mobile Development", frozenset(("mobile", "ios", "android", "flutter", "react-native", "app"))),
+    ("DevOps & Tools", frozenset(("cli", "tool", "automation", "deploy", "docker", "kubernetes", "ci"))),
+    ("Libraries & Frameworks", frozenset(("library", "framework", "package", "sdk", "component"))),
+    ("Games & Entertainment", frozenset(("game", "bot", "entertainment", "fun", "interactive"))),
+    ("Blockchain & Crypto", frozenset(("blockchain", "crypto", "defi", "nft", "ethereum", "bitcoin"))),
+)
+_PROJECT_TYPE_MATCHER = KeywordMatcher(
+    keyword for _, keywords in _PROJECT_TYPE_KEYWORDS for keyword in keywords)
+
+# Focus areas read from achievement text; substrings, so "users" and "scaled" count
+_ACHIEVEMENT_FOCUS_KEYWORDS = (
+    ("Community Impact", ("star", "fork", "community", "open source")),
+    ("Performance Optimization", ("performance", "optimization", "speed", "efficiency")),
+    ("Scalability & Growth", ("scale", "growth", "user", "traffic")),
+    ("Innovation Leadership", ("innovation", "new", "first", "pioneering")),
+    ("Technical Leadership", ("team", "lead", "mentor", "manage")),
+)
+
+# Developer profile signals in primary languages and project text
+_FRONTEND_LANGS = frozenset(("javascript", "typescript", "html", "css", "react", "vue", "angular"))
+_BACKEND_LANGS = frozenset(("python", "java", "go", "c#", "rust", "php", "ruby", "node.js"))
+_MOBILE_LANGS = frozenset(("swift", "kotlin", "dart", "java", "objective-c"))
+_MODERN_LANGS = frozenset(("typescript", "go", "rust", "kotlin", "swift", "python"))
+_PROJECT_PROFILE_KEYWORDS = (
+    ("Open source contributor", ("open", "source", "community")),
+    ("Product-focused engineer", ("startup", "business", "product")),
+    ("Enterprise-scale developer", ("enterprise", "large", "scale")),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CategorySpec:
+    """One weighted category of a bio style score.
+    
+    A category's points are the sum of its ``analysis_checks`` (each called
+    with the bio and its text analysis) followed by ``points`` for every
+    keyword of each ``keyword_groups`` entry found in the bio, capped at 100.
+    """
+    
+    name: str
+    weight: float
+    keyword_groups: Tuple[Tuple[FrozenSet[str], int], ...] = ()
+    analysis_checks: Tuple[Callable[[str, Dict[str, Any]], float], ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class StyleSpec:
+    """How bios are scored and judged for one target style."""
+    
+    categories: Tuple[CategorySpec, ...]
+    feedback: Tuple[Tuple[str, float, str], ...]  # (category, score below which it applies, message)
+    compliant_score: float
+    compliant_label: str
+    needs_work_label: str
+    
+    # All keywords of the style, so a bio is scanned once for every category
+    matcher: KeywordMatcher = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "matcher", KeywordMatcher(
+            keyword for category in self.categories
+            for keywords, _ in category.keyword_groups for keyword in keywords))
+
+
+def _score_presence(hits: Counter, keywords: FrozenSet[str], per_hit: int, cap: int = 100) -> int:
+    """``per_hit`` points for every one of ``keywords`` found in ``hits``, up to ``cap``."""
+    return min(cap, per_hit * sum(1 for keyword in keywords if keyword in hits))
+
+
+def _clarity_points(bio: str, analysis: Dict[str, Any]) -> float:
+    """Full marks for 15-20 words per sentence, falling off outside that range."""
+    words_per_sentence = analysis['avg_words_per_sentence']
+    if 15 <= words_per_sentence <= 20:
+        return 40
+    return max(0, 40 - abs(words_per_sentence - 17.5) * 2)
+
+
+def _quantified_results_points(bio: str, analysis: Dict[str, Any]) -> float:
+    number_count = analysis['number_count']
+    if number_count >= 3:
+        return 100
+    if number_count >= 2:
+        return 70
+    return 40 if number_count >= 1 else 0
+
+
+# Scoring tables of evaluate_bio_by_style; categories are listed in overall-score order
+_STYLE_REGISTRY: Dict[str, StyleSpec] = {
+    "professional": StyleSpec(
+        categories=(
+            CategorySpec('authority', 0.3, analysis_checks=(
+                lambda bio, a: 40 if a['professional_count'] >= 2 else 0,
+                lambda bio, a: 30 if a['number_count'] >= 2 else 0,
+                lambda bio, a: 30 if a['action_verbs'] >= 3 else 0)),
+            CategorySpec('clarity', 0.25, analysis_checks=(
+                _clarity_points,
+                lambda bio, a: 35 if 180 <= a['word_count'] <= 280 else 0,
+                lambda bio, a: 25 if a['sentence_variety'] > 3 else 0)),
+            CategorySpec('relevance', 0.2, keyword_groups=((_PROFESSIONAL_INDUSTRY_KW, 20),)),
+            CategorySpec('engagement', 0.15, keyword_groups=((_PROFESSIONAL_ENGAGEMENT_KW, 25),)),
+            CategorySpec('optimization', 0.1, analysis_checks=(
+                lambda bio, a: 50 if a['keyword_density'] > 5 else 0,
+                lambda bio, a: 50 if a['technical_terms'] >= 2 else 0)),
+        ),
+        feedback=(
+            ('authority', 70, "Add more quantifiable achievements and strong action verbs"),
+            ('clarity', 70, "Improve sentence structure and overall clarity"),
+            ('engagement', 50, "Include more personality and passion indicators"),
+        ),
+        compliant_score=75,
+        compliant_label='Professional',
+        needs_work_label='Needs improvement',
+    ),
+    "creative": StyleSpec(
+        categories=(
+            CategorySpec('creativity', 0.35, keyword_groups=(
+                (_CREATIVE_INDICATOR_KW, 20), (_CREATIVE_METAPHOR_KW, 15))),
+            CategorySpec('storytelling', 0.25, analysis_checks=(
+                lambda bio, a: 40 if a['sentence_variety'] > 4 else 0,
+                lambda bio, a: 35 if a['engagement_count'] >= 2 else 0,
+                lambda bio, a: 25 if 'I' in bio else 0)),  # First person narrative
+            CategorySpec('authenticity', 0.2, keyword_groups=((_CREATIVE_AUTHENTICITY_KW, 25),)),
+            CategorySpec('visual_appeal', 0.1, analysis_checks=(
+                lambda bio, a: 50 if not _CREATIVE_EMOJIS.isdisjoint(bio) else 0,
+                lambda bio, a: 50 if a['sentence_variety'] > 3 else 0)),
+            CategorySpec('professional_balance', 0.1, analysis_checks=(
+                lambda bio, a: 50 if a['professional_count'] >= 1 else 0,
+                lambda bio, a: 50 if a['action_verbs'] >= 2 else 0)),
+        ),
+        feedback=(
+            ('creativity', 70, "Add more creative language and unique expressions"),
+            ('storytelling', 70, "Improve narrative flow and personal story elements"),
+            ('authenticity', 50, "Include more personal passion and authentic voice"),
+        ),
+        compliant_score=75,
+        compliant_label='Creative',
+        needs_work_label='Needs more creativity',
+    ),
+    "technical": StyleSpec(
+        categories=(
+            CategorySpec('technical_expertise', 0.4, keyword_groups=((_TECHNICAL_KW, 10),), analysis_checks=(
+                lambda bio, a: 40 if a['technical_terms'] >= 3 else 0,
+                lambda bio, a: 20 if a['technical_terms'] >= 5 else 0)),
+            CategorySpec('problem_solving', 0.25, keyword_groups=((_TECHNICAL_PROBLEM_SOLVING_KW, 15),)),
+            CategorySpec('quantified_results', 0.2, analysis_checks=(_quantified_results_points,)),
+            CategorySpec('precision', 0.1, analysis_checks=(
+                lambda bio, a: 60 if 12 <= a['avg_words_per_sentence'] <= 18 else 0,
+                lambda bio, a: 40 if a['technical_terms'] / max(a['word_count'], 1) * 100 > 3 else 0)),  # Technical density
+            CategorySpec('industry_standards', 0.05, keyword_groups=((_TECHNICAL_STANDARDS_KW, 20),)),
+        ),
+        feedback=(
+            ('technical_expertise', 70, "Include more specific technical terminology and concepts"),
+            ('quantified_results', 70, "Add more specific metrics and performance indicators"),
+            ('problem_solving', 60, "Emphasize problem-solving achievements and solutions"),
+        ),
+        compliant_score=75,
+        compliant_label='Technical',
+        needs_work_label='Needs more technical depth',
+    ),
+    "executive": StyleSpec(
+        categories=(
+            CategorySpec('strategic_vision', 0.3, keyword_groups=((_EXECUTIVE_VISION_KW, 20),)),
+            CategorySpec('leadership', 0.25, keyword_groups=((_EXECUTIVE_LEADERSHIP_KW, 20),)),
+            CategorySpec('business_impact', 0.25, keyword_groups=((_EXECUTIVE_BUSINESS_KW, 10),), analysis_checks=(
+                lambda bio, a: 60 if a['number_count'] >= 2 else 0,)),
+            CategorySpec('communication', 0.2, analysis_checks=(
+                lambda bio, a: 70 if 20 <= a['avg_words_per_sentence'] <= 25 else 0,
+                lambda bio, a: 30 if a['professional_count'] >= 3 else 0)),
+        ),
+        feedback=(
+            ('strategic_vision', 70, "Emphasize strategic thinking and visionary leadership"),
+            ('leadership', 70, "Include more evidence of team leadership and mentorship"),
+            ('business_impact', 70, "Add specific business outcomes and measurable impact"),
+        ),
+        compliant_score=80,
+        compliant_label='Executive',
+        needs_work_label='Needs executive presence',
+    ),
+    "startup": StyleSpec(
+        categories=(
+            CategorySpec('innovation', 0.35, keyword_groups=((_STARTUP_INNOVATION_KW, 20),)),
+            CategorySpec('growth_focus', 0.25, keyword_groups=((_STARTUP_GROWTH_KW, 25),)),
+            CategorySpec('versatility', 0.2, keyword_groups=((_STARTUP_MULTI_ROLE_KW, 5),), analysis_checks=(
+                lambda bio, a: 40 if a['technical_terms'] >= 2 else 0,
+                lambda bio, a: 40 if a['action_verbs'] >= 4 else 0)),
+            CategorySpec('energy', 0.2, analysis_checks=(lambda bio, a: a['engagement_count'] * 30,)),
+        ),
+        feedback=(
+            ('innovation', 70, "Emphasize innovation and disruptive thinking"),
+            ('growth_focus', 70, "Include more growth and scaling achievements"),
+            ('energy', 60, "Add more energy and entrepreneurial passion"),
+        ),
+        compliant_score=75,
+        compliant_label='Startup-ready',
+        needs_work_label='Needs startup energy',
+    ),
+}
+
+
+# Labels models put in front of the bio, removed in this order by _extract_bio_from_response
+_RESPONSE_PREFIXES = (
+    "Enhanced bio:",
+    "Optimized bio:",
+    "Alternative bio:",
+    "Here's the enhanced bio:",
+    "Here's an optimized version:",
+    "Bio:",
+    "LinkedIn bio:"
+)
+_RESPONSE_PREFIX_RE = re.compile(
+    "".join(rf"(?:{re.escape(prefix)}\s*)?" for prefix in _RESPONSE_PREFIXES), re.IGNORECASE)
+
+# Patterns applied to every analyzed bio and iteration attempt
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_NUMBER_RE = re.compile(r'\d+')
+_WORD_RE = re.compile(r'\w+')
+
+# Each iteration compares against every earlier attempt, so attempts are tokenized once
+@functools.lru_cache(maxsize=64)
+def _word_set(text: str) -> FrozenSet[str]:
+    """Distinct lowercased words of ``text``."""
+    return frozenset(_WORD_RE.findall(text.lower()))
+
+
+# Improvements reported by _analyze_improvements when a bio metric increases
+_METRIC_GAIN_IMPROVEMENTS = (
+    ('number_count', "Added quantified achievements"),
+    ('technical_terms', "Enhanced technical skills listing"),
+    ('action_verbs', "Strengthened action verbs"),
+    ('sentence_variety', "Improved sentence structure variety"),
+    ('keyword_density', "Optimized keyword usage"),
+)
+
+# Bio analyses are pure on the text; evaluations and suggestions often repeat a bio
+@functools.lru_cache(maxsize=128)
+def _bio_text_analysis(text: str) -> Dict[str, Any]:
+    """Word, sentence and keyword metrics of a bio, shared by every service instance."""
+    text_lower = text.lower()
+    words = text.split()
+    sentences = [s for s in map(str.strip, _SENTENCE_SPLIT_RE.split(text)) if s]
+    
+    # Basic metrics
+    word_count = len(words)
+    sentence_count = len(sentences)
+    char_count = len(text)
+    
+    # Advanced metrics
+    avg_words_per_sentence = word_count / max(sentence_count, 1)
+    avg_chars_per_word = char_count / max(word_count, 1)
+    
+    # Count specific elements
+    number_count = sum(1 for _ in _NUMBER_RE.finditer(text))
+    
+    # Action verbs (common professional action words)
+    action_verbs = ['led', 'managed', 'built', 'created', 'developed', 'designed', 'implemented', 'optimized',
+                   'delivered', 'achieved', 'improved', 'increased', 'reduced', 'launched', 'architected']
+    action_verb_count = sum(1 for verb in action_verbs if verb in text_lower)
+    
+    # Technical terms (common in software engineering bios)
+    technical_terms = ['api', 'database', 'architecture', 'framework', 'algorithm', 'optimization',
+                      'scalability', 'microservices', 'cloud', 'devops', 'automation', 'ci/cd']
+    technical_term_count = sum(1 for term in technical_terms if term in text_lower)
+    
+    # Keyword density (industry-relevant terms)
+    industry_keywords = ['software', 'engineering', 'development', 'programming', 'technology',
+                       'innovation', 'solutions', 'systems', 'applications', 'projects']
+    keyword_matches = sum(1 for keyword in industry_keywords if keyword in text_lower)
+    keyword_density = (keyword_matches / max(word_count, 1)) * 100
+    
+    # Sentence length variety (standard deviation)
+    sentence_lengths = [len(s.split()) for s in sentences]
+    if len(sentence_lengths) > 1:
+        import statistics
+        sentence_variety = statistics.stdev(sentence_lengths)
+    else:
+        sentence_variety = 0
+    
+    # Engagement indicators
+    engagement_words = ['passionate', 'innovative', 'excited', 'driven', 'love', 'enjoy',
+                       'enthusiastic', 'committed', 'dedicated', 'focused']
+    engagement_count = sum(1 for word in engagement_words if word in text_lower)
+    
+    # Professional indicators
+    professional_words = ['experience', 'expertise', 'proven', 'results', 'successful',
+                         'accomplished', 'established', 'recognized', 'certified']
+    professional_count = sum(1 for word in professional_words if word in text_lower)
+    
+    return {
+        'word_count': word_count,
+        'sentence_count': sentence_count,
+        'char_count': char_count,
+        'avg_words_per_sentence': avg_words_per_sentence,
+        'avg_chars_per_word': avg_chars_per_word,
+        'number_count': number_count,
+        'action_verbs': action_verb_count,
+        'technical_terms': technical_term_count,
+        'keyword_density': keyword_density,
+        'sentence_variety': sentence_variety,
+        'engagement_count': engagement_count,
+        'professional_count': professional_count
+    }
+
+
 class OpenRouterAIService:
     """OpenRouter AI service for enhanced content generation."""
     
     def __init__(self, config: OpenRouterConfig = None):
         self.config = config or OpenRouterConfig()
-        self.logger = get_logger()
-        self.settings_manager = SettingsManager()
+        
+        # Created on first use; pricing lookups need neither
+        self._logger = None
+        self._settings_manager = None
+        self._settings_loaded = False
+        
+        # Results of earlier enhancements, matched by exact bio text
+        self._response_cache = BioResponseCache()
+        
+        # _build_context_section output keyed by the request fields it reads
+        self._context_sections: Dict[Tuple, str] = {}
         
         # Model pricing database
         self._init_model_pricing()
         
-        # Load settings if available
-        self._load_settings()
-        
         # Initialize robust HTTP session
         self._init_http_session()
         
@@ -154,16 +978,19 @@ class OpenRouterAIService:
         """Initialize HTTP session with robust SSL and retry configuration."""
         self.session = requests.Session()
         
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "POST"]
+        # urllib3 retries failed connections before anything is sent, which is
+        # safe for POST too; status retries are handled by _send_with_backoff
+        # so they can be jittered
+        connect_retries = Retry(
+            total=_CONNECT_RETRIES,
+            connect=_CONNECT_RETRIES,
+            read=False,
+            status=0,
+            other=0,
+            backoff_factor=0.5,
+            respect_retry_after_header=False
         )
-        
-        # Create adapter with retry strategy
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=connect_retries)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -183,149 +1010,66 @@ class OpenRouterAIService:
             
         except Exception as e:
             self.logger.warning(f"SSL configuration warning: {e}")
+        
+        # Request headers shared by every API call; Authorization follows config.api_key
+        self.session.headers.update(_STATIC_HEADERS)
+        self._auth_key = None
+        
+        # Async request limits; the semaphore is recreated for each event loop
+        self._sem = None
+        self._sem_loop = None
+        self._next_request_at = 0.0
+    
+    @property
+    def logger(self):
+        if self._logger is None:
+            self._logger = get_logger()
+        return self._logger
+    
+    @property
+    def settings_manager(self) -> SettingsManager:
+        if self._settings_manager is None:
+            self._settings_manager = SettingsManager()
+        return self._settings_manager
+    
+    def _ensure_settings_loaded(self):
+        """Apply saved OpenRouter settings to the config once, before first use."""
+        if self._settings_loaded:
+            return
+        self._settings_loaded = True
+        self._load_settings()
+        
+        # Open a pooled connection now so the first request skips the TLS handshake
+        if self.is_configured():
+            threading.Thread(target=self._warm_connection, daemon=True).start()
+    
+    def _warm_connection(self):
+        """Open a keep-alive connection to the API; errors are ignored."""
+        try:
+            self.session.head(f"{self.config.base_url}/models", timeout=5)
+        except Exception:
+            pass
+    
+    def _sync_auth_header(self):
+        """Point the session's Authorization header at the current API key."""
+        if self.config.api_key != self._auth_key:
+            self._auth_key = self.config.api_key
+            self.session.headers["Authorization"] = f"Bearer {self._auth_key}"
     
     def _init_model_pricing(self):
-        """Initialize model pricing information."""
-        self.model_pricing = {
-            # OpenAI Models
-            "openai/gpt-3.5-turbo": ModelPricing(
-                model_name="GPT-3.5 Turbo",
-                input_price_per_1k=0.0015,
-                output_price_per_1k=0.002,
-                context_length=16385,
-                max_output=4096,
-                description="Fast, cost-effective, great for most use cases",
-                provider="OpenAI",
-                latency=1.2
-            ),
-            "openai/gpt-4": ModelPricing(
-                model_name="GPT-4",
-                input_price_per_1k=0.03,
-                output_price_per_1k=0.06,
-                context_length=8192,
-                max_output=4096,
-                description="High quality, better reasoning, more expensive",
-                provider="OpenAI",
-                latency=2.8
-            ),
-            "openai/gpt-4-turbo": ModelPricing(
-                model_name="GPT-4 Turbo",
-                input_price_per_1k=0.01,
-                output_price_per_1k=0.03,
-                context_length=128000,
-                max_output=4096,
-                description="Latest GPT-4 with improved performance and larger context",
-                provider="OpenAI",
-                latency=2.1
-            ),
-            
-            # Anthropic Claude Models
-            "anthropic/claude-3-haiku": ModelPricing(
-                model_name="Claude 3 Haiku",
-                input_price_per_1k=0.00025,
-                output_price_per_1k=0.00125,
-                context_length=200000,
-                max_output=4096,
-                description="Fast Claude model, excellent value",
-                provider="Anthropic",
-                latency=0.8
-            ),
-            "anthropic/claude-3-sonnet": ModelPricing(
-                model_name="Claude 3 Sonnet",
-                input_price_per_1k=0.003,
-                output_price_per_1k=0.015,
-                context_length=200000,
-                max_output=4096,
-                description="High-quality Claude, excellent writing",
-                provider="Anthropic",
-                latency=1.5
-            ),
-            "anthropic/claude-3-opus": ModelPricing(
-                model_name="Claude 3 Opus",
-                input_price_per_1k=0.015,
-                output_price_per_1k=0.075,
-                context_length=200000,
-                max_output=4096,
-                description="Most capable Claude model",
-                provider="Anthropic",
-                latency=2.3
-            ),
-            "anthropic/claude-sonnet-4.5": ModelPricing(
-                model_name="Claude Sonnet 4.5",
-                input_price_per_1k=0.003,  # ≤200K tokens
-                output_price_per_1k=0.015,  # ≤200K tokens
-                context_length=1000000,
-                max_output=64000,
-                description="Latest Claude with 1M context, exceptional reasoning",
-                provider="Anthropic",
-                latency=2.5
-            ),
-            
-            # Meta Llama Models
-            "meta-llama/llama-3-8b-instruct": ModelPricing(
-                model_name="Llama 3 8B Instruct",
-                input_price_per_1k=0.0001,
-                output_price_per_1k=0.0001,
-                context_length=8192,
-                max_output=2048,
-                description="Open source, fast, very cost-effective",
-                provider="Meta",
-                latency=0.6
-            ),
-            "meta-llama/llama-3-70b-instruct": ModelPricing(
-                model_name="Llama 3 70B Instruct",
-                input_price_per_1k=0.0009,
-                output_price_per_1k=0.0009,
-                context_length=8192,
-                max_output=2048,
-                description="Larger Llama model, better quality",
-                provider="Meta",
-                latency=1.8
-            ),
-            
-            # DeepSeek Models
-            "deepseek/deepseek-v3.2-exp": ModelPricing(
-                model_name="DeepSeek V3.2 Exp",
-                input_price_per_1k=0.00027,
-                output_price_per_1k=0.00041,
-                context_length=163800,
-                max_output=65500,
-                description="Advanced reasoning model, excellent value",
-                provider="DeepSeek",
-                latency=0.9
-            ),
-            
-            # Google Gemini Models
-            "google/gemini-2.5-flash": ModelPricing(
-                model_name="Gemini 2.5 Flash",
-                input_price_per_1k=0.0003,
-                output_price_per_1k=0.0025,
-                context_length=1050000,
-                max_output=65500,
-                description="Ultra-fast Google model with massive context",
-                provider="Google",
-                latency=0.4
-            ),
-        }
+        """Point the instance at the shared, read-only model pricing tables."""
+        self.model_pricing = _MODEL_PRICING
+        self._bio_costs = _BIO_COSTS
+        self._models_sorted_by_cost = _MODELS_SORTED_BY_COST
     
     def get_model_pricing(self, model_id: str) -> Optional[ModelPricing]:
         """Get pricing information for a model."""
         return self.model_pricing.get(model_id)
     
     def get_all_models_with_pricing(self) -> List[tuple]:
-        """Get all models with their pricing information for display."""
-        models = []
-        for model_id, pricing in self.model_pricing.items():
-            cost_estimate = pricing.estimate_bio_cost()
-            models.append((
-                model_id,
-                pricing.model_name,
-                pricing.description,
-                f"${cost_estimate:.4f}",
-                pricing.provider,
-                f"{pricing.latency:.1f}s"
-            ))
-        return sorted(models, key=lambda x: float(x[3][1:]))  # Sort by cost
+        """Get all models with their pricing information for display, cheapest first."""
+        # A fresh list each call; the shared rows are never handed out to be mutated
+        return list(self._models_sorted_by_cost)
     
     def calculate_actual_cost(self, usage_data: Dict[str, int], model_id: str = None) -> Dict[str, Any]:
         """Calculate actual cost from API usage data."""
@@ -339,11 +1083,30 @@ class OpenRouterAIService:
         completion_tokens = usage_data.get("completion_tokens", 0)
         total_tokens = usage_data.get("total_tokens", 0)
         
+        # Prompt-cache hits and writes are part of prompt_tokens but priced differently
+        cache_read_tokens = (usage_data.get("cache_read_input_tokens")
+                             or (usage_data.get("prompt_tokens_details") or {}).get("cached_tokens", 0))
+        cache_write_tokens = usage_data.get("cache_creation_input_tokens", 0)
+        uncached_tokens = max(prompt_tokens - cache_read_tokens - cache_write_tokens, 0)
+        read_multiplier, write_multiplier = _CACHE_PRICE_MULTIPLIERS.get(
+            model_id.split('/', 1)[0] + '/', _NO_CACHE_DISCOUNT)
+        
         # Calculate costs using actual token counts
-        input_cost = pricing.estimate_cost(prompt_tokens, 0)
-        output_cost = pricing.estimate_cost(0, completion_tokens)
+        input_cost = (uncached_tokens
+                      + cache_read_tokens * read_multiplier
+                      + cache_write_tokens * write_multiplier) * pricing.input_price_per_token
+        output_cost = completion_tokens * pricing.output_price_per_token
         total_cost = input_cost + output_cost
         
+        cost_breakdown = {
+            "input": f"${input_cost:.6f} ({prompt_tokens} tokens)",
+            "output": f"${output_cost:.6f} ({completion_tokens} tokens)"
+        }
+        if cache_read_tokens:
+            cost_breakdown["cache_read"] = f"{cache_read_tokens} tokens"
+        if cache_write_tokens:
+            cost_breakdown["cache_write"] = f"{cache_write_tokens} tokens"
+        
         return {
             "model": pricing.model_name,
             "prompt_tokens": prompt_tokens,
@@ -353,10 +1116,7 @@ class OpenRouterAIService:
             "output_cost": output_cost,
             "total_cost": total_cost,
             "cost_formatted": f"${total_cost:.6f}",
-            "cost_breakdown": {
-                "input": f"${input_cost:.6f} ({prompt_tokens} tokens)",
-                "output": f"${output_cost:.6f} ({completion_tokens} tokens)"
-            }
+            "cost_breakdown": cost_breakdown
         }
     
     def estimate_enhancement_cost(self, bio_text: str, model_id: str) -> Dict[str, Any]:
@@ -368,7 +1128,7 @@ class OpenRouterAIService:
             
             # Estimate token counts for the bio enhancement
             prompt_text = f"Please enhance this LinkedIn bio: {bio_text}"
-            estimated_input_tokens = len(prompt_text.split()) * 1.3  # Rough estimation
+            estimated_input_tokens = self._count_tokens(prompt_text, model_id)
             estimated_output_tokens = len(bio_text.split()) * 2  # Expect roughly 2x output
             
             # Calculate estimated cost
@@ -391,6 +1151,13 @@ class OpenRouterAIService:
         except Exception as e:
             return {"error": f"Cost estimation failed: {str(e)}"}
     
+    def _count_tokens(self, text: str, model_id: str) -> int:
+        """Count prompt tokens with tiktoken, or estimate from the word count without it."""
+        encoding = _token_encoding(model_id)
+        if encoding is None:
+            return int(len(text.split()) * 1.3)
+        return len(encoding.encode(text))
+    
     def query_generation_stats(self, generation_id: str) -> Optional[Dict[str, Any]]:
         """Query generation stats for precise cost accounting."""
         if not self.is_configured() or not generation_id:
@@ -398,43 +1165,16 @@ class OpenRouterAIService:
         
         try:
             url = f"{self.config.base_url}/generation?id={generation_id}"
-            headers = {
-                "Authorization": f"Bearer {self.config.api_key}",
-                "Content-Type": "application/json"
-            }
+            self._sync_auth_header()
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self._send_with_backoff(self.session.get, url, timeout=10)
             response.raise_for_status()
             
-            return response.json()
+            return _json_loads(response.content)
             
         except Exception as e:
             self.logger.error(f"Failed to query generation stats: {e}")
             return None
-        """Estimate cost for enhancing a specific bio."""
-        model_id = model_id or self.config.model
-        pricing = self.get_model_pricing(model_id)
-        
-        if not pricing:
-            return {"error": "Pricing information not available for this model"}
-        
-        # Estimate tokens (rough approximation: 1 token ≈ 0.75 words)
-        words = len(bio_text.split())
-        input_tokens = int(words / 0.75) + 200  # Add system prompt tokens
-        output_tokens = 300  # Typical enhanced bio length
-        
-        cost = pricing.estimate_cost(input_tokens, output_tokens)
-        
-        return {
-            "model": pricing.model_name,
-            "estimated_input_tokens": input_tokens,
-            "estimated_output_tokens": output_tokens,
-            "estimated_cost": cost,
-            "cost_formatted": f"${cost:.4f}",
-            "provider": pricing.provider,
-            "context_length": pricing.context_length,
-            "max_output": pricing.max_output
-        }
     
     def _load_settings(self):
         """Load OpenRouter settings from application settings."""
@@ -452,12 +1192,16 @@ class OpenRouterAIService:
             
             if hasattr(settings, 'openrouter_temperature'):
                 self.config.temperature = settings.openrouter_temperature
+            
+            if hasattr(settings, 'openrouter_response_cache'):
+                self.config.use_response_cache = settings.openrouter_response_cache
                 
         except Exception as e:
             self.logger.debug(f"Could not load OpenRouter settings: {e}")
     
     def is_configured(self) -> bool:
         """Check if OpenRouter is properly configured."""
+        self._ensure_settings_loaded()
         return bool(self.config.api_key and self.config.api_key.strip())
     
     def test_connection(self) -> Dict[str, Any]:
@@ -498,11 +1242,31 @@ class OpenRouterAIService:
                 "details": "Failed to connect to OpenRouter API"
             }
     
-    def enhance_linkedin_bio(self, request: EnhancementRequest) -> EnhancementResult:
-        """Enhance LinkedIn bio using OpenRouter AI with fallback strategies."""
+    def enhance_linkedin_bio(self, request: EnhancementRequest,
+                             on_token: Optional[Callable[[str], None]] = None) -> EnhancementResult:
+        """Enhance LinkedIn bio using OpenRouter AI with fallback strategies.
+        
+        When ``on_token`` is given the response is streamed and each piece of
+        text is passed to it as it arrives, e.g. for a live preview.
+        """
         if not self.is_configured():
             return self._create_fallback_enhancement(request)
         
+        scope = self._response_cache_scope(
+            "enhance", *(value for name, value in asdict(request).items() if name != "original_bio"))
+        if self.config.use_response_cache:
+            cached = self._response_cache.get(scope, request.original_bio)
+            if cached is not None:
+                try:
+                    result = replace(EnhancementResult(**cached), model_used="cache",
+                                     actual_cost=0.0, processing_time=0.0)
+                except (TypeError, ValueError) as e:
+                    self.logger.warning(f"Ignoring unreadable cached enhancement: {e}")
+                    self._response_cache.discard(scope, request.original_bio)
+                else:
+                    self.logger.info("♻️ Reusing enhancement of an identical bio")
+                    return result
+        
         start_time = time.time()
         self.logger.info(f"🤖 Enhancing LinkedIn bio with OpenRouter AI ({self.config.model})")
         
@@ -514,7 +1278,9 @@ class OpenRouterAIService:
             response = self._make_api_request(
                 prompt,
                 max_tokens=self.config.max_tokens,
-                temperature=self.config.temperature
+                temperature=self.config.temperature,
+                stream=on_token is not None,
+                on_token=on_token
             )
             
             if not response or "choices" not in response:
@@ -560,6 +1326,8 @@ class OpenRouterAIService:
             )
             
             self.logger.info(f"✅ Bio enhancement complete ({processing_time:.2f}s, {total_tokens} tokens)")
+            if self.config.use_response_cache:
+                self._response_cache.put(scope, request.original_bio, asdict(result))
             return result
             
         except Exception as e:
@@ -567,21 +1335,88 @@ class OpenRouterAIService:
             self.logger.info("🔄 Falling back to local enhancement")
             return self._create_fallback_enhancement(request)
     
-    def generate_bio_alternatives(self, original_bio: str, count: int = 3) -> List[str]:
-        """Generate alternative bio versions using OpenRouter AI."""
+    def generate_bio_alternatives(self, original_bio: str, count: int = 3,
+                                  use_batch_api: bool = False) -> List[str]:
+        """Generate alternative bio versions using OpenRouter AI.
+        
+        With ``use_batch_api`` the requests are submitted as one batch job
+        (cheaper, but it can take minutes) for models that support it.
+        """
+        if not self.is_configured():
+            return []
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.agenerate_bio_alternatives(original_bio, count, use_batch_api))
+        
+        # Called from a running event loop, where asyncio.run would raise:
+        # send the requests one at a time on the blocking session instead
+        if use_batch_api:
+            self.logger.warning("Batch API skipped: generate_bio_alternatives was called from a "
+                                "running event loop; await agenerate_bio_alternatives instead")
+        self.logger.info(f"🎭 Generating {count} bio alternatives with OpenRouter AI")
+        responses = []
+        for prompt in self._alternative_prompts(original_bio, count):
+            try:
+                responses.append(self._make_api_request(prompt, max_tokens=500, temperature=0.8))
+            except Exception as e:
+                responses.append(e)
+        return self._collect_alternatives(responses)
+    
+    async def agenerate_bio_alternatives(self, original_bio: str, count: int = 3,
+                                         use_batch_api: bool = False) -> List[str]:
+        """Generate alternative bio versions with all requests in flight at once."""
         if not self.is_configured():
             return []
         
         self.logger.info(f"🎭 Generating {count} bio alternatives with OpenRouter AI")
         
+        prompts = self._alternative_prompts(original_bio, count)
+        
+        async with aiohttp.ClientSession(headers=self._api_headers(),
+                                         timeout=aiohttp.ClientTimeout(total=60)) as session:
+            responses = None
+            if use_batch_api and self.config.model.startswith(_BATCH_API_PROVIDERS):
+                try:
+                    responses = await self._abatch_api_requests(session, prompts, max_tokens=500, temperature=0.8)
+                except Exception as e:
+                    self.logger.warning(f"Batch API unavailable, sending requests directly: {e}")
+            
+            if responses is None:
+                responses = await asyncio.gather(
+                    *(self._amake_api_request(session, prompt, max_tokens=500, temperature=0.8) for prompt in prompts),
+                    return_exceptions=True
+                )
+        
+        return self._collect_alternatives(responses)
+    
+    def _alternative_prompts(self, original_bio: str, count: int) -> List[str]:
+        """One alternative prompt per requested bio, cycling through _STYLE_VARIATIONS."""
+        return [
+            self._build_alternative_prompt(original_bio, _STYLE_VARIATIONS[i % len(_STYLE_VARIATIONS)])
+            for i in range(count)
+        ]
+    
+    def _collect_alternatives(self, responses: List[Any]) -> List[str]:
+        """Bios from the successful responses; exceptions in the list are logged and skipped."""
         alternatives = []
+        for i, response in enumerate(responses):
+            if isinstance(response, Exception):
+                self.logger.warning(f"Failed to generate alternative {i+1}: {response}")
+                continue
+            
+            if response and "choices" in response:
+                alternative = response["choices"][0]["message"]["content"].strip()
+                alternative = self._extract_bio_from_response(alternative)
+                alternatives.append(alternative)
         
-        for i in range(count):
-            try:
-                style_variations = ["professional", "creative", "technical", "conversational", "executive"]
-                style = style_variations[i % len(style_variations)]
-                
-                prompt = f"""
+        self.logger.info(f"✅ Generated {len(alternatives)} bio alternatives")
+        return alternatives
+    
+    def _build_alternative_prompt(self, original_bio: str, style: str) -> str:
+        """Build the prompt asking for one alternative bio in the given style."""
+        return f"""
 Create a LinkedIn bio alternative based on this original bio. Make it {style} in style while maintaining the core message and achievements.
 
 Original bio:
@@ -595,24 +1430,6 @@ Create a {style} alternative that:
 
 Alternative bio:
 """
-                
-                response = self._make_api_request(
-                    prompt,
-                    max_tokens=500,
-                    temperature=0.8
-                )
-                
-                if response and "choices" in response:
-                    alternative = response["choices"][0]["message"]["content"].strip()
-                    alternative = self._extract_bio_from_response(alternative)
-                    alternatives.append(alternative)
-                    
-            except Exception as e:
-                self.logger.warning(f"Failed to generate alternative {i+1}: {e}")
-                continue
-        
-        self.logger.info(f"✅ Generated {len(alternatives)} bio alternatives")
-        return alternatives
     
     def optimize_for_keywords(self, bio: str, target_keywords: List[str]) -> str:
         """Optimize bio for specific keywords using OpenRouter AI."""
@@ -621,6 +1438,13 @@ Alternative bio:
         
         self.logger.info(f"🎯 Optimizing bio for keywords: {', '.join(target_keywords)}")
         
+        scope = self._response_cache_scope("keywords", ", ".join(target_keywords))
+        if self.config.use_response_cache:
+            cached = self._response_cache.get(scope, bio)
+            if isinstance(cached, dict) and isinstance(cached.get("bio"), str):
+                self.logger.info("♻️ Reusing keyword optimization of an identical bio")
+                return cached["bio"]
+        
         try:
             prompt = f"""
 Optimize this LinkedIn bio to naturally include these target keywords while maintaining readability and authenticity:
@@ -651,6 +1475,8 @@ Optimized bio:
                 optimized = self._extract_bio_from_response(optimized)
                 
                 self.logger.info("✅ Bio keyword optimization complete")
+                if self.config.use_response_cache:
+                    self._response_cache.put(scope, bio, {"bio": optimized})
                 return optimized
             
         except Exception as e:
@@ -658,6 +1484,13 @@ Optimized bio:
         
         return bio
     
+    def _response_cache_scope(self, kind: str, *parts) -> Tuple[str, ...]:
+        """Everything besides the bio text that must match for a cached result to apply."""
+        config = self.config
+        settings = (config.model, config.max_tokens, config.temperature, config.enhance_creativity,
+                    config.improve_readability, config.optimize_keywords, config.add_personality)
+        return (kind, *map(str, settings), *map(str, parts))
+    
     def _build_enhancement_prompt(self, request: EnhancementRequest) -> str:
         """Build sophisticated enhancement prompt for OpenRouter API."""
         
@@ -709,6 +1542,16 @@ ENHANCED BIO:
         return prompt
     
     def _build_context_section(self, request: EnhancementRequest) -> str:
+        """Build rich context section for AI prompt, memoized on the fields it reads."""
+        key = request.context_key
+        context = self._context_sections.get(key)
+        if context is None:
+            if len(self._context_sections) >= 64:
+                self._context_sections.clear()
+            context = self._context_sections[key] = self._compose_context_section(request)
+        return context
+    
+    def _compose_context_section(self, request: EnhancementRequest) -> str:
         """Build rich context section for AI prompt."""
         context_parts = []
         
@@ -760,49 +1603,31 @@ ENHANCED BIO:
     
     def _infer_project_types(self, projects: List[str]) -> List[str]:
         """Infer project types from project names and descriptions."""
-        types = []
-        
-        # Common project type indicators
-        type_keywords = {
-            "Web Applications": ["web", "app", "site", "dashboard", "portal", "frontend", "react", "vue"],
-            "APIs & Backend": ["api", "backend", "server", "service", "rest", "graphql", "microservice"],
-            "Data & Analytics": ["data", "analytics", "dashboard", "visualization", "ml", "ai", "analysis"],
-            "Mobile Development": ["mobile", "ios", "android", "flutter", "react-native", "app"],
-            "DevOps & Tools": ["cli", "tool", "automation", "deploy", "docker", "kubernetes", "ci"],
-            "Libraries & Frameworks": ["library", "framework", "package", "sdk", "component"],
-            "Games & Entertainment": ["game", "bot", "entertainment", "fun", "interactive"],
-            "Blockchain & Crypto": ["blockchain", "crypto", "defi", "nft", "ethereum", "bitcoin"]
-        }
-        
-        project_text = " ".join(projects).lower()
+        # Scanned per project rather than joined; no keyword contains a space,
+        # so no match can span two projects either way
+        found = set()
+        for project in projects:
+            found.update(_PROJECT_TYPE_MATCHER.hits(project.lower()))
         
-        for project_type, keywords in type_keywords.items():
-            if any(keyword in project_text for keyword in keywords):
+        types = []
+        for project_type, keywords in _PROJECT_TYPE_KEYWORDS:
+            if not keywords.isdisjoint(found):
                 types.append(project_type)
+                if len(types) == 3:  # Return top 3 categories
+                    break
         
-        return types[:3]  # Return top 3 categories
+        return types
     
     def _analyze_achievement_patterns(self, achievements: List[str]) -> str:
         """Analyze patterns in achievements to understand focus areas."""
         
         achievement_text = " ".join(achievements).lower()
         
-        focus_areas = []
-        
-        if any(word in achievement_text for word in ["star", "fork", "community", "open source"]):
-            focus_areas.append("Community Impact")
-        
-        if any(word in achievement_text for word in ["performance", "optimization", "speed", "efficiency"]):
-            focus_areas.append("Performance Optimization")
-        
-        if any(word in achievement_text for word in ["scale", "growth", "user", "traffic"]):
-            focus_areas.append("Scalability & Growth")
-        
-        if any(word in achievement_text for word in ["innovation", "new", "first", "pioneering"]):
-            focus_areas.append("Innovation Leadership")
-        
-        if any(word in achievement_text for word in ["team", "lead", "mentor", "manage"]):
-            focus_areas.append("Technical Leadership")
+        focus_areas = [
+            focus_area
+            for focus_area, keywords in _ACHIEVEMENT_FOCUS_KEYWORDS
+            if any(keyword in achievement_text for keyword in keywords)
+        ]
         
         return ", ".join(focus_areas) if focus_areas else "Technical Excellence"
     
@@ -816,13 +1641,9 @@ ENHANCED BIO:
             langs = [lang.lower() for lang in request.primary_languages[:4]]
             
             # Full-stack indicators
-            frontend_langs = {"javascript", "typescript", "html", "css", "react", "vue", "angular"}
-            backend_langs = {"python", "java", "go", "c#", "rust", "php", "ruby", "node.js"}
-            mobile_langs = {"swift", "kotlin", "dart", "java", "objective-c"}
-            
-            has_frontend = any(lang in frontend_langs for lang in langs)
-            has_backend = any(lang in backend_langs for lang in langs)
-            has_mobile = any(lang in mobile_langs for lang in langs)
+            has_frontend = not _FRONTEND_LANGS.isdisjoint(langs)
+            has_backend = not _BACKEND_LANGS.isdisjoint(langs)
+            has_mobile = not _MOBILE_LANGS.isdisjoint(langs)
             
             if has_frontend and has_backend:
                 insights.append("Full-stack developer")
@@ -835,8 +1656,7 @@ ENHANCED BIO:
                 insights.append("Mobile developer")
             
             # Technology modernity
-            modern_langs = {"typescript", "go", "rust", "kotlin", "swift", "python"}
-            modern_count = sum(1 for lang in langs if lang in modern_langs)
+            modern_count = sum(1 for lang in langs if lang in _MODERN_LANGS)
             if modern_count >= 2:
                 insights.append("Modern technology adopter")
             
@@ -850,333 +1670,47 @@ ENHANCED BIO:
         if request.project_highlights:
             project_text = " ".join(request.project_highlights).lower()
             
-            if any(word in project_text for word in ["open", "source", "community"]):
-                insights.append("Open source contributor")
-            
-            if any(word in project_text for word in ["startup", "business", "product"]):
-                insights.append("Product-focused engineer")
-            
-            if any(word in project_text for word in ["enterprise", "large", "scale"]):
-                insights.append("Enterprise-scale developer")
+            insights.extend(
+                insight
+                for insight, keywords in _PROJECT_PROFILE_KEYWORDS
+                if any(keyword in project_text for keyword in keywords)
+            )
         
+        return ", ".join(insights)
+    
     def evaluate_bio_by_style(self, bio: str, target_style: str) -> Dict[str, Any]:
         """Evaluate bio quality based on specific style requirements."""
-        
-        # Get base analysis
-        analysis = self._analyze_bio_text(bio)
-        
-        # Style-specific evaluation
-        if target_style == "professional":
-            return self._evaluate_professional_style(bio, analysis)
-        elif target_style == "creative":
-            return self._evaluate_creative_style(bio, analysis)
-        elif target_style == "technical":
-            return self._evaluate_technical_style(bio, analysis)
-        elif target_style == "executive":
-            return self._evaluate_executive_style(bio, analysis)
-        elif target_style == "startup":
-            return self._evaluate_startup_style(bio, analysis)
-        else:
-            return self._evaluate_professional_style(bio, analysis)  # Default
-    
-    def _evaluate_professional_style(self, bio: str, analysis: Dict) -> Dict[str, Any]:
-        """Evaluate bio for professional style standards."""
-        
-        scores = {}
-        feedback = []
-        
-        # Authority & Credibility (30%)
-        authority_score = 0
-        if analysis['professional_count'] >= 2:
-            authority_score += 40
-        if analysis['number_count'] >= 2:
-            authority_score += 30
-        if analysis['action_verbs'] >= 3:
-            authority_score += 30
-        
-        scores['authority'] = min(100, authority_score)
-        
-        # Clarity & Structure (25%)
-        clarity_score = 0
-        if 15 <= analysis['avg_words_per_sentence'] <= 20:
-            clarity_score += 40
-        else:
-            clarity_score += max(0, 40 - abs(analysis['avg_words_per_sentence'] - 17.5) * 2)
-        
-        if 180 <= analysis['word_count'] <= 280:
-            clarity_score += 35
-        if analysis['sentence_variety'] > 3:
-            clarity_score += 25
-        
-        scores['clarity'] = min(100, clarity_score)
-        
-        # Industry Relevance (20%)
-        industry_keywords = ['experience', 'expertise', 'professional', 'results', 'successful', 'proven']
-        relevance_score = sum(20 for keyword in industry_keywords if keyword in bio.lower())
-        scores['relevance'] = min(100, relevance_score)
-        
-        # Engagement Factor (15%)
-        engagement_indicators = ['passionate', 'driven', 'committed', 'focused', 'dedicated']
-        engagement_score = sum(25 for indicator in engagement_indicators if indicator in bio.lower())
-        scores['engagement'] = min(100, engagement_score)
-        
-        # Optimization (10%)
-        optimization_score = 0
-        if analysis['keyword_density'] > 5:
-            optimization_score += 50
-        if analysis['technical_terms'] >= 2:
-            optimization_score += 50
-        scores['optimization'] = optimization_score
-        
-        # Overall score
-        weights = {'authority': 0.3, 'clarity': 0.25, 'relevance': 0.2, 'engagement': 0.15, 'optimization': 0.1}
-        overall_score = sum(scores[key] * weights[key] for key in scores)
-        
-        # Generate feedback
-        if scores['authority'] < 70:
-            feedback.append("Add more quantifiable achievements and strong action verbs")
-        if scores['clarity'] < 70:
-            feedback.append("Improve sentence structure and overall clarity")
-        if scores['engagement'] < 50:
-            feedback.append("Include more personality and passion indicators")
-        
-        return {
-            'overall_score': overall_score,
-            'category_scores': scores,
-            'feedback': feedback,
-            'style_compliance': 'Professional' if overall_score >= 75 else 'Needs improvement'
-        }
-    
-    def _evaluate_creative_style(self, bio: str, analysis: Dict) -> Dict[str, Any]:
-        """Evaluate bio for creative style standards."""
-        
-        scores = {}
-        feedback = []
-        
-        # Creativity & Personality (35%)
-        creativity_indicators = ['innovative', 'creative', 'passionate', 'vision', 'imagination', 'artistic']
-        metaphors = ['journey', 'craft', 'build', 'create', 'design', 'architect']
-        
-        creativity_score = 0
-        creativity_score += sum(20 for indicator in creativity_indicators if indicator in bio.lower())
-        creativity_score += sum(15 for metaphor in metaphors if metaphor in bio.lower())
-        scores['creativity'] = min(100, creativity_score)
-        
-        # Storytelling & Flow (25%)
-        storytelling_score = 0
-        if analysis['sentence_variety'] > 4:
-            storytelling_score += 40
-        if analysis['engagement_count'] >= 2:
-            storytelling_score += 35
-        if 'I' in bio:  # First person narrative
-            storytelling_score += 25
-        scores['storytelling'] = min(100, storytelling_score)
-        
-        # Authenticity (20%)
-        authenticity_indicators = ['love', 'enjoy', 'excited', 'believe', 'dream', 'inspire']
-        authenticity_score = sum(25 for indicator in authenticity_indicators if indicator in bio.lower())
-        scores['authenticity'] = min(100, authenticity_score)
-        
-        # Visual Appeal (10%)
-        visual_score = 0
-        if '✨' in bio or '🚀' in bio or '💡' in bio:  # Emojis
-            visual_score += 50
-        if analysis['sentence_variety'] > 3:
-            visual_score += 50
-        scores['visual_appeal'] = visual_score
-        
-        # Professional Balance (10%)
-        balance_score = 0
-        if analysis['professional_count'] >= 1:
-            balance_score += 50
-        if analysis['action_verbs'] >= 2:
-            balance_score += 50
-        scores['professional_balance'] = balance_score
-        
-        # Overall score
-        weights = {'creativity': 0.35, 'storytelling': 0.25, 'authenticity': 0.2, 'visual_appeal': 0.1, 'professional_balance': 0.1}
-        overall_score = sum(scores[key] * weights[key] for key in scores)
-        
-        # Generate feedback
-        if scores['creativity'] < 70:
-            feedback.append("Add more creative language and unique expressions")
-        if scores['storytelling'] < 70:
-            feedback.append("Improve narrative flow and personal story elements")
-        if scores['authenticity'] < 50:
-            feedback.append("Include more personal passion and authentic voice")
-        
-        return {
-            'overall_score': overall_score,
-            'category_scores': scores,
-            'feedback': feedback,
-            'style_compliance': 'Creative' if overall_score >= 75 else 'Needs more creativity'
-        }
-    
-    def _evaluate_technical_style(self, bio: str, analysis: Dict) -> Dict[str, Any]:
-        """Evaluate bio for technical style standards."""
-        
-        scores = {}
-        feedback = []
-        
-        # Technical Expertise (40%)
-        technical_score = 0
-        if analysis['technical_terms'] >= 3:
-            technical_score += 40
-        if analysis['technical_terms'] >= 5:
-            technical_score += 20
-        
-        technical_keywords = ['architecture', 'scalability', 'optimization', 'performance', 'systems', 'algorithms']
-        tech_keyword_count = sum(1 for keyword in technical_keywords if keyword in bio.lower())
-        technical_score += tech_keyword_count * 10
-        
-        scores['technical_expertise'] = min(100, technical_score)
-        
-        # Problem-Solving Focus (25%)
-        problem_solving_indicators = ['solved', 'optimized', 'improved', 'designed', 'architected', 'built', 'implemented']
-        problem_score = sum(15 for indicator in problem_solving_indicators if indicator in bio.lower())
-        scores['problem_solving'] = min(100, problem_score)
-        
-        # Quantified Results (20%)
-        if analysis['number_count'] >= 3:
-            results_score = 100
-        elif analysis['number_count'] >= 2:
-            results_score = 70
-        elif analysis['number_count'] >= 1:
-            results_score = 40
-        else:
-            results_score = 0
-        scores['quantified_results'] = results_score
-        
-        # Precision & Clarity (10%)
-        precision_score = 0
-        if 12 <= analysis['avg_words_per_sentence'] <= 18:
-            precision_score += 60
-        if analysis['technical_terms'] / max(analysis['word_count'], 1) * 100 > 3:  # Technical density
-            precision_score += 40
-        scores['precision'] = min(100, precision_score)
-        
-        # Industry Standards (5%)
-        standards_keywords = ['best practices', 'standards', 'methodologies', 'frameworks', 'protocols']
-        standards_score = sum(20 for keyword in standards_keywords if keyword in bio.lower())
-        scores['industry_standards'] = min(100, standards_score)
-        
-        # Overall score
-        weights = {'technical_expertise': 0.4, 'problem_solving': 0.25, 'quantified_results': 0.2, 'precision': 0.1, 'industry_standards': 0.05}
-        overall_score = sum(scores[key] * weights[key] for key in scores)
-        
-        # Generate feedback
-        if scores['technical_expertise'] < 70:
-            feedback.append("Include more specific technical terminology and concepts")
-        if scores['quantified_results'] < 70:
-            feedback.append("Add more specific metrics and performance indicators")
-        if scores['problem_solving'] < 60:
-            feedback.append("Emphasize problem-solving achievements and solutions")
-        
-        return {
-            'overall_score': overall_score,
-            'category_scores': scores,
-            'feedback': feedback,
-            'style_compliance': 'Technical' if overall_score >= 75 else 'Needs more technical depth'
-        }
+        return self.evaluate_bios_batch([bio], target_style)[0]
+    
+    def evaluate_bios_batch(self, bios: List[str], target_style: str) -> List[Dict[str, Any]]:
+        """Evaluate several bios against one style, scanning them for its keywords in one pass."""
+        spec = _STYLE_REGISTRY.get(target_style) or _STYLE_REGISTRY["professional"]  # Default
+        all_hits = spec.matcher.hits_many([bio.lower() for bio in bios])
+        return [
+            self._evaluate_by_spec(bio, self._analyze_bio_text(bio), hits, spec)
+            for bio, hits in zip(bios, all_hits)
+        ]
     
-    def _evaluate_executive_style(self, bio: str, analysis: Dict) -> Dict[str, Any]:
-        """Evaluate bio for executive style standards."""
+    def _evaluate_by_spec(self, bio: str, analysis: Dict, hits: Counter, spec: StyleSpec) -> Dict[str, Any]:
+        """Score a bio's categories for one style and collect feedback on the weak ones."""
         
         scores = {}
-        feedback = []
-        
-        # Strategic Vision (30%)
-        vision_keywords = ['strategy', 'vision', 'transformation', 'growth', 'innovation', 'leadership']
-        vision_score = sum(20 for keyword in vision_keywords if keyword in bio.lower())
-        scores['strategic_vision'] = min(100, vision_score)
-        
-        # Leadership Evidence (25%)
-        leadership_indicators = ['led', 'managed', 'directed', 'guided', 'mentored', 'built teams']
-        leadership_score = sum(20 for indicator in leadership_indicators if indicator in bio.lower())
-        scores['leadership'] = min(100, leadership_score)
-        
-        # Business Impact (25%)
-        impact_score = 0
-        if analysis['number_count'] >= 2:
-            impact_score += 60
-        business_terms = ['revenue', 'growth', 'roi', 'efficiency', 'scale', 'market']
-        impact_score += sum(10 for term in business_terms if term in bio.lower())
-        scores['business_impact'] = min(100, impact_score)
-        
-        # Communication Excellence (20%)
-        comm_score = 0
-        if 20 <= analysis['avg_words_per_sentence'] <= 25:
-            comm_score += 70
-        if analysis['professional_count'] >= 3:
-            comm_score += 30
-        scores['communication'] = min(100, comm_score)
-        
-        # Overall score
-        weights = {'strategic_vision': 0.3, 'leadership': 0.25, 'business_impact': 0.25, 'communication': 0.2}
-        overall_score = sum(scores[key] * weights[key] for key in scores)
-        
-        # Generate feedback
-        if scores['strategic_vision'] < 70:
-            feedback.append("Emphasize strategic thinking and visionary leadership")
-        if scores['leadership'] < 70:
-            feedback.append("Include more evidence of team leadership and mentorship")
-        if scores['business_impact'] < 70:
-            feedback.append("Add specific business outcomes and measurable impact")
+        for category in spec.categories:
+            score = 0
+            for check in category.analysis_checks:
+                score += check(bio, analysis)
+            for keywords, points in category.keyword_groups:
+                score += _score_presence(hits, keywords, points)
+            scores[category.name] = min(100, score)
         
-        return {
-            'overall_score': overall_score,
-            'category_scores': scores,
-            'feedback': feedback,
-            'style_compliance': 'Executive' if overall_score >= 80 else 'Needs executive presence'
-        }
-    
-    def _evaluate_startup_style(self, bio: str, analysis: Dict) -> Dict[str, Any]:
-        """Evaluate bio for startup style standards."""
-        
-        scores = {}
-        feedback = []
-        
-        # Innovation & Agility (35%)
-        innovation_keywords = ['innovative', 'disruption', 'startup', 'entrepreneur', 'agile', 'rapid']
-        innovation_score = sum(20 for keyword in innovation_keywords if keyword in bio.lower())
-        scores['innovation'] = min(100, innovation_score)
-        
-        # Growth & Scale (25%)
-        growth_indicators = ['scale', 'growth', 'launch', 'built', 'shipped', '0 to']
-        growth_score = sum(25 for indicator in growth_indicators if indicator in bio.lower())
-        scores['growth_focus'] = min(100, growth_score)
-        
-        # Versatility (20%)
-        versatility_score = 0
-        if len(analysis.get('technical_terms', 0)) >= 2:
-            versatility_score += 40
-        if analysis['action_verbs'] >= 4:
-            versatility_score += 40
-        multi_role_indicators = ['full-stack', 'end-to-end', 'product', 'business']
-        versatility_score += sum(5 for indicator in multi_role_indicators if indicator in bio.lower())
-        scores['versatility'] = min(100, versatility_score)
-        
-        # Energy & Passion (20%)
-        energy_score = analysis['engagement_count'] * 30
-        scores['energy'] = min(100, energy_score)
-        
-        # Overall score
-        weights = {'innovation': 0.35, 'growth_focus': 0.25, 'versatility': 0.2, 'energy': 0.2}
-        overall_score = sum(scores[key] * weights[key] for key in scores)
-        
-        # Generate feedback
-        if scores['innovation'] < 70:
-            feedback.append("Emphasize innovation and disruptive thinking")
-        if scores['growth_focus'] < 70:
-            feedback.append("Include more growth and scaling achievements")
-        if scores['energy'] < 60:
-            feedback.append("Add more energy and entrepreneurial passion")
+        overall_score = sum(scores[category.name] * category.weight for category in spec.categories)
+        feedback = [message for name, threshold, message in spec.feedback if scores[name] < threshold]
         
         return {
             'overall_score': overall_score,
             'category_scores': scores,
             'feedback': feedback,
-            'style_compliance': 'Startup-ready' if overall_score >= 75 else 'Needs startup energy'
+            'style_compliance': spec.compliant_label if overall_score >= spec.compliant_score else spec.needs_work_label
         }
     
     def iterative_bio_improvement(self, request: EnhancementRequest, previous_attempts: List[str] = None, user_feedback: str = None) -> EnhancementResult:
@@ -1313,16 +1847,7 @@ ENHANCED BIO:
     def _select_iterative_model(self, style: str) -> str:
         """Select optimal model for iterative improvement tasks."""
         
-        # Models that excel at iterative and creative tasks
-        iterative_models = {
-            "creative": "anthropic/claude-3-opus",  # Best for creative iteration
-            "technical": "anthropic/claude-sonnet-4.5",  # Best for technical precision
-            "professional": "openai/gpt-4-turbo",  # Good balance for professional content
-            "executive": "anthropic/claude-3-sonnet",  # Strategic thinking
-            "startup": "google/gemini-2.5-flash"  # Fast and energetic
-        }
-        
-        selected = iterative_models.get(style, "anthropic/claude-3-sonnet")
+        selected = _ITERATIVE_MODELS.get(style, "anthropic/claude-3-sonnet")
         
         # Fallback to current model if selected model not available
         if selected not in self.model_pricing:
@@ -1340,25 +1865,12 @@ ENHANCED BIO:
         iteration_insights = []
         
         if previous_attempts:
-            # Check for novelty
-            enhanced_lower = enhanced.lower()
-            novelty_score = 0
-            
-            for attempt in previous_attempts:
-                # Calculate similarity (simplified)
-                attempt_lower = attempt.lower()
-                common_phrases = []
-                
-                # Check for repeated phrases
-                enhanced_words = set(enhanced_lower.split())
-                attempt_words = set(attempt_lower.split())
-                overlap = len(enhanced_words.intersection(attempt_words))
-                total_words = len(enhanced_words.union(attempt_words))
-                
-                similarity = overlap / total_words if total_words > 0 else 0
-                novelty_score += (1 - similarity) * 100
-            
-            novelty_score = novelty_score / len(previous_attempts)
+            # Check for novelty: mean word-set dissimilarity to each attempt (simplified)
+            enhanced_words = _word_set(enhanced)
+            novelty_score = sum(
+                (1 - _jaccard_similarity(enhanced_words, _word_set(attempt))) * 100
+                for attempt in previous_attempts
+            ) / len(previous_attempts)
             
             if novelty_score > 70:
                 iteration_insights.append("Successfully avoided repetition from previous attempts")
@@ -1369,13 +1881,13 @@ ENHANCED BIO:
             
             # Check for improvement trends
             word_counts = [len(attempt.split()) for attempt in previous_attempts]
-            enhanced_words = len(enhanced.split())
+            enhanced_word_count = len(enhanced.split())
             
             if word_counts:
                 avg_previous_length = sum(word_counts) / len(word_counts)
-                if enhanced_words > avg_previous_length * 1.1:
+                if enhanced_word_count > avg_previous_length * 1.1:
                     iteration_insights.append("Expanded content compared to previous iterations")
-                elif enhanced_words < avg_previous_length * 0.9:
+                elif enhanced_word_count < avg_previous_length * 0.9:
                     iteration_insights.append("Condensed content for better impact")
         
         # Combine with base improvements
@@ -1461,47 +1973,17 @@ ENHANCED BIO:
         projects = ", ".join(request.project_highlights[:2]) if request.project_highlights else "innovative solutions"
         achievements = ", ".join(request.technical_achievements[:2]) if request.technical_achievements else "significant impact"
         
-        # Style-specific templates
-        templates = {
-            "professional": f"""
-Experienced {request.target_role} with expertise in {languages}. Proven track record of delivering high-quality solutions and driving technical excellence in {request.target_industry}.
-
-Key accomplishments include {achievements} through projects like {projects}. Skilled in building scalable applications and leading technical initiatives that deliver measurable business value.
-
-Passionate about innovation and continuous learning, with a focus on leveraging cutting-edge technologies to solve complex challenges. Always seeking opportunities to collaborate with talented teams and contribute to impactful projects.
-
-Let's connect to discuss {request.target_industry} opportunities and technical collaboration.""",
-            
-            "creative": f"""
-I'm a {request.target_role} who loves turning ideas into reality through code! 🚀
-
-My toolkit includes {languages}, and I've had the pleasure of building {projects}. What drives me is the opportunity to create solutions that make a real difference.
-
-Some highlights from my journey: {achievements}. Each project has taught me something new and pushed me to grow as both a developer and a problem-solver.
-
-When I'm not coding, you'll find me exploring new technologies and contributing to the {request.target_industry} community. I believe the best software comes from passionate people working together.
-
-Always excited to connect with fellow creators and innovators! Let's build something amazing together. ✨""",
-            
-            "technical": f"""
-Senior {request.target_role} specializing in {languages} with focus on scalable architecture and system optimization.
-
-Technical expertise includes {achievements} across projects involving {projects}. Experience spans full-stack development, performance optimization, and building robust systems that handle scale.
-
-Core competencies:
-• Architecture design and implementation
-• Performance optimization and scalability
-• Code quality and engineering best practices
-• Technical leadership and mentorship
-
-Committed to engineering excellence and continuous improvement. Open to discussing technical challenges, architecture decisions, and engineering opportunities in {request.target_industry}."""
-        }
-        
-        # Select appropriate template
-        template = templates.get(request.target_style, templates["professional"])
+        # Style-specific template; only the selected one is filled in
+        template = _FALLBACK_TEMPLATES.get(request.target_style, _FALLBACK_TEMPLATES["professional"])
         
-        # Clean up the template
-        enhanced = template.strip()
+        # Fill in and clean up the template
+        enhanced = template.format(
+            languages=languages,
+            projects=projects,
+            achievements=achievements,
+            target_role=request.target_role,
+            target_industry=request.target_industry
+        ).strip()
         
         # Basic validation and cleanup
         if len(enhanced) < 100:
@@ -1511,132 +1993,31 @@ Committed to engineering excellence and continuous improvement. Open to discussi
     
     def _get_style_specific_instructions(self, style: str) -> str:
         """Get detailed style-specific instructions."""
-        style_guides = {
-            "professional": """
-• Tone: Confident, accomplished, approachable
-• Language: Clear, direct, industry-appropriate
-• Structure: Achievement-focused with quantifiable results
-• Voice: Third-person perspective, authoritative but humble
-• Keywords: Leadership, expertise, results, innovation
-• Avoid: Overly casual language, buzzword overload""",
-            
-            "creative": """
-• Tone: Innovative, passionate, authentic
-• Language: Vivid, engaging, story-driven
-• Structure: Journey narrative with creative metaphors
-• Voice: First-person, personal yet professional
-• Keywords: Innovation, creativity, vision, impact
-• Avoid: Corporate jargon, overly formal language""",
-            
-            "technical": """
-• Tone: Precise, knowledgeable, solution-oriented
-• Language: Technical accuracy with accessibility
-• Structure: Problem-solution focused with metrics
-• Voice: Expert practitioner, thought leader
-• Keywords: Architecture, scalability, optimization, systems
-• Avoid: Non-technical fluff, generic statements""",
-            
-            "executive": """
-• Tone: Strategic, visionary, results-driven
-• Language: Business-focused, outcome-oriented
-• Structure: Vision → execution → impact → future
-• Voice: Thought leader, change agent
-• Keywords: Strategy, transformation, growth, leadership
-• Avoid: Operational details, technical jargon""",
-            
-            "startup": """
-• Tone: Energetic, agile, growth-minded
-• Language: Fast-paced, opportunity-focused
-• Structure: Problem → solution → traction → vision
-• Voice: Builder, innovator, risk-taker
-• Keywords: Scale, disruption, innovation, growth
-• Avoid: Corporate bureaucracy language, slow/safe terminology"""
-        }
-        
-        return style_guides.get(style, style_guides["professional"])
+        return _STYLE_GUIDES.get(style, _STYLE_GUIDES["professional"])
     
     def _get_enhancement_approach(self, enhancement_type: str) -> str:
         """Get specific enhancement approach instructions."""
-        approaches = {
-            "improve": "Transform this bio into a compelling narrative that showcases expertise while maintaining authenticity. Enhance clarity, impact, and professional appeal.",
-            "rewrite": "Completely reimagine this bio with fresh perspective, better flow, and stronger positioning. Create a new narrative structure while preserving core achievements.",
-            "optimize": "Engineer this bio for maximum LinkedIn visibility and engagement. Focus on keyword optimization, algorithm-friendly structure, and recruiter appeal.",
-            "personalize": "Inject authentic personality and unique voice while maintaining professional standards. Make it memorable and distinctly human."
-        }
-        
-        return approaches.get(enhancement_type, approaches["improve"])
+        return _ENHANCEMENT_APPROACHES.get(enhancement_type, _ENHANCEMENT_APPROACHES["improve"])
     
     def _get_target_audience(self, role: str, industry: str) -> str:
         """Get target audience description."""
-        audience_map = {
-            "technology": "CTOs, Engineering Managers, Tech Recruiters, Startup Founders",
-            "fintech": "Finance Leaders, Risk Managers, Fintech Recruiters, Investment Partners",
-            "healthcare": "Healthcare CIOs, Medical Directors, Health Tech Recruiters",
-            "ecommerce": "E-commerce Leaders, Product Managers, Digital Marketing Directors",
-            "gaming": "Game Studio Leaders, Creative Directors, Gaming Industry Recruiters",
-            "ai_ml": "AI Research Leaders, Data Science Managers, ML Engineering Directors"
-        }
-        
-        return audience_map.get(industry, "Hiring Managers, Team Leaders, Industry Recruiters")
+        return _TARGET_AUDIENCES.get(industry, "Hiring Managers, Team Leaders, Industry Recruiters")
     
     def _get_industry_keywords(self, industry: str) -> str:
         """Get industry-specific keywords to integrate."""
-        keyword_sets = {
-            "technology": "software engineering, scalability, architecture, DevOps, cloud",
-            "fintech": "financial technology, compliance, risk management, payments, blockchain",
-            "healthcare": "healthcare technology, patient care, medical software, HIPAA, clinical",
-            "ecommerce": "e-commerce, conversion optimization, customer experience, analytics",
-            "gaming": "game development, user engagement, monetization, player experience",
-            "ai_ml": "artificial intelligence, machine learning, data science, automation"
-        }
-        
-        return keyword_sets.get(industry, "innovation, technology, leadership, results")
+        return _INDUSTRY_KEYWORDS.get(industry, "innovation, technology, leadership, results")
     
     def suggest_optimal_model(self, request: EnhancementRequest, budget_preference: str = "balanced") -> str:
         """Suggest optimal model based on bio requirements and budget."""
         
-        # Define model categories by strength
-        creative_models = [
-            "anthropic/claude-3-opus",
-            "anthropic/claude-sonnet-4.5", 
-            "openai/gpt-4-turbo",
-            "anthropic/claude-3-sonnet"
-        ]
-        
-        technical_models = [
-            "anthropic/claude-sonnet-4.5",
-            "openai/gpt-4-turbo",
-            "deepseek/deepseek-v3.2-exp",
-            "anthropic/claude-3-sonnet"
-        ]
-        
-        cost_effective_models = [
-            "meta-llama/llama-3-8b-instruct",
-            "google/gemini-2.5-flash",
-            "anthropic/claude-3-haiku",
-            "deepseek/deepseek-v3.2-exp"
-        ]
-        
-        premium_models = [
-            "anthropic/claude-sonnet-4.5",
-            "openai/gpt-4-turbo",
-            "anthropic/claude-3-opus",
-            "openai/gpt-4"
-        ]
-        
         # Selection logic based on style and budget
         if budget_preference == "economy":
-            candidate_models = cost_effective_models
+            candidate_models = _COST_EFFECTIVE_MODELS
         elif budget_preference == "premium":
-            candidate_models = premium_models
+            candidate_models = _PREMIUM_MODELS
         else:  # balanced
             # Choose based on style requirements
-            if request.target_style == "creative":
-                candidate_models = ["anthropic/claude-3-sonnet", "openai/gpt-3.5-turbo", "google/gemini-2.5-flash"]
-            elif request.target_style == "technical":
-                candidate_models = ["deepseek/deepseek-v3.2-exp", "anthropic/claude-3-sonnet", "meta-llama/llama-3-8b-instruct"]
-            else:
-                candidate_models = ["anthropic/claude-3-haiku", "google/gemini-2.5-flash", "meta-llama/llama-3-8b-instruct"]
+            candidate_models = _BALANCED_MODELS_BY_STYLE.get(request.target_style, _BALANCED_DEFAULT_MODELS)
         
         # Return first available model (could add availability checking)
         for model in candidate_models:
@@ -1644,6 +2025,7 @@ Committed to engineering excellence and continuous improvement. Open to discussi
                 return model
         
         # Fallback to default
+        self._ensure_settings_loaded()
         return self.config.model
     
     def get_model_recommendations(self, request: EnhancementRequest) -> List[Dict[str, Any]]:
@@ -1652,12 +2034,9 @@ Committed to engineering excellence and continuous improvement. Open to discussi
         
         bio_length = len(request.original_bio.split())
         
-        for model_id, pricing in self.model_pricing.items():
-            # Estimate cost for this bio
-            estimated_cost = pricing.estimate_bio_cost()
-            
-            # Calculate quality score based on model characteristics
-            quality_score = self._calculate_model_quality_score(model_id, request.target_style)
+        # Cost and quality score of each model for this style
+        for model_id, estimated_cost, quality_score, _ in _model_value_rows(request.target_style):
+            pricing = self.model_pricing[model_id]
             
             # Calculate speed score
             speed_score = max(0, 100 - (pricing.latency * 20))  # Lower latency = higher score
@@ -1680,95 +2059,38 @@ Committed to engineering excellence and continuous improvement. Open to discussi
         
         return recommendations
     
-    def _calculate_model_quality_score(self, model_id: str, style: str) -> float:
-        """Calculate quality score for model based on style requirements."""
-        
-        # Base scores for each model (subjective, based on general performance)
-        base_scores = {
-            "anthropic/claude-sonnet-4.5": 95,
-            "anthropic/claude-3-opus": 92,
-            "openai/gpt-4-turbo": 90,
-            "openai/gpt-4": 88,
-            "anthropic/claude-3-sonnet": 85,
-            "deepseek/deepseek-v3.2-exp": 82,
-            "google/gemini-2.5-flash": 80,
-            "anthropic/claude-3-haiku": 78,
-            "openai/gpt-3.5-turbo": 75,
-            "meta-llama/llama-3-70b-instruct": 73,
-            "meta-llama/llama-3-8b-instruct": 70
-        }
-        
-        base_score = base_scores.get(model_id, 70)
-        
-        # Style-specific adjustments
-        style_adjustments = {
-            "creative": {
-                "anthropic/claude-3-opus": 8,
-                "anthropic/claude-sonnet-4.5": 6,
-                "openai/gpt-4-turbo": 5,
-                "anthropic/claude-3-sonnet": 4
-            },
-            "technical": {
-                "deepseek/deepseek-v3.2-exp": 8,
-                "anthropic/claude-sonnet-4.5": 6,
-                "openai/gpt-4-turbo": 5,
-                "meta-llama/llama-3-8b-instruct": 3
-            },
-            "professional": {
-                "anthropic/claude-3-sonnet": 5,
-                "openai/gpt-3.5-turbo": 4,
-                "anthropic/claude-3-haiku": 3
-            }
-        }
-        
-        adjustment = style_adjustments.get(style, {}).get(model_id, 0)
-        
-        return min(100, base_score + adjustment)
-    
     def _get_model_best_use_case(self, model_id: str, style: str) -> str:
         """Get best use case description for model."""
-        
-        use_cases = {
-            "anthropic/claude-sonnet-4.5": "Premium content with exceptional reasoning",
-            "anthropic/claude-3-opus": "Highest quality creative writing",
-            "openai/gpt-4-turbo": "Professional content with reliability",
-            "anthropic/claude-3-sonnet": "Balanced quality and cost",
-            "deepseek/deepseek-v3.2-exp": "Technical content, excellent value",
-            "google/gemini-2.5-flash": "Fast, cost-effective generation",
-            "anthropic/claude-3-haiku": "Budget-friendly, reliable quality",
-            "openai/gpt-3.5-turbo": "Standard professional content",
-            "meta-llama/llama-3-8b-instruct": "Very cost-effective, good quality"
-        }
-        
+        return _MODEL_USE_CASES.get(model_id, "General-purpose bio enhancement")
+    
     def optimize_for_budget(self, request: EnhancementRequest, max_budget: float = 0.01) -> Dict[str, Any]:
         """Optimize model selection and parameters for budget constraints."""
         
         # Get all viable models within budget
-        viable_models = []
-        for model_id, pricing in self.model_pricing.items():
-            estimated_cost = pricing.estimate_bio_cost()
-            if estimated_cost <= max_budget:
-                quality_score = self._calculate_model_quality_score(model_id, request.target_style)
-                viable_models.append({
-                    "model_id": model_id,
-                    "estimated_cost": estimated_cost,
-                    "quality_score": quality_score,
-                    "value_score": quality_score / (estimated_cost * 1000)  # Quality per cent
-                })
+        viable_models = [
+            {
+                "model_id": model_id,
+                "estimated_cost": estimated_cost,
+                "quality_score": quality_score,
+                "value_score": value_score
+            }
+            for model_id, estimated_cost, quality_score, value_score in _model_value_rows(request.target_style)
+            if estimated_cost <= max_budget
+        ]
         
         if not viable_models:
             # If no models within budget, suggest cheapest option
-            cheapest = min(self.model_pricing.items(), key=lambda x: x[1].estimate_bio_cost())
+            cheapest = min(self._bio_costs, key=self._bio_costs.get)
             return {
-                "recommended_model": cheapest[0],
-                "estimated_cost": cheapest[1].estimate_bio_cost(),
+                "recommended_model": cheapest,
+                "estimated_cost": self._bio_costs[cheapest],
                 "budget_exceeded": True,
-                "message": f"Budget too low. Cheapest option is ${cheapest[1].estimate_bio_cost():.4f}"
+                "message": f"Budget too low. Cheapest option is ${self._bio_costs[cheapest]:.4f}"
             }
         
-        # Sort by value score (quality per cost)
-        viable_models.sort(key=lambda x: x["value_score"], reverse=True)
-        best_option = viable_models[0]
+        # Best three by value score (quality per cost); only these are reported
+        top_models = heapq.nlargest(3, viable_models, key=lambda x: x["value_score"])
+        best_option = top_models[0]
         
         return {
             "recommended_model": best_option["model_id"],
@@ -1776,7 +2098,7 @@ Committed to engineering excellence and continuous improvement. Open to discussi
             "quality_score": best_option["quality_score"],
             "value_score": best_option["value_score"],
             "budget_exceeded": False,
-            "alternatives": viable_models[1:3],  # Top 2 alternatives
+            "alternatives": top_models[1:],  # Top 2 alternatives
             "savings": max_budget - best_option["estimated_cost"]
         }
     
@@ -1796,11 +2118,8 @@ Committed to engineering excellence and continuous improvement. Open to discussi
         
         models_data = []
         
-        for model_id, pricing in self.model_pricing.items():
-            estimated_cost = pricing.estimate_bio_cost()
-            quality_score = self._calculate_model_quality_score(model_id, request.target_style)
-            value_score = quality_score / (estimated_cost * 1000)
-            
+        for model_id, estimated_cost, quality_score, value_score in _model_value_rows(request.target_style):
+            pricing = self.model_pricing[model_id]
             model_data = {
                 "model_id": model_id,
                 "model_name": pricing.model_name,
@@ -1835,6 +2154,7 @@ Committed to engineering excellence and continuous improvement. Open to discussi
     def estimate_monthly_costs(self, daily_bio_count: int, model_id: str = None) -> Dict[str, Any]:
         """Estimate monthly costs based on usage patterns."""
         
+        self._ensure_settings_loaded()
         model_id = model_id or self.config.model
         pricing = self.get_model_pricing(model_id)
         
@@ -1873,34 +2193,30 @@ Committed to engineering excellence and continuous improvement. Open to discussi
             "recommendations": budget_recommendations
         }
     
-    def _make_api_request(self, prompt: str, max_tokens: int = None, temperature: float = None) -> Optional[Dict]:
-        """Make API request to OpenRouter with robust error handling and retry logic."""
+    def _make_api_request(self, prompt: str, max_tokens: int = None, temperature: float = None,
+                          stream: bool = False,
+                          on_token: Optional[Callable[[str], None]] = None) -> Optional[Dict]:
+        """Make API request to OpenRouter with robust error handling and retry logic.
+        
+        With ``stream`` the completion is received as server-sent events and
+        reassembled into the usual response shape; ``on_token`` gets each
+        piece of content as it arrives.
+        """
+        self._ensure_settings_loaded()
         if not self.config.api_key:
             raise ValueError("OpenRouter API key not configured")
         
         url = f"{self.config.base_url}/chat/completions"
-        
-        headers = {
-            "Authorization": f"Bearer {self.config.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/dev-alt/RepoReadme",
-            "X-Title": "RepoReadme AI Bio Generator"
-        }
-        
-        data = {
-            "model": self.config.model,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "max_tokens": max_tokens or self.config.max_tokens,
-            "temperature": temperature or self.config.temperature
-        }
-        
-        # Multiple attempt strategy with different approaches
+        self._sync_auth_header()
+        # Serialized once and reused by every attempt; Content-Type comes from the session headers
+        payload = self._chat_payload(prompt, max_tokens, temperature)
+        if stream:
+            payload["stream"] = True
+        data = _json_dumps(payload)
+        
+        # Each attempt relaxes the TLS setup after an SSL failure
         last_error = None
+        response = None
         
         for attempt in range(3):
             try:
@@ -1908,75 +2224,264 @@ Committed to engineering excellence and continuous improvement. Open to discussi
                 
                 if attempt == 0:
                     # First attempt: Normal request with session
-                    response = self.session.post(
+                    response = self._send_with_backoff(
+                        self.session.post,
                         url, 
-                        headers=headers, 
-                        json=data, 
+                        data=data, 
                         timeout=60,
-                        verify=True
+                        verify=True,
+                        stream=stream
                     )
                 elif attempt == 1:
                     # Second attempt: Disable SSL verification
                     self.logger.warning("Attempting request with SSL verification disabled")
-                    response = self.session.post(
+                    response = self._send_with_backoff(
+                        self.session.post,
                         url, 
-                        headers=headers, 
-                        json=data, 
+                        data=data, 
                         timeout=60,
-                        verify=False
+                        verify=False,
+                        stream=stream
                     )
                 else:
                     # Third attempt: Fresh session with basic requests
                     self.logger.warning("Attempting with fresh requests session")
-                    response = requests.post(
+                    response = self._send_with_backoff(
+                        requests.post,
                         url, 
-                        headers=headers, 
-                        json=data, 
+                        headers=self.session.headers, 
+                        data=data, 
                         timeout=60,
-                        verify=False
+                        verify=False,
+                        stream=stream
                     )
                 
                 response.raise_for_status()
-                return response.json()
+                if stream:
+                    break
+                return _json_loads(response.content)
                 
             except requests.exceptions.SSLError as e:
+                # Only a failed TLS handshake moves on to the next attempt;
+                # 429/5xx are retried by _send_with_backoff and refused
+                # connections by the session adapter, so anything else is final
                 last_error = e
                 self.logger.warning(f"SSL error on attempt {attempt + 1}: {e}")
                 if attempt < 2:
                     time.sleep(2 ** attempt)  # Exponential backoff
                 continue
                 
-            except requests.exceptions.ConnectionError as e:
-                last_error = e
-                self.logger.warning(f"Connection error on attempt {attempt + 1}: {e}")
-                if attempt < 2:
-                    time.sleep(2 ** attempt)
-                continue
+            except requests.exceptions.RequestException as e:
+                self.logger.error(f"OpenRouter API request failed: {e}")
+                raise
+            
+        else:
+            # All attempts failed
+            self.logger.error(f"All API request attempts failed. Last error: {last_error}")
+            raise last_error
+        
+        # Read outside the retry loop: once tokens have reached on_token a
+        # second request would repeat them, so stream and callback errors
+        # are raised to the caller as they are
+        return self._read_event_stream(response, on_token)
+    
+    def _read_event_stream(self, response: requests.Response,
+                           on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """Collect a streamed chat completion into a non-streamed response dict."""
+        parts = []
+        result = {"id": "", "model": self.config.model, "usage": {}}
+        with response:
+            for line in response.iter_lines():
+                # Blank keep-alives and ": OPENROUTER PROCESSING" comments carry no data
+                if not line.startswith(b"data:"):
+                    continue
+                event = line[5:].strip()
+                if event == b"[DONE]":
+                    break
                 
-            except requests.exceptions.Timeout as e:
-                last_error = e
-                self.logger.warning(f"Timeout error on attempt {attempt + 1}: {e}")
-                if attempt < 2:
-                    time.sleep(1)
-                continue
+                chunk = _json_loads(event)
+                if "error" in chunk:
+                    raise RuntimeError(f"OpenRouter stream error: {chunk['error']}")
+                result["id"] = chunk.get("id") or result["id"]
+                result["model"] = chunk.get("model") or result["model"]
+                if chunk.get("usage"):
+                    result["usage"] = chunk["usage"]
                 
-            except requests.exceptions.RequestException as e:
-                last_error = e
-                self.logger.warning(f"Request error on attempt {attempt + 1}: {e}")
-                if attempt < 2:
-                    time.sleep(1)
-                continue
+                for choice in chunk.get("choices", ()):
+                    text = (choice.get("delta") or {}).get("content")
+                    if text:
+                        parts.append(text)
+                        if on_token is not None:
+                            on_token(text)
+        
+        result["choices"] = [{"message": {"role": "assistant", "content": "".join(parts)}}]
+        return result
+    
+    def _send_with_backoff(self, send, url: str, **kwargs) -> requests.Response:
+        """Call ``send(url, **kwargs)``, retrying 429 and 5xx responses.
+        
+        Waits a random time up to an exponentially growing bound between
+        tries, so clients hitting the same outage do not retry in lockstep,
+        and never less than the server's Retry-After. Waits are capped at
+        _RETRY_MAX_DELAY; the last response is returned as is.
+        """
+        for retry in range(_MAX_RETRIES + 1):
+            response = send(url, **kwargs)
+            if response.status_code not in _RETRY_STATUSES or retry == _MAX_RETRIES:
+                return response
+            
+            delay = _backoff_delay(retry, response.headers)
+            self.logger.warning(f"OpenRouter returned {response.status_code}, retrying in {delay:.1f}s")
+            response.close()
+            time.sleep(delay)
+    
+    async def _amake_api_request(self, session: "aiohttp.ClientSession", prompt: str,
+                                 max_tokens: int = None, temperature: float = None) -> Optional[Dict]:
+        """Async counterpart of _make_api_request on a caller-owned aiohttp session.
+        
+        Retries like the blocking path: 429 and 5xx responses with jittered
+        backoff, and a failed TLS handshake once without certificate checks.
+        """
+        if not self.config.api_key:
+            raise ValueError("OpenRouter API key not configured")
+        
+        url = f"{self.config.base_url}/chat/completions"
+        payload = self._chat_payload(prompt, max_tokens, temperature)
+        async with self._request_slot():
+            try:
+                return await self._apost_with_backoff(session, url, payload)
+            except aiohttp.ClientSSLError as e:
+                self.logger.warning(f"SSL error, attempting request with SSL verification disabled: {e}")
+                return await self._apost_with_backoff(session, url, payload, ssl=False)
+    
+    async def _apost_with_backoff(self, session: "aiohttp.ClientSession", url: str,
+                                  payload: Dict[str, Any], **kwargs) -> Dict:
+        """POST ``payload`` as JSON, retrying 429 and 5xx responses like _send_with_backoff."""
+        for retry in range(_MAX_RETRIES + 1):
+            await self._await_rate_limit()
+            async with session.post(url, json=payload, **kwargs) as response:
+                if response.status not in _RETRY_STATUSES or retry == _MAX_RETRIES:
+                    response.raise_for_status()
+                    return await response.json()
                 
-            except Exception as e:
-                last_error = e
-                self.logger.error(f"Unexpected error on attempt {attempt + 1}: {e}")
-                if attempt < 2:
-                    time.sleep(1)
-                continue
+                delay = _backoff_delay(retry, response.headers)
+                self.logger.warning(f"OpenRouter returned {response.status}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
+    def _request_slot(self) -> asyncio.Semaphore:
+        """Semaphore limiting in-flight async requests to config.max_concurrency."""
+        loop = asyncio.get_running_loop()
+        if self._sem_loop is not loop:
+            self._sem = asyncio.Semaphore(max(1, self.config.max_concurrency))
+            self._sem_loop = loop
+        return self._sem
+    
+    async def _await_rate_limit(self):
+        """Space request starts evenly to stay within config.requests_per_minute."""
+        if self.config.requests_per_minute <= 0:
+            return
+        now = time.monotonic()
+        start = max(now, self._next_request_at)
+        self._next_request_at = start + 60.0 / self.config.requests_per_minute
+        if start > now:
+            await asyncio.sleep(start - now)
+    
+    async def _abatch_api_requests(self, session: "aiohttp.ClientSession", prompts: List[str],
+                                   max_tokens: int = None, temperature: float = None) -> List[Any]:
+        """Run chat completions for ``prompts`` as one OpenAI-style batch job.
+        
+        Uploads the requests as JSONL, polls the job with exponential backoff
+        until it finishes or ``config.batch_timeout`` passes, and returns the
+        response bodies in prompt order. Prompts without a result get an
+        exception in their slot, like ``asyncio.gather(return_exceptions=True)``.
+        """
+        base_url = self.config.base_url
+        lines = [
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._chat_payload(prompt, max_tokens, temperature)
+            })
+            for i, prompt in enumerate(prompts)
+        ]
         
-        # All attempts failed
-        self.logger.error(f"All API request attempts failed. Last error: {last_error}")
-        raise last_error
+        with aiohttp.MultipartWriter("form-data") as form:
+            form.append("batch").set_content_disposition("form-data", name="purpose")
+            form.append("\n".join(lines), {"Content-Type": "application/jsonl"}).set_content_disposition(
+                "form-data", name="file", filename="bio_alternatives.jsonl")
+        upload = await self._abatch_call(session, "POST", f"{base_url}/files", data=form,
+                                         headers={"Content-Type": form.content_type})
+        
+        batch = await self._abatch_call(session, "POST", f"{base_url}/batches", json={
+            "input_file_id": upload["id"],
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h"
+        })
+        self.logger.info(f"📦 Submitted batch {batch['id']} with {len(prompts)} requests")
+        
+        deadline = time.monotonic() + self.config.batch_timeout
+        delay = 2.0
+        while batch.get("status") not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() + delay > deadline:
+                raise TimeoutError(f"batch {batch['id']} still {batch.get('status')} after "
+                                   f"{self.config.batch_timeout:.0f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _BATCH_POLL_MAX_DELAY)
+            batch = await self._abatch_call(session, "GET", f"{base_url}/batches/{batch['id']}")
+        
+        if batch["status"] != "completed" or not batch.get("output_file_id"):
+            raise RuntimeError(f"batch {batch['id']} ended as {batch['status']}")
+        
+        output = await self._abatch_call(session, "GET", f"{base_url}/files/{batch['output_file_id']}/content")
+        results: List[Any] = [RuntimeError("no result in batch output")] * len(prompts)
+        for line in output.splitlines():
+            if line.strip():
+                record = _json_loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") == 200:
+                    results[int(record["custom_id"])] = response["body"]
+                else:
+                    results[int(record["custom_id"])] = RuntimeError(record.get("error") or response)
+        return results
+    
+    async def _abatch_call(self, session: "aiohttp.ClientSession", method: str, url: str, **kwargs) -> Any:
+        """One batch API call, waiting out 429 responses as told by Retry-After.
+        
+        Returns parsed JSON, or the body text for non-JSON responses.
+        """
+        for attempt in range(5):
+            async with session.request(method, url, **kwargs) as response:
+                if response.status == 429 and attempt < 4:
+                    wait = _retry_after_seconds(response.headers)
+                    if wait is None:
+                        wait = 2.0 ** attempt
+                    self.logger.warning(f"Batch API rate limited, retrying in {wait:.0f}s")
+                    await asyncio.sleep(min(wait, _BATCH_POLL_MAX_DELAY))
+                    continue
+                
+                response.raise_for_status()
+                if response.content_type == "application/json":
+                    return await response.json()
+                return await response.text()
+    
+    def _api_headers(self) -> Dict[str, str]:
+        """Headers for a new aiohttp session, matching the requests session."""
+        return {**_STATIC_HEADERS, "Authorization": f"Bearer {self.config.api_key}"}
+    
+    def _chat_payload(self, prompt: str, max_tokens: int = None, temperature: float = None) -> Dict[str, Any]:
+        """Request body for a single-prompt chat completion."""
+        return {
+            "model": self.config.model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "max_tokens": max_tokens or self.config.max_tokens,
+            "temperature": self.config.temperature if temperature is None else temperature
+        }
     
     def _extract_bio_from_response(self, response_content: str) -> str:
         """Extract clean bio from AI response."""
@@ -1984,19 +2489,7 @@ Committed to engineering excellence and continuous improvement. Open to discussi
         bio = response_content.strip()
         
         # Remove common prefixes
-        prefixes_to_remove = [
-            "Enhanced bio:",
-            "Optimized bio:",
-            "Alternative bio:",
-            "Here's the enhanced bio:",
-            "Here's an optimized version:",
-            "Bio:",
-            "LinkedIn bio:"
-        ]
-        
-        for prefix in prefixes_to_remove:
-            if bio.lower().startswith(prefix.lower()):
-                bio = bio[len(prefix):].strip()
+        bio = bio[_RESPONSE_PREFIX_RE.match(bio).end():]
         
         # Remove quotes if the entire bio is quoted
         if bio.startswith('"') and bio.endswith('"'):
@@ -2006,38 +2499,25 @@ Committed to engineering excellence and continuous improvement. Open to discussi
     
     def _analyze_improvements(self, original: str, enhanced: str) -> Dict[str, Any]:
         """Analyze improvements made to the bio with sophisticated metrics."""
-        improvements = []
-        suggestions = []
-        
         # Advanced text analysis
         original_analysis = self._analyze_bio_text(original)
         enhanced_analysis = self._analyze_bio_text(enhanced)
         
         # Content expansion analysis
-        if enhanced_analysis['word_count'] > original_analysis['word_count'] * 1.2:
+        improvements = []
+        original_words = original_analysis['word_count']
+        enhanced_words = enhanced_analysis['word_count']
+        if enhanced_words > original_words * 1.2:
             improvements.append("Expanded content with more detail")
-        elif enhanced_analysis['word_count'] < original_analysis['word_count'] * 0.8:
+        elif enhanced_words < original_words * 0.8:
             improvements.append("Condensed content for better impact")
         
-        # Quantification improvements
-        if enhanced_analysis['number_count'] > original_analysis['number_count']:
-            improvements.append("Added quantified achievements")
-        
-        # Technical skills enhancement
-        if enhanced_analysis['technical_terms'] > original_analysis['technical_terms']:
-            improvements.append("Enhanced technical skills listing")
-        
-        # Action verb strengthening
-        if enhanced_analysis['action_verbs'] > original_analysis['action_verbs']:
-            improvements.append("Strengthened action verbs")
-        
-        # Structure improvements
-        if enhanced_analysis['sentence_variety'] > original_analysis['sentence_variety']:
-            improvements.append("Improved sentence structure variety")
-        
-        # Keyword optimization
-        if enhanced_analysis['keyword_density'] > original_analysis['keyword_density']:
-            improvements.append("Optimized keyword usage")
+        # Metrics that count as an improvement whenever they go up
+        improvements.extend(
+            message
+            for metric, message in _METRIC_GAIN_IMPROVEMENTS
+            if enhanced_analysis[metric] > original_analysis[metric]
+        )
         
         # Calculate sophisticated improvement scores
         readability_improvement = self._calculate_readability_improvement(original_analysis, enhanced_analysis)
@@ -2059,72 +2539,8 @@ Committed to engineering excellence and continuous improvement. Open to discussi
     
     def _analyze_bio_text(self, text: str) -> Dict[str, Any]:
         """Perform comprehensive text analysis on bio content."""
-        import re
-        
-        words = text.split()
-        sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
-        
-        # Basic metrics
-        word_count = len(words)
-        sentence_count = len(sentences)
-        char_count = len(text)
-        
-        # Advanced metrics
-        avg_words_per_sentence = word_count / max(sentence_count, 1)
-        avg_chars_per_word = char_count / max(word_count, 1)
-        
-        # Count specific elements
-        numbers = re.findall(r'\\d+', text)
-        number_count = len(numbers)
-        
-        # Action verbs (common professional action words)
-        action_verbs = ['led', 'managed', 'built', 'created', 'developed', 'designed', 'implemented', 'optimized',
-                       'delivered', 'achieved', 'improved', 'increased', 'reduced', 'launched', 'architected']
-        action_verb_count = sum(1 for verb in action_verbs if verb in text.lower())
-        
-        # Technical terms (common in software engineering bios)
-        technical_terms = ['api', 'database', 'architecture', 'framework', 'algorithm', 'optimization',
-                          'scalability', 'microservices', 'cloud', 'devops', 'automation', 'ci/cd']
-        technical_term_count = sum(1 for term in technical_terms if term in text.lower())
-        
-        # Keyword density (industry-relevant terms)
-        industry_keywords = ['software', 'engineering', 'development', 'programming', 'technology',
-                           'innovation', 'solutions', 'systems', 'applications', 'projects']
-        keyword_matches = sum(1 for keyword in industry_keywords if keyword in text.lower())
-        keyword_density = (keyword_matches / max(word_count, 1)) * 100
-        
-        # Sentence length variety (standard deviation)
-        sentence_lengths = [len(s.split()) for s in sentences]
-        if len(sentence_lengths) > 1:
-            import statistics
-            sentence_variety = statistics.stdev(sentence_lengths)
-        else:
-            sentence_variety = 0
-        
-        # Engagement indicators
-        engagement_words = ['passionate', 'innovative', 'excited', 'driven', 'love', 'enjoy',
-                           'enthusiastic', 'committed', 'dedicated', 'focused']
-        engagement_count = sum(1 for word in engagement_words if word in text.lower())
-        
-        # Professional indicators
-        professional_words = ['experience', 'expertise', 'proven', 'results', 'successful',
-                             'accomplished', 'established', 'recognized', 'certified']
-        professional_count = sum(1 for word in professional_words if word in text.lower())
-        
-        return {
-            'word_count': word_count,
-            'sentence_count': sentence_count,
-            'char_count': char_count,
-            'avg_words_per_sentence': avg_words_per_sentence,
-            'avg_chars_per_word': avg_chars_per_word,
-            'number_count': number_count,
-            'action_verbs': action_verb_count,
-            'technical_terms': technical_term_count,
-            'keyword_density': keyword_density,
-            'sentence_variety': sentence_variety,
-            'engagement_count': engagement_count,
-            'professional_count': professional_count
-        }
+        # Copied so callers cannot change the cached analysis
+        return dict(_bio_text_analysis(text))
     
     def _calculate_readability_improvement(self, original: Dict, enhanced: Dict) -> float:
         """Calculate readability improvement score."""
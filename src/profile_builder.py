@@ -6,8 +6,11 @@ Builds comprehensive GitHub profiles by analyzing all user repositories,
 extracting insights, and generating portfolio-ready data.
 """
 
+import asyncio
+import heapq
 import json
 import os
+import threading
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
@@ -152,8 +155,13 @@ class GitHubProfileBuilder:
         self.profile = GitHubProfile()
         
     async def build_profile(self, username: str, github_token: Optional[str] = None,
-                          progress_callback: Optional[callable] = None) -> GitHubProfile:
-        """Build a comprehensive GitHub profile."""
+                          progress_callback: Optional[callable] = None,
+                          cancel_event: Optional[threading.Event] = None) -> GitHubProfile:
+        """Build a comprehensive GitHub profile.
+        
+        Setting ``cancel_event`` stops discovery and analysis at the next
+        repository and raises asyncio.CancelledError.
+        """
         start_time = datetime.now()
         self.profile.username = username
         self.profile.analysis_date = start_time.isoformat()
@@ -163,7 +171,8 @@ class GitHubProfileBuilder:
             if progress_callback:
                 progress_callback("Discovering repositories...", 0)
             
-            repos = await self._discover_repositories(username, github_token)
+            repos = await self._discover_repositories(username, github_token, cancel_event)
+            self._check_cancelled(cancel_event)
             if not repos:
                 raise ValueError(f"No repositories found for user: {username}")
             
@@ -172,12 +181,13 @@ class GitHubProfileBuilder:
                 progress_callback("Fetching profile information...", 10)
             
             await self._fetch_user_profile(username, github_token)
+            self._check_cancelled(cancel_event)
             
             # Step 3: Analyze repositories
             if progress_callback:
                 progress_callback("Analyzing repositories...", 20)
             
-            analyzed_repos = await self._analyze_repositories(repos, progress_callback)
+            analyzed_repos = await self._analyze_repositories(repos, progress_callback, cancel_event)
             
             # Step 4: Generate profile insights
             if progress_callback:
@@ -209,7 +219,14 @@ class GitHubProfileBuilder:
             self.logger.error(f"Failed to build profile for {username}: {e}")
             raise
     
-    async def _discover_repositories(self, username: str, github_token: Optional[str]) -> List[RepositoryInfo]:
+    @staticmethod
+    def _check_cancelled(cancel_event: Optional[threading.Event]):
+        """Raise asyncio.CancelledError once ``cancel_event`` is set."""
+        if cancel_event is not None and cancel_event.is_set():
+            raise asyncio.CancelledError("Profile build cancelled")
+    
+    async def _discover_repositories(self, username: str, github_token: Optional[str],
+                                     cancel_event: Optional[threading.Event] = None) -> List[RepositoryInfo]:
         """Discover all repositories for the user."""
         config = DiscoveryConfig(
             include_github=True,
@@ -221,7 +238,7 @@ class GitHubProfileBuilder:
             max_repos_per_provider=self.config.max_repos_to_analyze or 1000
         )
         
-        discovery = RepositoryDiscovery(config)
+        discovery = RepositoryDiscovery(config, cancel_event)
         repos = await discovery.discover_all_repositories()
         
         # Filter by size if specified
@@ -263,11 +280,13 @@ class GitHubProfileBuilder:
             self.logger.warning(f"Failed to fetch user profile: {e}")
     
     async def _analyze_repositories(self, repos: List[RepositoryInfo], 
-                                  progress_callback: Optional[callable] = None) -> List[Tuple[RepositoryInfo, ProjectMetadata]]:
+                                  progress_callback: Optional[callable] = None,
+                                  cancel_event: Optional[threading.Event] = None) -> List[Tuple[RepositoryInfo, ProjectMetadata]]:
         """Analyze all repositories and extract metadata."""
         analyzed_repos = []
         
         for i, repo in enumerate(repos):
+            self._check_cancelled(cancel_event)
             try:
                 if progress_callback:
                     progress = 20 + int((i / len(repos)) * 60)  # 20% to 80%
@@ -367,13 +386,9 @@ class GitHubProfileBuilder:
             for lang, size in self.profile.languages_used.items()
         }
         
-        # Primary languages (top 5)
-        sorted_languages = sorted(
-            self.profile.languages_percentage.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )
-        self.profile.primary_languages = [lang for lang, _ in sorted_languages[:5]]
+        # Primary languages (top 5); partial selection instead of a full sort
+        top_languages = heapq.nlargest(5, self.profile.languages_percentage.items(), key=lambda x: x[1])
+        self.profile.primary_languages = [lang for lang, _ in top_languages]
         
         # Set project type flags
         self.profile.has_web_projects = self.profile.project_types.get('web-app', 0) > 0
@@ -11,6 +11,8 @@ import threading
 import asyncio
 import json
 import os
+import platform
+import subprocess
 import time
 import webbrowser
 from pathlib import Path
@@ -995,9 +997,6 @@ Bio: {profile.bio or 'No bio available'}
         output_dir = Path.home() / "github_profiles"
         output_dir.mkdir(exist_ok=True)
         
-        import subprocess
-        import platform
-        
         try:
             if platform.system() == "Windows":
                 os.startfile(str(output_dir))
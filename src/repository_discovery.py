@@ -9,12 +9,14 @@ import json
 import asyncio
 import aiohttp
 import subprocess
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, AsyncGenerator, Callable
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from github import Github, GithubException
@@ -28,8 +30,12 @@ except ImportError:
 
 try:
     from .utils.logger import get_logger
+    from .utils.http_cache import ETagCache
 except ImportError:
     from utils.logger import get_logger
+    from utils.http_cache import ETagCache
+
+GITHUB_API_URL = "https://api.github.com"
 
 
 @dataclass
@@ -86,9 +92,14 @@ class DiscoveryConfig:
 class RepositoryDiscovery:
     """Main repository discovery engine."""
     
-    def __init__(self, config: DiscoveryConfig):
-        """Initialize the discovery engine."""
+    def __init__(self, config: DiscoveryConfig, cancel_event: Optional[threading.Event] = None):
+        """Initialize the discovery engine.
+        
+        Once ``cancel_event`` is set, discovery stops at the next repository
+        and returns what it has found so far.
+        """
         self.config = config
+        self.cancel_event = cancel_event
         self.logger = get_logger()
         self.discovered_repos: List[RepositoryInfo] = []
         self.stats = {
@@ -102,6 +113,10 @@ class RepositoryDiscovery:
             'providers': {}
         }
         
+        # Conditional-request cache for per-repo GitHub REST lookups
+        self.http_cache: Optional[ETagCache] = None
+        self._github_headers: Dict[str, str] = {}
+        
     async def discover_all_repositories(self, 
                                       progress_callback: Optional[Callable] = None) -> List[RepositoryInfo]:
         """Discover repositories from all configured providers."""
@@ -153,57 +168,37 @@ class RepositoryDiscovery:
             else:
                 github = Github()  # Anonymous access
             
+            self._init_github_http_cache()
+            
             user = github.get_user()
-            repos = []
             
             self.logger.info(f"Discovering GitHub repositories for user: {user.login}")
             
-            # Get user's repositories
-            repo_count = 0
+            # Collect repository handles first; listing is paginated and sequential
+            candidates = []
             for repo in user.get_repos():
-                if repo_count >= self.config.max_repos_per_provider:
+                if len(candidates) >= self.config.max_repos_per_provider or self._cancelled():
                     break
-                
-                try:
-                    repo_info = await self._convert_github_repo(repo)
-                    if repo_info:
-                        repos.append(repo_info)
-                        repo_count += 1
-                        
-                        if progress_callback:
-                            progress_callback(f"GitHub: Found {repo.full_name}", repo_count)
-                        
-                except Exception as e:
-                    self.logger.warning(f"Failed to process GitHub repo {repo.full_name}: {e}")
-                    continue
+                candidates.append((repo, "GitHub"))
             
             # Get organization repositories if token provided
             if self.config.github_token:
                 try:
                     for org in user.get_orgs():
-                        if repo_count >= self.config.max_repos_per_provider:
+                        if len(candidates) >= self.config.max_repos_per_provider or self._cancelled():
                             break
                             
                         for repo in org.get_repos():
-                            if repo_count >= self.config.max_repos_per_provider:
+                            if len(candidates) >= self.config.max_repos_per_provider or self._cancelled():
                                 break
-                                
-                            try:
-                                repo_info = await self._convert_github_repo(repo)
-                                if repo_info:
-                                    repos.append(repo_info)
-                                    repo_count += 1
-                                    
-                                    if progress_callback:
-                                        progress_callback(f"GitHub Org: Found {repo.full_name}", repo_count)
-                                        
-                            except Exception as e:
-                                self.logger.warning(f"Failed to process GitHub org repo {repo.full_name}: {e}")
-                                continue
+                            candidates.append((repo, "GitHub Org"))
                                 
                 except Exception as e:
                     self.logger.info(f"Could not access organizations: {e}")
             
+            # Per-repo README/topic lookups are independent REST calls, so overlap them
+            repos = await self._convert_github_repos(candidates, progress_callback)
+            
             self.logger.info(f"GitHub discovery completed: {len(repos)} repositories")
             return repos
             
@@ -237,7 +232,7 @@ class RepositoryDiscovery:
             
             repo_count = 0
             for project in projects:
-                if repo_count >= self.config.max_repos_per_provider:
+                if repo_count >= self.config.max_repos_per_provider or self._cancelled():
                     break
                 
                 try:
@@ -260,17 +255,92 @@ class RepositoryDiscovery:
             self.logger.error(f"GitLab discovery failed: {e}")
             return []
     
-    async def _convert_github_repo(self, repo) -> Optional[RepositoryInfo]:
-        """Convert GitHub repository to RepositoryInfo."""
+    async def _convert_github_repos(self, candidates: List[Tuple[object, str]],
+                                    progress_callback: Optional[Callable] = None) -> List[RepositoryInfo]:
+        """Convert GitHub repositories concurrently on a bounded thread pool."""
+        repos = []
+        if not candidates:
+            return repos
+        
+        loop = asyncio.get_running_loop()
+        max_workers = max(1, min(self.config.concurrent_requests, len(candidates)))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [loop.run_in_executor(pool, self._github_repo_to_info, repo)
+                       for repo, _ in candidates]
+            
+            for (repo, source), future in zip(candidates, futures):
+                if self._cancelled():
+                    # Drop lookups that have not started; running ones finish on pool exit
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                
+                try:
+                    repo_info = await future
+                except Exception as e:
+                    self.logger.warning(f"Failed to process {source} repo {repo.full_name}: {e}")
+                    continue
+                
+                if repo_info:
+                    repos.append(repo_info)
+                    
+                    if progress_callback:
+                        progress_callback(f"{source}: Found {repo.full_name}", len(repos))
+        
+        return repos
+    
+    def _cancelled(self) -> bool:
+        """Whether the caller has asked discovery to stop."""
+        return self.cancel_event is not None and self.cancel_event.is_set()
+    
+    def _init_github_http_cache(self):
+        """Set up the ETag cache used for per-repo GitHub lookups."""
+        self._github_headers = {'Accept': 'application/vnd.github+json'}
+        if self.config.github_token:
+            self._github_headers['Authorization'] = f"token {self.config.github_token}"
+        
         try:
-            # Check if repository has a README
-            has_readme = False
+            self.http_cache = ETagCache()
+        except OSError as e:
+            self.logger.warning(f"HTTP cache unavailable, using direct API calls: {e}")
+            self.http_cache = None
+    
+    def _github_readme_exists(self, repo) -> bool:
+        """Check whether a GitHub repository has a README."""
+        if self.http_cache is None:
             try:
                 repo.get_readme()
-                has_readme = True
-            except:
-                pass
-            
+                return True
+            except Exception:
+                return False
+        
+        try:
+            status, _ = self.http_cache.get_json(f"{GITHUB_API_URL}/repos/{repo.full_name}/readme",
+                                                 headers=self._github_headers, store_body=False)
+        except Exception:
+            return False
+        return status == 200
+    
+    def _github_topics(self, repo) -> List[str]:
+        """Get the topics of a GitHub repository."""
+        if self.http_cache is None:
+            return repo.get_topics() if hasattr(repo, 'get_topics') else []
+        
+        try:
+            status, body = self.http_cache.get_json(f"{GITHUB_API_URL}/repos/{repo.full_name}/topics",
+                                                    headers=self._github_headers)
+        except Exception:
+            return []
+        return list(body.get('names', [])) if status == 200 and body else []
+    
+    async def _convert_github_repo(self, repo) -> Optional[RepositoryInfo]:
+        """Convert GitHub repository to RepositoryInfo."""
+        return self._github_repo_to_info(repo)
+    
+    def _github_repo_to_info(self, repo) -> Optional[RepositoryInfo]:
+        """Build RepositoryInfo from a PyGithub repository (blocking network calls)."""
+        try:
             return RepositoryInfo(
                 name=repo.name,
                 full_name=repo.full_name,
@@ -289,8 +359,8 @@ class RepositoryDiscovery:
                 updated_at=repo.updated_at.isoformat() if repo.updated_at else "",
                 size_kb=repo.size,
                 default_branch=repo.default_branch,
-                topics=repo.get_topics() if hasattr(repo, 'get_topics') else [],
-                has_readme=has_readme,
+                topics=self._github_topics(repo),
+                has_readme=self._github_readme_exists(repo),
                 license=repo.license.name if hasattr(repo, 'license') and repo.license else None
             )
         except Exception as e:
@@ -833,13 +833,16 @@ class UnifiedRepoReadmeGUI:
         self.openrouter_enhance_creativity = tk.BooleanVar(value=True)
         self.openrouter_improve_readability = tk.BooleanVar(value=True)
         self.openrouter_optimize_keywords = tk.BooleanVar(value=True)
+        self.openrouter_response_cache = tk.BooleanVar(value=False)
         
         ttk.Checkbutton(enhancement_frame, text="🎨 Enhance creativity", 
                        variable=self.openrouter_enhance_creativity).pack(side='left', padx=(0, 10))
         ttk.Checkbutton(enhancement_frame, text="📖 Improve readability", 
                        variable=self.openrouter_improve_readability).pack(side='left', padx=(0, 10))
         ttk.Checkbutton(enhancement_frame, text="🎯 Optimize keywords", 
-                       variable=self.openrouter_optimize_keywords).pack(side='left')
+                       variable=self.openrouter_optimize_keywords).pack(side='left', padx=(0, 10))
+        ttk.Checkbutton(enhancement_frame, text="♻️ Reuse results for unchanged bios", 
+                       variable=self.openrouter_response_cache).pack(side='left')
         
         # Load OpenRouter settings
         self.load_openrouter_settings()
@@ -3277,6 +3280,7 @@ Total Files: {total_files + 1}
             model = self.settings_manager.get_setting('openrouter_model', 'openai/gpt-3.5-turbo')
             enabled = self.settings_manager.get_setting('openrouter_enabled', False)
             temperature = self.settings_manager.get_setting('openrouter_temperature', 0.7)
+            response_cache = self.settings_manager.get_setting('openrouter_response_cache', False)
             
             if api_key:
                 self.openrouter_api_key.delete(0, 'end')  # Clear first
@@ -3290,6 +3294,8 @@ Total Files: {total_files + 1}
             
             self.openrouter_temperature.set(temperature)
             self.update_temperature_label(temperature)
+            
+            self.openrouter_response_cache.set(response_cache)
                 
         except Exception as e:
             self.logger.debug(f"Could not load OpenRouter settings: {e}")
@@ -3308,6 +3314,7 @@ Total Files: {total_files + 1}
             self.settings_manager.set_setting('openrouter_model', self.openrouter_model.get())
             self.settings_manager.set_setting('openrouter_enabled', self.openrouter_enabled.get())
             self.settings_manager.set_setting('openrouter_temperature', self.openrouter_temperature.get())
+            self.settings_manager.set_setting('openrouter_response_cache', self.openrouter_response_cache.get())
             
             messagebox.showinfo("Saved", "OpenRouter API key saved successfully!")
             self.logger.info("OpenRouter API key saved to settings")
@@ -3457,11 +3464,21 @@ Total Files: {total_files + 1}
                 temperature=self.openrouter_temperature.get(),
                 enhance_creativity=self.openrouter_enhance_creativity.get(),
                 improve_readability=self.openrouter_improve_readability.get(),
-                optimize_keywords=self.openrouter_optimize_keywords.get()
+                optimize_keywords=self.openrouter_optimize_keywords.get(),
+                use_response_cache=self.openrouter_response_cache.get()
             )
             
             service = OpenRouterAIService(config)
-            enhancement_result = service.enhance_linkedin_bio(enhancement_request)
+            
+            # Show the enhanced bio as it streams in; replaced by the cleaned result below
+            self.ai_primary_bio_text.delete('1.0', tk.END)
+            
+            def show_token(text):
+                self.ai_primary_bio_text.insert(tk.END, text)
+                self.ai_primary_bio_text.see(tk.END)
+                self.ai_primary_bio_text.update_idletasks()
+            
+            enhancement_result = service.enhance_linkedin_bio(enhancement_request, on_token=show_token)
             
             # Update the primary bio with enhanced version
             self.ai_primary_bio_text.delete('1.0', tk.END)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+RepoReadme - AI Bio Response Cache
+
+Remembers OpenRouter bio results and hands them back when the same bio is
+submitted again with the same model and settings, so re-running an
+unchanged request does not pay for a fresh API call.
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _cache_key(scope: Tuple, text: str) -> str:
+    """Hash of ``scope`` plus ``text`` with whitespace normalized."""
+    normalized = " ".join(text.split())
+    return hashlib.sha256(repr((tuple(scope), normalized)).encode('utf-8')).hexdigest()
+
+
+class BioResponseCache:
+    """Exact-match cache of AI bio results, persisted as JSON.
+
+    Entries are keyed on a ``scope`` tuple (model, style, role, settings,
+    ...) together with the bio text; only differences in whitespace are
+    ignored, so any change to the wording or casing is a miss.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_entries: int = 128):
+        """Remember the file location; entries are read on first use."""
+        self.path = Path(path) if path else Path.home() / '.reporeadme' / 'bio_cache.json'
+        self.max_entries = max_entries
+        self._entries: Optional[OrderedDict] = None
+
+    def get(self, scope: Tuple, text: str) -> Optional[Dict[str, Any]]:
+        """Return the payload stored for ``text`` in ``scope``, or None."""
+        entries = self._load()
+        key = _cache_key(scope, text)
+        if key not in entries:
+            return None
+        entries.move_to_end(key)
+        return entries[key]
+
+    def put(self, scope: Tuple, text: str, payload: Dict[str, Any]):
+        """Store ``payload`` for ``text``, evicting the least recently used entries."""
+        entries = self._load()
+        key = _cache_key(scope, text)
+        entries[key] = payload
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+        self._save()
+
+    def discard(self, scope: Tuple, text: str):
+        """Forget the entry for ``text`` in ``scope``, if any."""
+        if self._load().pop(_cache_key(scope, text), None) is not None:
+            self._save()
+
+    def _load(self) -> OrderedDict:
+        if self._entries is None:
+            self._entries = OrderedDict()
+            try:
+                raw = self.path.read_bytes()
+                records = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except (OSError, ValueError):
+                records = []
+            for record in records if isinstance(records, list) else []:
+                try:
+                    self._entries[record['key']] = record['payload']
+                except (KeyError, TypeError):
+                    continue
+        return self._entries
+
+    def _save(self):
+        records = [{'key': key, 'payload': payload} for key, payload in self._entries.items()]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if orjson is not None:
+                self.path.write_bytes(orjson.dumps(records, default=str))
+            else:
+                self.path.write_text(json.dumps(records, default=str), encoding='utf-8')
+        except OSError:
+            pass
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+RepoReadme - Generated Content Cache
+
+Small SQLite store for the last generated content per user and generator
+configuration, so dialogs can show previous results as soon as a profile
+is loaded instead of waiting for a fresh generation.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str).encode('utf-8')
+
+
+class ContentCache:
+    """Key/value cache of generated content backed by SQLite.
+
+    Entries older than ``max_age`` seconds are treated as missing and are
+    deleted when the database is opened.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, max_age: float = 30 * 24 * 3600):
+        """Remember the database location; the connection is opened on first use."""
+        self.db_path = Path(db_path) if db_path else Path.home() / '.reporeadme' / 'linkedin_cache.db'
+        self.max_age = max_age
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(username: str, config_key: Any) -> str:
+        """Build a stable key from a username and a hashable config snapshot."""
+        return hashlib.sha1(repr((username, config_key)).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for ``key``, or None."""
+        try:
+            row = self._connect().execute('SELECT payload FROM gen WHERE k = ? AND ts >= ?',
+                                          (key, self._cutoff())).fetchone()
+            return _loads(row[0]) if row else None
+        except (sqlite3.Error, OSError, ValueError):
+            return None
+
+    def put(self, key: str, payload: Dict[str, Any]):
+        """Store ``payload`` under ``key``, replacing any previous entry."""
+        try:
+            with self._connect() as conn:
+                conn.execute('INSERT OR REPLACE INTO gen (k, ts, payload) VALUES (?, ?, ?)',
+                             (key, int(time.time()), _dumps(payload)))
+        except (sqlite3.Error, OSError):
+            pass
+
+    def close(self):
+        """Close the database connection if it was opened."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path))
+            with self._conn:
+                self._conn.execute('CREATE TABLE IF NOT EXISTS gen (k TEXT PRIMARY KEY, ts INTEGER, payload BLOB)')
+                self._conn.execute('DELETE FROM gen WHERE ts < ?', (self._cutoff(),))
+        return self._conn
+
+    def _cutoff(self) -> int:
+        """Oldest ``ts`` still served."""
+        return int(time.time() - self.max_age)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+RepoReadme - Conditional HTTP Cache
+
+Persistent cache for JSON API responses validated with ETag/If-None-Match.
+Unchanged resources come back as 304 Not Modified, which GitHub does not
+count against the rate limit and which carry no response body.
+"""
+
+import functools
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=1)
+def shared_session() -> requests.Session:
+    """Process-wide session whose connection pool outlives individual caches.
+    
+    Sized for the concurrent per-repo lookups in repository discovery, with
+    a short retry/backoff for transient gateway errors.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                          max_retries=Retry(total=3, backoff_factor=0.3,
+                                            status_forcelist=(502, 503, 504)))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class ETagCache:
+    """On-disk LRU cache of JSON GET responses keyed by URL."""
+
+    def __init__(self, cache_dir: Optional[Path] = None,
+                 session: Optional[requests.Session] = None,
+                 max_entries: int = 2000):
+        """Initialize the cache directory and HTTP session."""
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / '.reporeadme' / 'http_cache'
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.session = session or shared_session()
+        self.max_entries = max_entries
+
+        # Deserialized bodies for recently used entries, least recent first
+        self._memory: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._prune()
+
+    def get_json(self, url: str, headers: Optional[Dict[str, str]] = None,
+                 timeout: int = 15, store_body: bool = True) -> Tuple[int, Any]:
+        """GET a JSON resource, revalidating any cached copy with its ETag.
+
+        Returns a ``(status_code, body)`` tuple. A 304 response is reported as
+        200 with the cached body; non-2xx responses return ``None`` as body.
+        Pass ``store_body=False`` when only the status matters (e.g. existence
+        checks) to keep large payloads out of the cache.
+        """
+        cached = self._read(url)
+        request_headers = dict(headers or {})
+        if cached:
+            request_headers['If-None-Match'] = cached[0]
+
+        response = self.session.get(url, headers=request_headers, timeout=timeout)
+
+        if response.status_code == 304 and cached:
+            self._touch(url)
+            return 200, cached[1]
+
+        if not response.ok:
+            return response.status_code, None
+
+        body = _loads(response.content) if store_body and response.content else None
+        etag = response.headers.get('ETag')
+        if etag:
+            self._write(url, etag, body)
+
+        return response.status_code, body
+
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock:
+            self._memory.clear()
+        for cache_file in self.cache_dir.glob('*.json'):
+            cache_file.unlink(missing_ok=True)
+
+    def _path_for(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def _read(self, url: str) -> Optional[Tuple[str, Any]]:
+        with self._lock:
+            if url in self._memory:
+                self._memory.move_to_end(url)
+                return self._memory[url]
+
+        cache_file = self._path_for(url)
+        try:
+            entry = _loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        cached = (entry['etag'], entry['body'])
+        self._remember(url, cached)
+        return cached
+
+    def _write(self, url: str, etag: str, body: Any):
+        self._remember(url, (etag, body))
+        try:
+            self._path_for(url).write_bytes(_dumps({'url': url, 'etag': etag, 'body': body}))
+        except OSError:
+            pass
+
+    def _remember(self, url: str, cached: Tuple[str, Any]):
+        """Keep ``cached`` in memory, dropping the least recently used beyond ``max_entries``."""
+        with self._lock:
+            self._memory[url] = cached
+            self._memory.move_to_end(url)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _touch(self, url: str):
+        """Mark an entry as recently used so pruning keeps it."""
+        try:
+            self._path_for(url).touch()
+        except OSError:
+            pass
+
+    def _prune(self):
+        """Drop the least recently used entries beyond ``max_entries``."""
+        try:
+            entries = sorted(self.cache_dir.glob('*.json'), key=lambda p: p.stat().st_mtime)
+        except OSError:
+            return
+        for cache_file in entries[:max(0, len(entries) - self.max_entries)]:
+            cache_file.unlink(missing_ok=True)
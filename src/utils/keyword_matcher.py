@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+RepoReadme - Keyword Matcher
+
+Finds every occurrence of a fixed set of keywords in a text. With
+pyahocorasick installed the text is scanned once by an Aho-Corasick
+automaton; otherwise each keyword is searched for separately.
+"""
+
+import sys
+from bisect import bisect_right
+from collections import Counter
+from typing import FrozenSet, Iterable, List
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """Substring matcher for a fixed keyword set, built once and reused."""
+
+    def __init__(self, keywords: Iterable[str]):
+        """Build the automaton (when available) for ``keywords``."""
+        # Interned so hits[kw] lookups with the caller's keyword strings
+        # compare by identity even when they were built at runtime
+        self.keywords: FrozenSet[str] = frozenset(map(sys.intern, keywords))
+        self._automaton = None
+        if ahocorasick is not None and self.keywords:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+
+    def hits(self, text: str) -> Counter:
+        """Count occurrences of each keyword in ``text``, overlapping ones included.
+
+        Keywords that do not occur are absent, so ``hits[kw]`` is 0 for them.
+        """
+        counts = Counter()
+        if self._automaton is not None:
+            for _, keyword in self._automaton.iter(text):
+                counts[keyword] += 1
+            return counts
+
+        for keyword in self.keywords:
+            start = text.find(keyword)
+            while start != -1:
+                counts[keyword] += 1
+                start = text.find(keyword, start + 1)
+        return counts
+
+    def hits_many(self, texts: List[str]) -> List[Counter]:
+        """``hits`` for each of ``texts``; the automaton scans them all in one pass."""
+        if self._automaton is None:
+            return [self.hits(text) for text in texts]
+
+        # Texts are joined with a separator no keyword contains, so matches
+        # never span two texts; each match is assigned by its end offset.
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        counts = [Counter() for _ in texts]
+        for end, keyword in self._automaton.iter("\x00".join(texts)):
+            counts[bisect_right(starts, end) - 1][keyword] += 1
+        return counts
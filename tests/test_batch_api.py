@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Test the OpenRouter batch API path against a fake aiohttp session.
+"""
+
+import sys
+import os
+import json
+import asyncio
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import openrouter_service
+from openrouter_service import OpenRouterAIService, OpenRouterConfig
+
+
+class FakeResponse:
+    """Just enough of aiohttp.ClientResponse for the batch and chat calls."""
+
+    def __init__(self, status=200, body=None, headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        self.content_type = "text/plain" if isinstance(body, str) else "application/json"
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+    async def json(self):
+        return self.body
+
+    async def text(self):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """Answers (method, path) calls from queued responses and records them."""
+
+    def __init__(self, base_url, routes):
+        self.base_url = base_url
+        self.routes = {key: list(responses) for key, responses in routes.items()}
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        path = url[len(self.base_url):]
+        self.calls.append((method, path))
+        return self.routes[(method, path)].pop(0)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _completion(text):
+    return {"choices": [{"message": {"content": text}}]}
+
+
+def _output_line(custom_id, text=None, status_code=200):
+    response = {"status_code": status_code, "body": _completion(text) if text else {}}
+    return json.dumps({"custom_id": custom_id, "response": response})
+
+
+def _run(coro, sleeps):
+    """Run ``coro`` with asyncio.sleep recording its delays instead of waiting."""
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay, *args, **kwargs):
+        sleeps.append(delay)
+
+    asyncio.sleep = fake_sleep
+    try:
+        return asyncio.run(coro)
+    finally:
+        asyncio.sleep = real_sleep
+
+
+def _service(**config):
+    return OpenRouterAIService(OpenRouterConfig(api_key="test-key", model="openai/gpt-4o-mini", **config))
+
+
+def test_batch_success():
+    """A batch job is uploaded, polled until complete and read back in prompt order."""
+    print("🧪 Testing batch API success")
+
+    service = _service()
+    base = service.config.base_url
+    session = FakeSession(base, {
+        ("POST", "/files"): [FakeResponse(body={"id": "file-in"})],
+        ("POST", "/batches"): [FakeResponse(body={"id": "batch-1", "status": "validating"})],
+        ("GET", "/batches/batch-1"): [
+            FakeResponse(body={"id": "batch-1", "status": "in_progress"}),
+            FakeResponse(body={"id": "batch-1", "status": "completed", "output_file_id": "file-out"}),
+        ],
+        ("GET", "/files/file-out/content"): [FakeResponse(body="\n".join([
+            _output_line("1", "Second bio"),
+            _output_line("0", "First bio"),
+            _output_line("2", status_code=500),
+        ]))],
+    })
+    sleeps = []
+    results = _run(service._abatch_api_requests(session, ["a", "b", "c"]), sleeps)
+
+    assert results[0] == _completion("First bio")
+    assert results[1] == _completion("Second bio")
+    assert isinstance(results[2], Exception)
+    assert sleeps == [2.0, 4.0]
+    assert session.calls[-1] == ("GET", "/files/file-out/content")
+
+    print("✅ Results returned in prompt order with failures as exceptions")
+
+
+def test_polling_timeout_falls_back():
+    """A batch still running at batch_timeout falls back to direct requests."""
+    print("🧪 Testing batch timeout fallback")
+
+    service = _service(batch_timeout=1.0)
+    base = service.config.base_url
+    session = FakeSession(base, {
+        ("POST", "/files"): [FakeResponse(body={"id": "file-in"})],
+        ("POST", "/batches"): [FakeResponse(body={"id": "batch-1", "status": "in_progress"})],
+        ("POST", "/chat/completions"): [FakeResponse(body=_completion(f"Direct bio {i}")) for i in range(2)],
+    })
+    real_session = openrouter_service.aiohttp.ClientSession
+    openrouter_service.aiohttp.ClientSession = lambda *args, **kwargs: session
+    try:
+        alternatives = _run(service.agenerate_bio_alternatives("Original bio", count=2, use_batch_api=True), [])
+    finally:
+        openrouter_service.aiohttp.ClientSession = real_session
+
+    assert alternatives == ["Direct bio 0", "Direct bio 1"]
+    assert ("GET", "/batches/batch-1") not in session.calls
+    assert session.calls.count(("POST", "/chat/completions")) == 2
+
+    print("✅ Timed-out batch replaced by direct requests")
+
+
+def test_unsupported_provider_sends_direct():
+    """Models outside the OpenAI batch protocol skip the batch job entirely."""
+    print("🧪 Testing batch API with an unsupported provider")
+
+    service = OpenRouterAIService(OpenRouterConfig(api_key="test-key", model="anthropic/claude-3-haiku"))
+    base = service.config.base_url
+    session = FakeSession(base, {
+        ("POST", "/chat/completions"): [FakeResponse(body=_completion(f"Direct bio {i}")) for i in range(2)],
+    })
+    real_session = openrouter_service.aiohttp.ClientSession
+    openrouter_service.aiohttp.ClientSession = lambda *args, **kwargs: session
+    try:
+        alternatives = _run(service.agenerate_bio_alternatives("Original bio", count=2, use_batch_api=True), [])
+    finally:
+        openrouter_service.aiohttp.ClientSession = real_session
+
+    assert alternatives == ["Direct bio 0", "Direct bio 1"]
+    assert session.calls == [("POST", "/chat/completions")] * 2
+
+    print("✅ No batch job submitted for anthropic/ models")
+
+
+def test_rate_limited_batch_call():
+    """429 responses are waited out for Retry-After seconds, then the call succeeds or raises."""
+    print("🧪 Testing batch API 429 handling")
+
+    service = _service()
+    base = service.config.base_url
+    session = FakeSession(base, {
+        ("GET", "/batches/batch-1"): [
+            FakeResponse(status=429, headers={"Retry-After": "3"}),
+            FakeResponse(status=429),
+            FakeResponse(body={"id": "batch-1", "status": "completed"}),
+        ],
+    })
+    sleeps = []
+    batch = _run(service._abatch_call(session, "GET", f"{base}/batches/batch-1"), sleeps)
+
+    assert batch == {"id": "batch-1", "status": "completed"}
+    assert sleeps == [3.0, 2.0]
+
+    session = FakeSession(base, {("GET", "/batches/batch-1"): [FakeResponse(status=429)] * 5})
+    try:
+        _run(service._abatch_call(session, "GET", f"{base}/batches/batch-1"), [])
+    except RuntimeError as e:
+        assert "429" in str(e)
+    else:
+        raise AssertionError("persistent 429 was not raised")
+    assert len(session.calls) == 5
+
+    print("✅ Retry-After honoured and persistent 429 raised")
+
+
+if __name__ == "__main__":
+    test_batch_success()
+    test_polling_timeout_falls_back()
+    test_unsupported_provider_sends_direct()
+    test_rate_limited_batch_call()
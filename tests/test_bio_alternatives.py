@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test generating bio alternatives on the async and blocking request paths.
+"""
+
+import sys
+import os
+import asyncio
+
+import aiohttp
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from test_batch_api import FakeResponse, FakeSession, _completion, _run, _service
+
+
+def test_inside_running_loop_uses_blocking_path():
+    """Called from a running event loop, the blocking request path is used instead of asyncio.run."""
+    print("🧪 Testing bio alternatives inside an event loop")
+
+    service = _service()
+    prompts = []
+
+    def fake_request(prompt, **kwargs):
+        prompts.append(prompt)
+        if len(prompts) == 2:
+            raise RuntimeError("upstream error")
+        return _completion(f"Bio {len(prompts)}")
+
+    service._make_api_request = fake_request
+
+    async def caller():
+        return service.generate_bio_alternatives("Original bio", count=3)
+
+    assert asyncio.run(caller()) == ["Bio 1", "Bio 3"]
+    assert len(prompts) == 3
+
+    print("✅ Blocking fallback used, failures skipped")
+
+
+def test_async_request_retries_rate_limit():
+    """429 and 5xx responses on the async path are retried with backoff."""
+    print("🧪 Testing async request retries")
+
+    service = _service()
+    session = FakeSession(service.config.base_url, {("POST", "/chat/completions"): [
+        FakeResponse(status=429, headers={"Retry-After": "4"}),
+        FakeResponse(status=502),
+        FakeResponse(body=_completion("Bio")),
+    ]})
+    sleeps = []
+
+    assert _run(service._amake_api_request(session, "prompt"), sleeps) == _completion("Bio")
+    assert len(session.calls) == 3
+    assert sleeps[0] == 4.0 and len(sleeps) == 2
+
+    print("✅ Retried until success")
+
+
+def test_async_request_ssl_fallback():
+    """A failed TLS handshake is retried once without certificate checks."""
+    print("🧪 Testing async SSL fallback")
+
+    service = _service()
+    ssl_args = []
+
+    class CertificateError(aiohttp.ClientSSLError):
+        def __init__(self):
+            OSError.__init__(self, "certificate verify failed")
+
+        def __str__(self):
+            return "certificate verify failed"
+
+    class SSLFailingSession(FakeSession):
+        def post(self, url, **kwargs):
+            ssl_args.append(kwargs.get("ssl", True))
+            if len(ssl_args) == 1:
+                raise CertificateError()
+            return super().post(url, **kwargs)
+
+    session = SSLFailingSession(service.config.base_url, {
+        ("POST", "/chat/completions"): [FakeResponse(body=_completion("Bio"))]})
+
+    assert _run(service._amake_api_request(session, "prompt"), []) == _completion("Bio")
+    assert ssl_args == [True, False]
+
+    print("✅ Second attempt sent without verification")
+
+
+if __name__ == "__main__":
+    test_inside_running_loop_uses_blocking_path()
+    test_async_request_retries_rate_limit()
+    test_async_request_ssl_fallback()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test the exact-match cache of AI bio results.
+"""
+
+import sys
+import os
+import tempfile
+from dataclasses import asdict
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.bio_cache import BioResponseCache
+
+
+BIO = ("Backend engineer who writes Python services, builds REST APIs and "
+       "maintains CI pipelines for a fintech startup.")
+
+
+def test_exact_match_hit():
+    """The same bio in the same scope reuses the stored result."""
+    print("🧪 Testing bio cache exact lookup")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = BioResponseCache(os.path.join(cache_dir, 'bio_cache.json'))
+        scope = ('enhance', 'openai/gpt-3.5-turbo', 'professional')
+
+        assert cache.get(scope, BIO) is None
+        cache.put(scope, BIO, {'enhanced_bio': 'Enhanced'})
+
+        assert cache.get(scope, '  ' + BIO.replace(' ', '\n  ') + ' ') == {'enhanced_bio': 'Enhanced'}
+        assert cache.get(('enhance', 'openai/gpt-3.5-turbo', 'creative'), BIO) is None
+        assert cache.get(scope, "Frontend designer focused on accessibility and motion.") is None
+
+    print("✅ Whitespace changes hit, other scopes and bios miss")
+
+
+def test_changed_fact_miss():
+    """Swapping a single fact in the bio is never served from the cache."""
+    print("🧪 Testing bio cache with changed facts")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = BioResponseCache(os.path.join(cache_dir, 'bio_cache.json'))
+        scope = ('enhance', 'openai/gpt-3.5-turbo', 'professional')
+        cache.put(scope, BIO, {'enhanced_bio': 'Enhanced'})
+
+        assert cache.get(scope, BIO.replace('Python', 'Rust')) is None
+        assert cache.get(scope, BIO.replace('fintech', 'healthcare')) is None
+        assert cache.get(scope, BIO.replace('builds', 'build')) is None
+        assert cache.get(scope, BIO.replace('REST', 'rest')) is None
+
+    print("✅ Changed facts and casing miss")
+
+
+def test_malformed_entry_falls_through():
+    """An unreadable cached enhancement is dropped and the API is called."""
+    print("🧪 Testing enhancement with a malformed cache entry")
+
+    from openrouter_service import OpenRouterAIService, OpenRouterConfig, EnhancementRequest
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        service = OpenRouterAIService(OpenRouterConfig(api_key='test-key', use_response_cache=True))
+        service._response_cache = BioResponseCache(os.path.join(cache_dir, 'bio_cache.json'))
+        request = EnhancementRequest(original_bio=BIO)
+        scope = service._response_cache_scope(
+            "enhance", *(value for name, value in asdict(request).items() if name != "original_bio"))
+        service._response_cache.put(scope, BIO, {'unexpected': 'fields'})
+
+        calls = []
+
+        def fake_request(prompt, **kwargs):
+            calls.append(prompt)
+            return {"choices": [{"message": {"content": "Enhanced bio from the API."}}], "usage": {}}
+
+        service._make_api_request = fake_request
+        result = service.enhance_linkedin_bio(request)
+
+        assert calls and result.enhanced_bio == "Enhanced bio from the API."
+        assert service.enhance_linkedin_bio(request).model_used == "cache"
+        assert len(calls) == 1
+
+    print("✅ Malformed entry replaced by a fresh result")
+
+
+def test_enabled_from_settings():
+    """The saved openrouter_response_cache setting turns the cache on."""
+    print("🧪 Testing bio cache setting")
+
+    from types import SimpleNamespace
+    from openrouter_service import OpenRouterAIService
+
+    service = OpenRouterAIService()
+    assert not service.config.use_response_cache
+
+    settings = SimpleNamespace(openrouter_response_cache=True)
+    service._settings_manager = SimpleNamespace(get_settings=lambda: settings)
+    service._load_settings()
+    assert service.config.use_response_cache
+
+    print("✅ Setting applied to the service config")
+
+
+def test_persisted_between_instances():
+    """Entries are written to disk and read back by a new cache."""
+    print("🧪 Testing bio cache persistence")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        path = os.path.join(cache_dir, 'bio_cache.json')
+        scope = ('keywords', 'openai/gpt-3.5-turbo', 'python, django')
+
+        BioResponseCache(path).put(scope, BIO, {'bio': 'Optimized'})
+        assert BioResponseCache(path).get(scope, BIO) == {'bio': 'Optimized'}
+
+    print("✅ Cached results survive a restart")
+
+
+def test_eviction():
+    """The least recently used entry is dropped past max_entries."""
+    print("🧪 Testing bio cache eviction")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = BioResponseCache(os.path.join(cache_dir, 'bio_cache.json'), max_entries=2)
+        cache.put(('a',), 'first bio text', {'n': 1})
+        cache.put(('b',), 'second bio text', {'n': 2})
+        cache.get(('a',), 'first bio text')
+        cache.put(('c',), 'third bio text', {'n': 3})
+
+        assert cache.get(('a',), 'first bio text') == {'n': 1}
+        assert cache.get(('b',), 'second bio text') is None
+
+    print("✅ Oldest unused entry evicted")
+
+
+if __name__ == "__main__":
+    test_exact_match_hit()
+    test_changed_fact_miss()
+    test_malformed_entry_falls_through()
+    test_enabled_from_settings()
+    test_persisted_between_instances()
+    test_eviction()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test the SQLite cache of generated content used by the LinkedIn dialog.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.content_cache import ContentCache
+
+
+def test_round_trip():
+    """Stored payloads come back from a fresh cache instance."""
+    print("🧪 Testing content cache round trip")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        db_path = os.path.join(cache_dir, 'content.db')
+        key = ContentCache.make_key('octocat', ('professional', 'medium', True))
+
+        cache = ContentCache(db_path)
+        assert cache.get(key) is None
+        cache.put(key, {'headline': 'Engineer', 'top_skills': ['Python', 'Go']})
+        cache.close()
+
+        reopened = ContentCache(db_path)
+        assert reopened.get(key) == {'headline': 'Engineer', 'top_skills': ['Python', 'Go']}
+        reopened.close()
+
+    print("✅ Payload persisted between cache instances")
+
+
+def test_key_depends_on_config():
+    """Different settings for the same user do not share an entry."""
+    print("🧪 Testing content cache keys")
+
+    assert ContentCache.make_key('octocat', ('professional',)) == ContentCache.make_key('octocat', ('professional',))
+    assert ContentCache.make_key('octocat', ('professional',)) != ContentCache.make_key('octocat', ('creative',))
+
+    print("✅ Keys change with the config snapshot")
+
+
+def test_expired_entries():
+    """Entries older than max_age are not returned and are pruned on open."""
+    print("🧪 Testing content cache expiry")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        db_path = os.path.join(cache_dir, 'content.db')
+
+        cache = ContentCache(db_path)
+        cache.put('old', {'headline': 'Old'})
+        cache.put('new', {'headline': 'New'})
+        with cache._connect() as conn:
+            conn.execute('UPDATE gen SET ts = ts - 100 WHERE k = ?', ('old',))
+        cache.max_age = 50
+        assert cache.get('old') is None
+        assert cache.get('new') == {'headline': 'New'}
+        cache.close()
+
+        reopened = ContentCache(db_path, max_age=50)
+        assert reopened._connect().execute('SELECT k FROM gen').fetchall() == [('new',)]
+        reopened.close()
+
+    print("✅ Expired entries skipped and pruned")
+
+
+def test_unwritable_location():
+    """A cache directory that cannot be created behaves like an empty cache."""
+    print("🧪 Testing content cache in an unusable location")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        blocker = os.path.join(cache_dir, 'not_a_dir')
+        with open(blocker, 'w') as f:
+            f.write('')
+
+        cache = ContentCache(os.path.join(blocker, 'content.db'))
+        cache.put('key', {'headline': 'Lost'})
+        assert cache.get('key') is None
+        cache.close()
+
+    print("✅ Errors opening the cache are ignored")
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_key_depends_on_config()
+    test_expired_entries()
+    test_unwritable_location()
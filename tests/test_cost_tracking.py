@@ -73,6 +73,68 @@ def test_cost_calculation():
     print("\nNote: To test with real API calls, configure your OpenRouter API key")
     print("in the main application and try the bio enhancement feature.")
 
+def test_cache_read_pricing():
+    """Cached prompt tokens are discounted at each provider's own rate."""
+    print(f"\n💾 Testing Prompt Cache Pricing")
+    print("=" * 50)
+    
+    service = OpenRouterAIService()
+    
+    def input_cost(model, usage):
+        return service.calculate_actual_cost({'completion_tokens': 0, **usage}, model)['input_cost']
+    
+    for model, read_multiplier in (('openai/gpt-4', 0.5), ('anthropic/claude-3-sonnet', 0.1)):
+        full = input_cost(model, {'prompt_tokens': 1000})
+        if model.startswith('openai/'):
+            cached = input_cost(model, {'prompt_tokens': 1000,
+                                        'prompt_tokens_details': {'cached_tokens': 1000}})
+        else:
+            cached = input_cost(model, {'prompt_tokens': 1000, 'cache_read_input_tokens': 1000})
+        assert abs(cached - full * read_multiplier) < 1e-12, (model, cached, full)
+        print(f"   • {model}: cache reads billed at {read_multiplier:.0%}")
+    
+    print("✅ Cache reads priced per provider")
+
+def test_model_list_is_a_copy():
+    """Changing the returned model list does not affect later calls."""
+    print(f"\n📋 Testing Model Pricing List")
+    print("=" * 50)
+    
+    service = OpenRouterAIService()
+    models = service.get_all_models_with_pricing()
+    count = len(models)
+    models.clear()
+    
+    assert len(OpenRouterAIService().get_all_models_with_pricing()) == count
+    assert len(service.get_all_models_with_pricing()) == count
+    print("✅ Shared model rows left intact")
+
+def test_token_count_offline():
+    """Token counting falls back to the word estimate when tiktoken cannot load an encoding."""
+    print(f"\n🔢 Testing Offline Token Counting")
+    print("=" * 50)
+    
+    import openrouter_service
+    
+    class OfflineTiktoken:
+        def encoding_for_model(self, name):
+            raise OSError("could not download encoding")
+        
+        def get_encoding(self, name):
+            raise OSError("could not download encoding")
+    
+    real_tiktoken = openrouter_service.tiktoken
+    openrouter_service.tiktoken = OfflineTiktoken()
+    openrouter_service._token_encoding.cache_clear()
+    try:
+        tokens = OpenRouterAIService()._count_tokens("ten words " * 5, "openai/gpt-4")
+    finally:
+        openrouter_service.tiktoken = real_tiktoken
+        openrouter_service._token_encoding.cache_clear()
+    
+    assert tokens == 13
+    print("✅ Word-based estimate used offline")
+
 def test_enhancement_result_structure():
     """Test the EnhancementResult data structure."""
     print(f"\n🔍 Testing EnhancementResult Structure")
@@ -109,6 +171,9 @@ def test_enhancement_result_structure():
 
 if __name__ == "__main__":
     test_cost_calculation()
+    test_cache_read_pricing()
+    test_model_list_is_a_copy()
+    test_token_count_offline()
     test_enhancement_result_structure()
     
     print(f"\n🎉 All tests completed!")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test the context section of the OpenRouter bio enhancement prompt.
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from openrouter_service import OpenRouterAIService, EnhancementRequest
+
+
+def test_developer_profile_line():
+    """Language and project signals reach the prompt as a Developer Profile line."""
+    print("🧪 Testing developer profile insights in the prompt")
+
+    request = EnhancementRequest(
+        original_bio="I build web apps.",
+        primary_languages=["Python", "TypeScript"],
+        project_highlights=["open source dashboard", "startup billing product"]
+    )
+    prompt = OpenRouterAIService()._build_enhancement_prompt(request)
+
+    assert ("🧠 Developer Profile: Full-stack developer, Modern technology adopter, "
+            "Multi-technology professional, Open source contributor, Product-focused engineer") in prompt
+
+    print("✅ Developer Profile line included")
+
+
+def test_no_profile_line_without_signals():
+    """A request with no languages or projects gets no Developer Profile line."""
+    print("🧪 Testing prompt without profile signals")
+
+    prompt = OpenRouterAIService()._build_enhancement_prompt(EnhancementRequest(original_bio="I build web apps."))
+
+    assert "Developer Profile" not in prompt
+    assert "🎯 Target Role: Software Engineer" in prompt
+
+    print("✅ No empty Developer Profile line")
+
+
+if __name__ == "__main__":
+    test_developer_profile_line()
+    test_no_profile_line_without_signals()
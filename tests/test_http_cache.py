@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test the ETag-validated HTTP cache used for GitHub repository lookups.
+"""
+
+import sys
+import os
+import tempfile
+from types import SimpleNamespace
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.http_cache import ETagCache
+
+
+class FakeSession:
+    """Minimal stand-in for requests.Session that honours If-None-Match."""
+
+    def __init__(self, etag='"v1"', body=b'{"names": ["python", "cli"]}'):
+        self.etag = etag
+        self.body = body
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(dict(headers or {}))
+        if headers and headers.get('If-None-Match') == self.etag:
+            return SimpleNamespace(status_code=304, ok=False, content=b'', headers={})
+        return SimpleNamespace(status_code=200, ok=True, content=self.body, headers={'ETag': self.etag})
+
+
+def test_etag_revalidation():
+    """A second request sends If-None-Match and reuses the cached body on 304."""
+    print("🧪 Testing ETag cache revalidation")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        session = FakeSession()
+        cache = ETagCache(cache_dir, session=session)
+
+        first = cache.get_json("https://api.github.com/repos/user/repo/topics")
+        second = cache.get_json("https://api.github.com/repos/user/repo/topics")
+
+        assert first == (200, {"names": ["python", "cli"]})
+        assert second == first
+        assert 'If-None-Match' not in session.requests[0]
+        assert session.requests[1]['If-None-Match'] == '"v1"'
+
+        # A fresh cache instance picks the entry up from disk
+        reloaded = ETagCache(cache_dir, session=session)
+        assert reloaded.get_json("https://api.github.com/repos/user/repo/topics") == first
+
+    print("✅ Cached body reused on 304 Not Modified")
+
+
+def test_store_body_disabled():
+    """Existence checks keep the ETag but not the payload."""
+    print("🧪 Testing status-only caching")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        session = FakeSession(body=b'{"content": "large readme"}')
+        cache = ETagCache(cache_dir, session=session)
+
+        assert cache.get_json("https://api.github.com/repos/user/repo/readme", store_body=False) == (200, None)
+        assert cache.get_json("https://api.github.com/repos/user/repo/readme", store_body=False) == (200, None)
+        assert session.requests[1]['If-None-Match'] == '"v1"'
+
+    print("✅ Status-only entries revalidate without storing the body")
+
+
+def test_memory_bounded():
+    """The in-memory copy keeps at most max_entries, dropping the least recently used."""
+    print("🧪 Testing in-memory LRU bound")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ETagCache(cache_dir, session=FakeSession(), max_entries=2)
+        urls = [f"https://api.github.com/repos/user/repo{i}/topics" for i in range(3)]
+
+        cache.get_json(urls[0])
+        cache.get_json(urls[1])
+        cache.get_json(urls[0])
+        cache.get_json(urls[2])
+
+        assert list(cache._memory) == [urls[0], urls[2]]
+
+    print("✅ Memory limited to the most recent entries")
+
+
+if __name__ == "__main__":
+    test_etag_revalidation()
+    test_store_body_disabled()
+    test_memory_bounded()
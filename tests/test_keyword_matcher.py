@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test the keyword matcher used by the OpenRouter style evaluators.
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.keyword_matcher import KeywordMatcher
+
+
+def test_substring_hits():
+    """Keywords are found inside longer words and counted per occurrence."""
+    print("🧪 Testing keyword matcher hits")
+
+    matcher = KeywordMatcher(['scale', 'led', 'built teams', 'growth'])
+    hits = matcher.hits("scaled the platform, led growth, scaled again and built teams")
+
+    assert hits['scale'] == 2
+    assert hits['led'] == 3  # "scaled" twice plus "led"
+    assert hits['built teams'] == 1
+    assert hits['growth'] == 1
+
+    print("✅ Overlapping and multi-word keywords counted")
+
+
+def test_misses():
+    """Absent keywords read as zero and an empty matcher finds nothing."""
+    print("🧪 Testing keyword matcher misses")
+
+    hits = KeywordMatcher(['revenue', 'roi']).hits("shipped a mobile app")
+    assert hits['revenue'] == 0 and not hits
+    assert not KeywordMatcher([]).hits("anything")
+
+    print("✅ Misses return an empty counter")
+
+
+def test_hits_many():
+    """Batch counts match per-text counts and never span two texts."""
+    print("🧪 Testing keyword matcher batches")
+
+    matcher = KeywordMatcher(['led', 'scale', 'growth'])
+    texts = ['scaled growth', '', 'sca', 'le', 'led the team']
+
+    assert matcher.hits_many(texts) == [matcher.hits(text) for text in texts]
+    assert not matcher.hits_many(texts)[2] and not matcher.hits_many(texts)[3]
+
+    print("✅ Batch hits bucketed per text")
+
+
+if __name__ == "__main__":
+    test_substring_hits()
+    test_misses()
+    test_hits_many()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test the LinkedIn text export line endings.
+"""
+
+import sys
+import os
+import io
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from linkedin_generator import LinkedInExporter, LinkedInProfile
+
+
+def _exporter():
+    profile = LinkedInProfile(headline="Backend Engineer", summary="Builds APIs.\nShips often.")
+    return LinkedInExporter(profile)
+
+
+def test_text_export_uses_platform_line_endings():
+    """The exported file matches the joined text with the platform's line separator."""
+    print("🧪 Testing text export line endings")
+
+    exporter = _exporter()
+    with tempfile.TemporaryDirectory() as export_dir:
+        path = os.path.join(export_dir, 'profile.txt')
+        exporter.export_to_text(path)
+        with open(path, 'rb') as f:
+            written = f.read()
+
+    assert written == exporter._generate_text_export().replace('\n', os.linesep).encode('utf-8')
+
+    print("✅ Text export written in text mode")
+
+
+def test_text_stream_translates_newlines():
+    """A stream opened with Windows newlines gets CRLF line endings."""
+    print("🧪 Testing text export on a CRLF stream")
+
+    exporter = _exporter()
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding='utf-8', newline='\r\n')
+    exporter.export_to_text_stream(stream)
+    stream.flush()
+
+    assert raw.getvalue() == exporter._generate_text_export().replace('\n', '\r\n').encode('utf-8')
+
+    print("✅ CRLF written on Windows-style streams")
+
+
+if __name__ == "__main__":
+    test_text_export_uses_platform_line_endings()
+    test_text_stream_translates_newlines()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test OpenRouter request retries against a fake requests session.
+"""
+
+import sys
+import os
+import time
+from email.utils import formatdate
+
+import requests
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from openrouter_service import OpenRouterAIService, OpenRouterConfig, _retry_after_seconds
+
+
+class FakeResponse:
+    """Just enough of requests.Response for _make_api_request."""
+
+    def __init__(self, status_code=200, headers=None, content=b'{"choices": []}'):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = content
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} error", response=self)
+
+    def close(self):
+        pass
+
+
+def _service(*responses):
+    """A configured service whose session answers POSTs from ``responses`` in turn."""
+    service = OpenRouterAIService(OpenRouterConfig(api_key="test-key"))
+    service._settings_loaded = True
+    service.posts = []
+    queue = list(responses)
+
+    def post(url, **kwargs):
+        service.posts.append(kwargs)
+        response = queue.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    service.session.post = post
+    return service
+
+
+def _request(service, sleeps):
+    """Call _make_api_request with time.sleep recording its delays instead of waiting."""
+    real_sleep = time.sleep
+    time.sleep = sleeps.append
+    try:
+        return service._make_api_request("prompt")
+    finally:
+        time.sleep = real_sleep
+
+
+def test_rate_limit_retried():
+    """429 responses are retried until the request succeeds."""
+    print("🧪 Testing 429 retries")
+
+    service = _service(FakeResponse(429), FakeResponse(429), FakeResponse(content=b'{"id": "ok"}'))
+    sleeps = []
+
+    assert _request(service, sleeps) == {"id": "ok"}
+    assert len(service.posts) == 3 and len(sleeps) == 2
+
+    print("✅ Succeeded on the third call")
+
+
+def test_server_errors_bounded():
+    """Persistent 5xx responses stop after the backoff's own retries, with no outer retry loop."""
+    print("🧪 Testing 5xx retry limit")
+
+    service = _service(*(FakeResponse(503) for _ in range(12)))
+    sleeps = []
+    try:
+        _request(service, sleeps)
+    except requests.exceptions.HTTPError as e:
+        assert e.response.status_code == 503
+    else:
+        raise AssertionError("persistent 503 was not raised")
+
+    assert len(service.posts) == 4
+    assert len(sleeps) == 3
+
+    print("✅ Gave up after 4 calls")
+
+
+def test_retry_after_respected():
+    """The wait is at least Retry-After and never more than the cap."""
+    print("🧪 Testing Retry-After handling")
+
+    service = _service(FakeResponse(429, {"Retry-After": "7"}), FakeResponse(503, {"Retry-After": "600"}),
+                       FakeResponse())
+    sleeps = []
+    _request(service, sleeps)
+
+    assert sleeps == [7.0, 30.0]
+
+    print("✅ Retry-After honoured and capped")
+
+
+def test_ssl_error_relaxes_verification():
+    """An SSL failure moves on to an attempt without certificate verification."""
+    print("🧪 Testing SSL fallback")
+
+    service = _service(requests.exceptions.SSLError("handshake failed"), FakeResponse(content=b'{"id": "ok"}'))
+
+    assert _request(service, []) == {"id": "ok"}
+    assert [post["verify"] for post in service.posts] == [True, False]
+
+    print("✅ Second attempt sent without verification")
+
+
+def test_retry_after_seconds():
+    """Retry-After is read as seconds or an HTTP date; anything else is ignored."""
+    print("🧪 Testing Retry-After parsing")
+
+    assert _retry_after_seconds({"Retry-After": "12"}) == 12.0
+    assert _retry_after_seconds({"Retry-After": "-5"}) == 0.0
+    assert 50 <= _retry_after_seconds({"Retry-After": formatdate(time.time() + 60, usegmt=True)}) <= 60
+    assert _retry_after_seconds({"Retry-After": formatdate(time.time() - 60, usegmt=True)}) == 0.0
+    assert _retry_after_seconds({"Retry-After": "soon"}) is None
+    assert _retry_after_seconds({}) is None
+
+    print("✅ Delays and dates parsed")
+
+
+if __name__ == "__main__":
+    test_rate_limit_retried()
+    test_server_errors_bounded()
+    test_retry_after_respected()
+    test_ssl_error_relaxes_verification()
+    test_retry_after_seconds()
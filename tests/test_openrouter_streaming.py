@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test streamed OpenRouter completions against a fake server-sent event response.
+"""
+
+import sys
+import os
+import json
+
+import requests
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from openrouter_service import OpenRouterAIService, OpenRouterConfig
+
+
+def _event(content=None, **fields):
+    chunk = dict(fields)
+    if content is not None:
+        chunk["choices"] = [{"delta": {"content": content}}]
+    return b"data: " + json.dumps(chunk).encode()
+
+
+class FakeStreamResponse:
+    """Just enough of requests.Response for _make_api_request to stream from."""
+
+    status_code = 200
+    headers = {}
+
+    def __init__(self, lines, error=None):
+        self.lines = lines
+        self.error = error
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self):
+        yield from self.lines
+        if self.error is not None:
+            raise self.error
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _service(response):
+    """A configured service whose session answers every POST with ``response``."""
+    service = OpenRouterAIService(OpenRouterConfig(api_key="test-key"))
+    service._settings_loaded = True
+    service.posts = 0
+
+    def post(url, **kwargs):
+        service.posts += 1
+        return response
+
+    service.session.post = post
+    return service
+
+
+def test_stream_parsing():
+    """Deltas are joined into a normal response and passed to on_token in order."""
+    print("🧪 Testing streamed completion parsing")
+
+    service = _service(FakeStreamResponse([
+        b": OPENROUTER PROCESSING",
+        b"",
+        _event("Hello", id="gen-1", model="openai/gpt-4o"),
+        _event(", world"),
+        _event(usage={"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8}),
+        b"data: [DONE]",
+        _event("ignored"),
+    ]))
+    tokens = []
+    response = service._make_api_request("prompt", stream=True, on_token=tokens.append)
+
+    assert tokens == ["Hello", ", world"]
+    assert response["choices"][0]["message"]["content"] == "Hello, world"
+    assert response["id"] == "gen-1" and response["model"] == "openai/gpt-4o"
+    assert response["usage"]["total_tokens"] == 8
+
+    print("✅ Stream reassembled")
+
+
+def test_mid_stream_failure_not_retried():
+    """A connection drop after the first token is raised without a second request."""
+    print("🧪 Testing mid-stream failure")
+
+    service = _service(FakeStreamResponse(
+        [_event("Hel")], error=requests.exceptions.ChunkedEncodingError("connection dropped")))
+    tokens = []
+    try:
+        service._make_api_request("prompt", stream=True, on_token=tokens.append)
+    except requests.exceptions.ChunkedEncodingError:
+        pass
+    else:
+        raise AssertionError("mid-stream failure was swallowed")
+
+    assert tokens == ["Hel"]
+    assert service.posts == 1
+
+    print("✅ Failure raised after one request")
+
+
+def test_callback_error_propagates():
+    """An exception from on_token reaches the caller and is not retried."""
+    print("🧪 Testing on_token errors")
+
+    service = _service(FakeStreamResponse([_event("Hello"), _event(" again")]))
+
+    def on_token(text):
+        raise KeyError(text)
+
+    try:
+        service._make_api_request("prompt", stream=True, on_token=on_token)
+    except KeyError as e:
+        assert e.args == ("Hello",)
+    else:
+        raise AssertionError("callback error was swallowed")
+
+    assert service.posts == 1
+
+    print("✅ Callback error raised after one request")
+
+
+if __name__ == "__main__":
+    test_stream_parsing()
+    test_mid_stream_failure_not_retried()
+    test_callback_error_propagates()
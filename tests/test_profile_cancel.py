@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test cancelling a GitHub profile build.
+"""
+
+import sys
+import os
+import asyncio
+import threading
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from profile_builder import GitHubProfileBuilder
+from repository_discovery import RepositoryInfo
+
+
+def _repo(name):
+    return RepositoryInfo(
+        name=name, full_name=f"octocat/{name}", url="", clone_url="", ssh_url="",
+        description="", language="Python", stars=0, forks=0, is_private=False,
+        is_fork=False, provider="github", owner="octocat", created_at="",
+        updated_at="", size_kb=10, default_branch="main", topics=[], has_readme=True)
+
+
+def test_cancel_stops_repo_loop():
+    """Setting the event stops analysis at the next repository without per-repo warnings."""
+    print("🧪 Testing profile build cancellation")
+
+    builder = GitHubProfileBuilder()
+    cancel = threading.Event()
+    seen = []
+    warnings = []
+    builder.logger.warning = warnings.append
+
+    def progress_callback(message, progress):
+        seen.append(message)
+        cancel.set()
+
+    repos = [_repo("first"), _repo("second"), _repo("third")]
+    try:
+        asyncio.run(builder._analyze_repositories(repos, progress_callback, cancel))
+    except asyncio.CancelledError:
+        pass
+    else:
+        raise AssertionError("cancelled build kept going")
+
+    assert seen == ["Analyzing first..."]
+    assert not warnings
+
+    print("✅ Stopped after the first repository")
+
+
+def test_cancel_before_discovery_results():
+    """A build cancelled during discovery raises instead of reporting no repositories."""
+    print("🧪 Testing cancellation during discovery")
+
+    builder = GitHubProfileBuilder()
+    cancel = threading.Event()
+    cancel.set()
+
+    async def discover(username, token, cancel_event=None):
+        assert cancel_event is cancel
+        return []
+
+    builder._discover_repositories = discover
+    try:
+        asyncio.run(builder.build_profile("octocat", None, None, cancel))
+    except asyncio.CancelledError:
+        pass
+    else:
+        raise AssertionError("cancelled build kept going")
+
+    print("✅ Cancelled after discovery")
+
+
+if __name__ == "__main__":
+    test_cancel_stops_repo_loop()
+    test_cancel_before_discovery_results()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test the table-driven style evaluators in the OpenRouter service.
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from openrouter_service import OpenRouterAIService, _bio_text_analysis
+
+
+BIOS = {
+    "professional": "Experienced Software Engineer with 5+ years developing scalable applications. Led team of 4 developers, delivered 15+ projects with 99.9% uptime. Expert in Python, JavaScript, and cloud technologies.",
+    "creative": "I'm a code artist who loves crafting digital experiences! 🎨 My journey includes building apps that spark joy and solve real problems. When I'm not coding, I'm exploring new tech and sharing knowledge with the community.",
+    "technical": "Senior Software Engineer specializing in distributed systems architecture. Optimized database performance by 300%, implemented microservices handling 1M+ requests/day. Expert in system design, scalability, and performance optimization.",
+    "executive": "Engineering executive who leads organizations of 120 engineers. Drove strategic vision and transformation, grew revenue 40% and built high-performing teams across three regions.",
+    "startup": "Innovative founding engineer who built and shipped a full-stack product from 0 to 50k users. Passionate about rapid iteration, agile teams and scaling growth.",
+}
+
+# (style, bio) -> (overall score, category scores, compliance, feedback) as
+# returned by the per-style _evaluate_*_style methods the registry replaced,
+# except that digits in the bio now count as numbers
+EXPECTED = {
+    ('professional', 'professional'): (
+        28.875,
+        {'authority': 30, 'clarity': 43.5, 'relevance': 20, 'engagement': 0, 'optimization': 50},
+        'Needs improvement',
+        ['Add more quantifiable achievements and strong action verbs', 'Improve sentence structure and overall clarity', 'Include more personality and passion indicators']),
+    ('creative', 'creative'): (
+        32.0,
+        {'creativity': 45, 'storytelling': 25, 'authenticity': 25, 'visual_appeal': 0, 'professional_balance': 50},
+        'Needs more creativity',
+        ['Add more creative language and unique expressions', 'Improve narrative flow and personal story elements', 'Include more personal passion and authentic voice']),
+    ('technical', 'technical'): (
+        65.5,
+        {'technical_expertise': 100, 'problem_solving': 30, 'quantified_results': 70, 'precision': 40, 'industry_standards': 0},
+        'Needs more technical depth',
+        ['Emphasize problem-solving achievements and solutions']),
+    ('executive', 'executive'): (
+        29.5,
+        {'strategic_vision': 40, 'leadership': 0, 'business_impact': 70, 'communication': 0},
+        'Needs executive presence',
+        ['Emphasize strategic thinking and visionary leadership', 'Include more evidence of team leadership and mentorship']),
+    ('unknown', 'professional'): (
+        28.875,
+        {'authority': 30, 'clarity': 43.5, 'relevance': 20, 'engagement': 0, 'optimization': 50},
+        'Needs improvement',
+        ['Add more quantifiable achievements and strong action verbs', 'Improve sentence structure and overall clarity', 'Include more personality and passion indicators']),
+}
+
+
+def test_styles_match_previous_scores():
+    """Every style scores, labels and comments exactly as before the table refactor."""
+    print("🧪 Testing style scores against the previous evaluators")
+
+    service = OpenRouterAIService()
+    for (style, bio), (score, categories, compliance, feedback) in EXPECTED.items():
+        evaluation = service.evaluate_bio_by_style(BIOS[bio], style)
+        assert abs(evaluation['overall_score'] - score) < 1e-9, (style, evaluation['overall_score'])
+        assert evaluation['category_scores'] == categories, (style, evaluation['category_scores'])
+        assert evaluation['style_compliance'] == compliance, (style, evaluation['style_compliance'])
+        assert evaluation['feedback'] == feedback, (style, evaluation['feedback'])
+
+    print("✅ Scores unchanged for professional, creative, technical, executive and unknown styles")
+
+
+def test_numbers_counted():
+    """Each run of digits in a bio counts once toward number_count."""
+    print("🧪 Testing number counting")
+
+    assert _bio_text_analysis("Led 4 engineers, shipped 15+ releases at 99.9% uptime.")['number_count'] == 4
+    assert _bio_text_analysis("No figures here, just a \\d in a path.")['number_count'] == 0
+
+    print("✅ Digits counted, backslash-d text ignored")
+
+
+def test_startup_style():
+    """The startup style returns scores instead of raising."""
+    print("🧪 Testing startup style evaluation")
+
+    evaluation = OpenRouterAIService().evaluate_bio_by_style(BIOS['startup'], 'startup')
+
+    assert set(evaluation['category_scores']) == {'innovation', 'growth_focus', 'versatility', 'energy'}
+    assert all(0 <= score <= 100 for score in evaluation['category_scores'].values())
+    assert 0 < evaluation['overall_score'] <= 100
+    assert evaluation['style_compliance']
+
+    print("✅ Startup bios are scored")
+
+
+def test_batch_matches_single():
+    """evaluate_bios_batch gives the same result as one call per bio."""
+    print("🧪 Testing batch style evaluation")
+
+    service = OpenRouterAIService()
+    bios = list(BIOS.values())
+    for style in ('professional', 'technical', 'startup'):
+        assert service.evaluate_bios_batch(bios, style) == [
+            service.evaluate_bio_by_style(bio, style) for bio in bios]
+
+    print("✅ Batch and single evaluations agree")
+
+
+if __name__ == "__main__":
+    test_styles_match_previous_scores()
+    test_numbers_counted()
+    test_startup_style()
+    test_batch_matches_single()